@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Union, Dict, List
+from array import array
+from typing import Union, Dict, List, Tuple
 
 from .jvm import *
 
+try:
+    import numpy as _numpy
+except ImportError:
+    # NumPy가 없으면, 배열 API는 Python 표준 array를 사용합니다.
+    _numpy = None
+
 # 'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
 HanFirstList = [chr(x) for x in range(0x1100, 0x1112 + 1)]  #: 초성 조합형 문자열 리스트 (UNICODE 순서)
 
@@ -62,6 +69,63 @@ ChoToJong = {
     'ㅎ': '\u11C2'  # ㅎ
 }  #: 초성 문자를 종성 조합형 문자로 변경
 
+# 한글 완성형 문자는 (초성 * 21 + 중성) * 28 + 종성 순서로 배열되어 있습니다.
+_HANGUL_START = 0xAC00  # 가
+_HANGUL_END = 0xD7A3  # 힣
+_JUNGSUNG_RANGE = 0x024C  # 중성 21개 * 종성 28개
+_JONGSUNG_RANGE = 0x001C  # 종성 28개 (받침 없음 포함)
+_CHOSUNG_START, _CHOSUNG_END = 0x1100, 0x1112
+_JUNGSUNG_START, _JUNGSUNG_END = 0x1161, 0x1175
+_JONGSUNG_START, _JONGSUNG_END = 0x11A8, 0x11C2
+
+# 한글 자모, 호환용 자모, 자모 확장-A, 자모 확장-B 영역
+_INCOMPLETE_HANGUL_RANGES = [(0x1100, 0x11FF), (0x3130, 0x318F), (0xA960, 0xA97F), (0xD7B0, 0xD7FF)]
+
+
+def _is_complete_hangul(ch: str) -> bool:
+    return _HANGUL_START <= ord(ch) <= _HANGUL_END
+
+
+def _is_incomplete_hangul(ch: str) -> bool:
+    code = ord(ch)
+    return any(start <= code <= end for start, end in _INCOMPLETE_HANGUL_RANGES)
+
+
+def _is_chosung_jamo(ch: str) -> bool:
+    return _CHOSUNG_START <= ord(ch) <= _CHOSUNG_END
+
+
+def _is_jungsung_jamo(ch: str) -> bool:
+    return _JUNGSUNG_START <= ord(ch) <= _JUNGSUNG_END
+
+
+def _is_jongsung_jamo(ch: str) -> bool:
+    return _JONGSUNG_START <= ord(ch) <= _JONGSUNG_END
+
+
+def _chosung_of(ch: str) -> Union[None, str]:
+    if _is_complete_hangul(ch):
+        return HanFirstList[(ord(ch) - _HANGUL_START) // _JUNGSUNG_RANGE]
+    return ch if _is_chosung_jamo(ch) else None
+
+
+def _jungsung_of(ch: str) -> Union[None, str]:
+    if _is_complete_hangul(ch):
+        return HanSecondList[((ord(ch) - _HANGUL_START) % _JUNGSUNG_RANGE) // _JONGSUNG_RANGE]
+    return ch if _is_jungsung_jamo(ch) else None
+
+
+def _jongsung_of(ch: str) -> Union[None, str]:
+    if _is_complete_hangul(ch):
+        return HanLastList[(ord(ch) - _HANGUL_START) % _JONGSUNG_RANGE]
+    return ch if _is_jongsung_jamo(ch) else None
+
+
+def _assemble(cho: str, jung: str, jong: Union[None, str] = None) -> str:
+    jong_index = ord(jong) - _JONGSUNG_START + 1 if jong is not None else 0
+    return chr(_HANGUL_START + (ord(cho) - _CHOSUNG_START) * _JUNGSUNG_RANGE +
+               (ord(jung) - _JUNGSUNG_START) * _JONGSUNG_RANGE + jong_index)
+
 
 def alphaToHangul(text: str) -> str:
     """
@@ -73,7 +137,7 @@ def alphaToHangul(text: str) -> str:
     """
 
     try:
-        return str(koala_class_of('ExtUtil').alphaToHangul(string(text)))
+        return str(koala_class_of('ExtUtil').alphaToHangul(text))
     except JavaError as e:
         error_handler(e)
 
@@ -88,7 +152,7 @@ def hangulToAlpha(text: str) -> str:
     """
 
     try:
-        return str(koala_class_of('ExtUtil').hangulToAlpha(string(text)))
+        return str(koala_class_of('ExtUtil').hangulToAlpha(text))
     except JavaError as e:
         error_handler(e)
 
@@ -103,7 +167,7 @@ def isAlphaPronounced(text: str) -> bool:
     """
 
     try:
-        return koala_class_of('ExtUtil').isAlphaPronounced(string(text))
+        return koala_class_of('ExtUtil').isAlphaPronounced(text)
     except JavaError as e:
         error_handler(e)
 
@@ -157,7 +221,7 @@ def hanjaToHangul(text: str, headCorrection: bool = True) -> str:
     """
 
     try:
-        return str(koala_class_of('ExtUtil').hanjaToHangul(string(text), headCorrection))
+        return str(koala_class_of('ExtUtil').hanjaToHangul(text, headCorrection))
     except JavaError as e:
         error_handler(e)
 
@@ -171,10 +235,7 @@ def isCompleteHangul(text: str) -> List[bool]:
     :return: 문자열 문자의 위치마다 확인여부를 표기한 리스트. 맞다면 True.
     """
 
-    try:
-        return [koala_class_of('ExtUtil').isCompleteHangul(ch) for ch in text]
-    except JavaError as e:
-        error_handler(e)
+    return [_is_complete_hangul(ch) for ch in text]
 
 
 def isIncompleteHangul(text: str) -> List[bool]:
@@ -186,10 +247,7 @@ def isIncompleteHangul(text: str) -> List[bool]:
     :return: 문자열 문자의 위치마다 확인여부를 표기한 리스트. 맞다면 True.
     """
 
-    try:
-        return [koala_class_of('ExtUtil').isIncompleteHangul(ch) for ch in text]
-    except JavaError as e:
-        error_handler(e)
+    return [_is_incomplete_hangul(ch) for ch in text]
 
 
 def isHangul(text: str) -> List[bool]:
@@ -201,10 +259,7 @@ def isHangul(text: str) -> List[bool]:
     :return: 문자열 문자의 위치마다 확인여부를 표기한 리스트. 맞다면 True.
     """
 
-    try:
-        return [koala_class_of('ExtUtil').isHangul(ch) for ch in text]
-    except JavaError as e:
-        error_handler(e)
+    return [_is_complete_hangul(ch) or _is_incomplete_hangul(ch) for ch in text]
 
 
 def isHangulEnding(text: str) -> bool:
@@ -216,11 +271,8 @@ def isHangulEnding(text: str) -> bool:
     :return: 맞다면 True.
     """
 
-    try:
-        # Workaround... Py4J calls Character version first.
-        return koala_class_of('ExtUtil').isHangulEnding(string(text[-1]))
-    except JavaError as e:
-        error_handler(e)
+    last = text[-1]
+    return _is_complete_hangul(last) or _is_incomplete_hangul(last)
 
 
 def isChosungJamo(text: str) -> List[bool]:
@@ -232,10 +284,7 @@ def isChosungJamo(text: str) -> List[bool]:
     :return: 문자열 문자의 위치마다 확인여부를 표기한 리스트. 맞다면 True.
     """
 
-    try:
-        return [koala_class_of('ExtUtil').isChosungJamo(ch) for ch in text]
-    except JavaError as e:
-        error_handler(e)
+    return [_is_chosung_jamo(ch) for ch in text]
 
 
 def isJungsungJamo(text: str) -> List[bool]:
@@ -247,10 +296,7 @@ def isJungsungJamo(text: str) -> List[bool]:
     :return: 문자열 문자의 위치마다 확인여부를 표기한 리스트. 맞다면 True.
     """
 
-    try:
-        return [koala_class_of('ExtUtil').isJungsungJamo(ch) for ch in text]
-    except JavaError as e:
-        error_handler(e)
+    return [_is_jungsung_jamo(ch) for ch in text]
 
 
 def isJongsungJamo(text: str) -> List[bool]:
@@ -262,10 +308,7 @@ def isJongsungJamo(text: str) -> List[bool]:
     :return: 문자열 문자의 위치마다 확인여부를 표기한 리스트. 맞다면 True.
     """
 
-    try:
-        return [koala_class_of('ExtUtil').isJongsungJamo(ch) for ch in text]
-    except JavaError as e:
-        error_handler(e)
+    return [_is_jongsung_jamo(ch) for ch in text]
 
 
 def isJongsungEnding(text: str) -> bool:
@@ -277,11 +320,9 @@ def isJongsungEnding(text: str) -> bool:
     :return: 맞다면 True.
     """
 
-    try:
-        # Workaround... Py4J calls Character version first.
-        return koala_class_of('ExtUtil').isJongsungEnding(string(text[-1]))
-    except JavaError as e:
-        error_handler(e)
+    last = text[-1]
+    return _is_jongsung_jamo(last) or \
+        (_is_complete_hangul(last) and (ord(last) - _HANGUL_START) % _JONGSUNG_RANGE != 0)
 
 
 def getChosung(text: str) -> List[Union[None, str]]:
@@ -292,19 +333,8 @@ def getChosung(text: str) -> List[Union[None, str]]:
     :rtype: List[Union[None,str]]
     :return: 분리된 각 초성이 들어간 리스트.
     """
-    # PyJnius does not correctly handle 'Char'-type return values, so we have to handle it in here.
 
-    result = []
-
-    for ch, isCH, isIC in zip(text, isCompleteHangul(text), isChosungJamo(text)):
-        if isCH:
-            result.append(chr((ord(ch) - 0xAC00) // 0x024C + 0x1100))
-        elif isIC:
-            result.append(ch)
-        else:
-            result.append(None)
-    
-    return result
+    return [_chosung_of(ch) for ch in text]
 
 
 def getJungsung(text: str) -> List[Union[None, str]]:
@@ -315,19 +345,8 @@ def getJungsung(text: str) -> List[Union[None, str]]:
     :rtype: List[Union[None,str]]
     :return: 분리된 각 중성이 들어간 리스트.
     """
-    # PyJnius does not correctly handle 'Char'-type return values, so we have to handle it in here.
-
-    result = []
-
-    for ch, isCH, isIC in zip(text, isCompleteHangul(text), isJungsungJamo(text)):
-        if isCH:
-            result.append(chr(((ord(ch) - 0xAC00) % 0x024C) // 0x001C + 0x1161))
-        elif isIC:
-            result.append(ch)
-        else:
-            result.append(None)
 
-    return result
+    return [_jungsung_of(ch) for ch in text]
 
 
 def getJongsung(text: str) -> List[Union[None, str]]:
@@ -338,19 +357,8 @@ def getJongsung(text: str) -> List[Union[None, str]]:
     :rtype: List[Union[None,str]]
     :return: 분리된 각 종성이 들어간 리스트.
     """
-    # PyJnius does not correctly handle 'Char'-type return values, so we have to handle it in here.
 
-    result = []
-
-    for ch, isIC in zip(text, isJongsungJamo(text)):
-        if isIC:
-            result.append(ch)
-        elif isJongsungEnding(ch):
-            result.append(chr((ord(ch) - 0xAC00) % 0x001C + 0x11A7))
-        else:
-            result.append(None)
-
-    return result
+    return [_jongsung_of(ch) for ch in text]
 
 
 def dissembleHangul(text: str) -> str:
@@ -362,22 +370,125 @@ def dissembleHangul(text: str) -> str:
     :return: 분해된 문자열
     """
 
-    # Workaround... Py4J calls Triplet version first.
-    result = ''
+    result = []
     for ch in text:
-        try:
-            char_dissemble = py_triple(koala_class_of('ExtUtil').dissembleHangul(ch))
+        if _is_complete_hangul(ch):
+            result.append(_chosung_of(ch))
+            result.append(_jungsung_of(ch))
+
+            jong = _jongsung_of(ch)
+            if jong is not None:
+                result.append(jong)
+        else:
+            result.append(ch)
+
+    return ''.join(result)
 
-            if char_dissemble is None:
-                result += ch
-            else:
-                for c in char_dissemble:
-                    if c is not None:
-                        result += c
-        except JavaError as e:
-            error_handler(e)
 
-    return result
+def _codepoint_array(texts: List[str]):
+    # 문자열들을 이어붙인 code point 배열과, 각 문자열의 시작 위치 배열(offsets)을 만듭니다.
+    lengths = [len(text) for text in texts]
+    offsets = [0]
+    for length in lengths:
+        offsets.append(offsets[-1] + length)
+
+    joined = ''.join(texts)
+    if _numpy is not None:
+        codes = _numpy.frombuffer(joined.encode('utf-32-le'), dtype='<u4')
+        return codes, _numpy.array(offsets, dtype=_numpy.int64)
+    else:
+        return array('I', map(ord, joined)), array('q', offsets)
+
+
+def dissembleHangulArray(texts: List[str]) -> Tuple:
+    """
+    여러 문자열을 한꺼번에 초성, 중성, 종성 자음문자로 분리합니다. :py:func:`dissembleHangul` 의 배열 버전입니다.
+
+    결과는 모든 문자열의 분해 결과를 이어붙인 code point 배열과, 각 문자열의 결과가 시작하는 위치를 담은 배열(길이 = 문자열 수 + 1)입니다.
+    i번째 문자열의 결과는 ``codes[offsets[i]:offsets[i + 1]]`` 입니다.
+    NumPy가 설치되어 있으면 numpy.ndarray를, 없으면 Python 표준 array.array를 돌려줍니다.
+
+    :param List[str] texts: 분해할 문자열들
+    :rtype: Tuple[Union[numpy.ndarray,array.array],Union[numpy.ndarray,array.array]]
+    :return: (분해된 code point 배열, 위치 배열)
+    """
+    if _numpy is None:
+        dissembled = [dissembleHangul(text) for text in texts]
+        return _codepoint_array(dissembled)
+
+    codes, offsets = _codepoint_array(texts)
+    relative = codes.astype(_numpy.int64) - _HANGUL_START
+    complete = (relative >= 0) & (codes <= _HANGUL_END)
+    jong = _numpy.where(complete, relative % _JONGSUNG_RANGE, 0)
+
+    # 문자 하나가 차지하는 길이: 완성형은 초성+중성(+종성), 나머지는 그대로 1.
+    widths = _numpy.where(complete, 2 + (jong > 0), 1)
+    ends = _numpy.cumsum(widths)
+    starts = ends - widths
+
+    result = _numpy.empty(int(ends[-1]) if len(ends) > 0 else 0, dtype='<u4')
+    result[starts] = _numpy.where(complete, relative // _JUNGSUNG_RANGE + _CHOSUNG_START, codes)
+    result[starts[complete] + 1] = (relative[complete] % _JUNGSUNG_RANGE) // _JONGSUNG_RANGE + _JUNGSUNG_START
+    has_jong = jong > 0
+    result[starts[has_jong] + 2] = jong[has_jong] + _JONGSUNG_START - 1
+
+    new_offsets = _numpy.concatenate([[0], ends])[offsets]
+    return result, new_offsets
+
+
+def getChosungArray(texts: List[str]) -> Tuple:
+    """
+    여러 문자열의 각 문자에서 초성 자음문자를 한꺼번에 분리합니다. :py:func:`getChosung` 의 배열 버전입니다.
+
+    결과는 입력 문자마다 초성의 code point를 담은 배열(초성이 없으면 0)과, 각 문자열이 시작하는 위치를 담은 배열(길이 = 문자열 수 + 1)입니다.
+    NumPy가 설치되어 있으면 numpy.ndarray를, 없으면 Python 표준 array.array를 돌려줍니다.
+
+    :param List[str] texts: 분리할 문자열들
+    :rtype: Tuple[Union[numpy.ndarray,array.array],Union[numpy.ndarray,array.array]]
+    :return: (초성 code point 배열, 위치 배열)
+    """
+    codes, offsets = _codepoint_array(texts)
+
+    if _numpy is None:
+        chosung = array('I', (ord(ch) if ch is not None else 0 for text in texts for ch in getChosung(text)))
+        return chosung, offsets
+
+    relative = codes.astype(_numpy.int64) - _HANGUL_START
+    complete = (relative >= 0) & (codes <= _HANGUL_END)
+    jamo = (codes >= _CHOSUNG_START) & (codes <= _CHOSUNG_END)
+    chosung = _numpy.where(complete, relative // _JUNGSUNG_RANGE + _CHOSUNG_START, _numpy.where(jamo, codes, 0))
+    return chosung.astype('<u4'), offsets
+
+
+def getChosungKeys(texts: List[str], keepOthers: bool = False) -> List[str]:
+    """
+    여러 문자열에서 초성만 모은 검색용 문자열을 한꺼번에 만듭니다.
+
+    예) getChosungKeys(["한국어 분석"]) == ["\u1112\u1100\u110B\u1107\u1109"]
+
+    :param List[str] texts: 초성을 모을 문자열들
+    :param bool keepOthers: 초성이 없는 문자(한글이 아닌 문자 등)를 그대로 남길지의 여부. (기본값 False: 제외)
+    :rtype: List[str]
+    :return: 문자열마다 초성을 이어붙인 문자열
+    """
+    chosung, offsets = getChosungArray(texts)
+
+    if _numpy is None:
+        joined = ''.join(texts)
+        keys = []
+        for begin, end in zip(offsets, offsets[1:]):
+            keys.append(''.join(chr(chosung[i]) if chosung[i] != 0 else joined[i]
+                                for i in range(begin, end) if keepOthers or chosung[i] != 0))
+        return keys
+
+    codes, _ = _codepoint_array(texts)
+    keep = _numpy.ones(len(codes), dtype=bool) if keepOthers else chosung != 0
+    merged = _numpy.where(chosung != 0, chosung, codes).astype('<u4')
+
+    # 남길 문자만 골라낸 다음, 문자열별로 잘라냅니다.
+    kept_offsets = _numpy.concatenate([[0], _numpy.cumsum(keep)])[offsets]
+    joined = merged[keep].tobytes().decode('utf-32-le')
+    return [joined[begin:end] for begin, end in zip(kept_offsets[:-1], kept_offsets[1:])]
 
 
 def assembleHangulTriple(cho: Union[str, None] = None, jung: Union[str, None] = None,
@@ -391,18 +502,15 @@ def assembleHangulTriple(cho: Union[str, None] = None, jung: Union[str, None] =
     :rtype: str
     :return: 초성, 중성, 종성을 조합하여 문자를 만듭니다.
     """
+
     assert cho is None or isChosungJamo(cho)[0], "한글 자모 문자 이외의 문자를 사용하면 안됩니다."
     assert jung is None or isJungsungJamo(jung)[0], "한글 자모 문자 이외의 문자를 사용하면 안됩니다."
     assert jong is None or isJongsungJamo(jong)[0], "한글 자모 문자 이외의 문자를 사용하면 안됩니다."
 
     cho = cho if cho is not None else HanFirstList[11]
     jung = jung if jung is not None else HanSecondList[18]
-    jong = jong if jong is not None else ''
 
-    try:
-        return str(koala_class_of('ExtUtil').assembleHangulString(string(cho + jung + jong)))
-    except JavaError as e:
-        error_handler(e)
+    return _assemble(cho, jung, jong)
 
 
 def assembleHangul(text: str) -> str:
@@ -414,11 +522,32 @@ def assembleHangul(text: str) -> str:
     :return: 조합형 문자들이 조합된 문자열. 조합이 불가능한 문자는 그대로 남습니다.
     """
 
-    try:
-        # This is an bypass...
-        return str(koala_class_of('ExtUtil').assembleHangulString(string(text)))
-    except JavaError as e:
-        error_handler(e)
+    result = []
+    cho = None
+    jung = None
+
+    def flush():
+        if cho is not None and jung is not None:
+            result.append(_assemble(cho, jung))
+        elif cho is not None:
+            result.append(cho)
+
+    for ch in text:
+        if _is_chosung_jamo(ch):
+            flush()
+            cho, jung = ch, None
+        elif _is_jungsung_jamo(ch) and cho is not None and jung is None:
+            jung = ch
+        elif _is_jongsung_jamo(ch) and cho is not None and jung is not None:
+            result.append(_assemble(cho, jung, ch))
+            cho, jung = None, None
+        else:
+            flush()
+            result.append(ch)
+            cho, jung = None, None
+
+    flush()
+    return ''.join(result)
 
 
 def correctVerbApply(verb: str, isVerb: bool, rest: str) -> str:
@@ -433,7 +562,7 @@ def correctVerbApply(verb: str, isVerb: bool, rest: str) -> str:
     """
 
     try:
-        return str(koala_class_of('ExtUtil').correctVerbApply(string(verb), isVerb, string(rest)))
+        return str(koala_class_of('ExtUtil').correctVerbApply(verb, isVerb, rest))
     except JavaError as e:
         error_handler(e)
 
@@ -463,6 +592,9 @@ __all__ = [
     'getJungsung',
     'getJongsung',
     'dissembleHangul',
+    'dissembleHangulArray',
+    'getChosungArray',
+    'getChosungKeys',
     'assembleHangul',
     'correctVerbApply'
 ]
@@ -1,25 +1,38 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
 from typing import List
 
 from . import API
-from .jvm import koala_class_of, string, java_list, is_jvm_running, start_jvm, check_jvm, shutdown_jvm
+from .jvm import koala_class_of, java_list, is_jvm_running, start_jvm, check_jvm, shutdown_jvm
 from .types import *
 
 from koalanlp.jip.repository import RepositoryManager
 from koalanlp.jip.index import IndexManager
 from koalanlp.jip.cache import CacheManager
 from koalanlp.jip.maven import Artifact, Pom
-from koalanlp.jip.util import wait_until_download_finished
+from koalanlp.jip.util import configure_downloads, wait_until_download_finished
 
 # Fix for JAVA 9 encapsulation
 _JAVA9_FIX = '--add-opens java.base/java.lang=ALL-UNNAMED'
 
+# Py4J library version used by the JVM side
+_PY4J_VERSION = '0.10.8.1'
+
+# Number of artifacts whose POMs are fetched at the same time
+_RESOLVE_WORKERS = 8
+
+# Resolved classpath lockfile (under .java/)
+_LOCK_FILE = 'classpath.lock'
+_LOCK_VERSION = 1
+
 # Logging setup
 logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
 logging.getLogger("requests").setLevel(logging.WARNING)
@@ -55,14 +68,23 @@ def _find_pom(artifact):
         pom = cache_manager.get_artifact_pom(artifact)
         return pom, cache_manager.as_repos()
     else:
-        for repos in repos_manager.repos:
-            pom = repos.download_pom(artifact)
-            # find the artifact
-            if pom is not None:
-                cache_manager.put_artifact_pom(artifact, pom)
-                return pom, repos
+        # 모든 저장소에 동시에 물어보고, 가장 먼저 찾은 저장소를 사용합니다.
+        found = repos_manager.find_pom(artifact)
+        if found is not None:
+            cache_manager.put_artifact_pom(artifact, found[0])
+        return found
+
+
+def _fetch_dependencies(artifact):
+    # artifact의 POM을 찾아, (POM, 저장소, POM 객체, 의존성 목록)을 돌려줍니다. 찾지 못하면 None.
+    pominfo = _find_pom(artifact)
+    if pominfo is None:
         return None
 
+    pom, repos = pominfo
+    pom_obj = Pom(pom, repos_manager, cache_manager)
+    return pom, repos, pom_obj, pom_obj.get_dependencies()
+
 
 # JIP 코드 참조하여 변경함.
 def _resolve_artifacts_modified(artifacts, exclusions=None):
@@ -74,64 +96,120 @@ def _resolve_artifacts_modified(artifacts, exclusions=None):
     # download queue
     download_list = []
 
-    # dependency_set contains artifact objects to resolve
-    dependency_stack = set()
+    # 의존성 그래프를 한 단계씩 넓이 우선으로 해석하며, 같은 단계의 POM들은 동시에 가져옵니다.
+    level = list(artifacts)
 
-    for a in artifacts:
-        dependency_stack.add(a)
+    with ThreadPoolExecutor(max_workers=_RESOLVE_WORKERS) as executor:
+        while len(level) > 0:
+            candidates = {}
+            for artifact in level:
+                if index_manager.is_same_installed(artifact) and artifact not in download_list:
+                    continue
 
-    while len(dependency_stack) > 0:
-        artifact = dependency_stack.pop()
+                if any(map(artifact.is_same_artifact, exclusions)):
+                    continue
 
-        if index_manager.is_same_installed(artifact) and artifact not in download_list:
-            continue
+                candidates.setdefault((artifact.group, artifact.artifact), artifact)
 
-        if any(map(artifact.is_same_artifact, exclusions)):
-            continue
+            candidates = list(candidates.values())
+            next_level = []
+            for artifact, fetched in zip(candidates, executor.map(_fetch_dependencies, candidates)):
+                if fetched is None:
+                    logger.warning("[Warning] Artifact is not found: %s", artifact)
+                    # Ignore this unknown pom.
+                    continue
 
-        pominfo = _find_pom(artifact)
-        if pominfo is None:
-            if not any(artifact.is_same_artifact(a) for a in exclusions):
-                logger.warning("[Warning] Artifact is not found: %s", artifact)
-            # Ignore this unknown pom.
-            continue
+                if not index_manager.is_installed(artifact):
+                    pom, repos, pom_obj, more_dependencies = fetched
 
-        if not index_manager.is_installed(artifact):
-            pom, repos = pominfo
+                    # repos.download_jar(artifact, get_lib_path())
+                    artifact.repos = repos
 
-            # repos.download_jar(artifact, get_lib_path())
-            artifact.repos = repos
+                    download_list.append(artifact)
+                    index_manager.add_artifact(artifact)
 
-            if not any(map(artifact.is_same_artifact, exclusions)):
-                download_list.append(artifact)
-                index_manager.add_artifact(artifact)
+                    for r in pom_obj.get_repositories():
+                        repos_manager.add_repos(*r)
 
-            pom_obj = Pom(pom, repos_manager, cache_manager)
-            for r in pom_obj.get_repositories():
-                repos_manager.add_repos(*r)
+                    for d in more_dependencies:
+                        d.exclusions.extend(artifact.exclusions)
+                        if not index_manager.is_same_installed(d):
+                            next_level.append(d)
 
-            more_dependencies = pom_obj.get_dependencies()
-            for d in more_dependencies:
-                d.exclusions.extend(artifact.exclusions)
-                if not index_manager.is_same_installed(d):
-                    dependency_stack.add(d)
+            level = next_level
 
+    cache_manager.pom_not_found.save()
     return download_list
 
 
-def initialize(java_options="--add-opens java.base/java.lang=ALL-UNNAMED -Xmx1g -Dfile.encoding=utf-8", lib_path=None,
-               force_download=False, port=None, **packages):
+def _lock_key(packages):
+    # 요청한 패키지와 버전 목록으로 lockfile 항목을 구분합니다.
+    return json.dumps(sorted(packages.items()) + [('py4j', _PY4J_VERSION)])
+
+
+def _read_lock(lib_path, packages):
     """
-    초기화 함수. 필요한 Java library를 다운받습니다.
-    한번 초기화 된 다음에는 :py:func:`koalanlp.Util.finalize` 을 사용해 종료하지 않으면 다시 초기화 할 수 없습니다.
+    이전에 같은 패키지 목록으로 초기화할 때 기록한 classpath를 읽습니다.
+    기록이 없거나, 기록된 JAR 파일 중 없는 것이 있으면 None을 돌려줍니다.
+    """
+    path = Path(lib_path, '.java', _LOCK_FILE)
+    try:
+        with path.open('r', encoding='utf-8') as fp:
+            lock = json.load(fp)
+    except (OSError, ValueError):
+        return None
 
-    :param str java_options: 자바 JVM option (기본값: "--add-opens java.base/java.lang=ALL-UNNAMED -Xmx1g -Dfile.encoding=utf-8")
-    :param Optional[str] lib_path: 자바 라이브러리를 저장할 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
-    :param bool force_download: 자바 라이브러리를 모두 다 다시 다운로드할 지의 여부. (기본값: False)
-    :param int port: Multiprocessing을 사용하는 경우에, Java 분석기와 소통하는 Python proxy를 어떤 port에서 열 것인지 결정합니다. (기본값: None = 25334)
-    :param Dict[str,str] packages: 사용할 분석기 API의 목록. (Keyword arguments; 기본값: KMR="LATEST")
-    :raise Exception: JVM이 2회 이상 초기화 될때 Exception.
+    if type(lock) is not dict or lock.get('version') != _LOCK_VERSION:
+        return None
+
+    classpaths = lock.get('entries', {}).get(_lock_key(packages))
+    if not classpaths:
+        return None
+
+    # 상대경로는 lib_path 기준입니다.
+    classpaths = [str(Path(lib_path, jar)) for jar in classpaths]
+    if not all(os.path.isfile(jar) for jar in classpaths):
+        return None
+
+    return classpaths
+
+
+def _write_lock(lib_path, packages, classpaths):
+    """
+    의존성 해석을 마친 classpath를 기록합니다. 다른 프로세스가 동시에 기록하더라도 깨진 파일을 읽지 않도록, 임시 파일을 옮겨 기록합니다.
     """
+    path = Path(lib_path, '.java', _LOCK_FILE)
+    lock = {'version': _LOCK_VERSION, 'entries': {}}
+    try:
+        with path.open('r', encoding='utf-8') as fp:
+            previous = json.load(fp)
+        if type(previous) is dict and previous.get('version') == _LOCK_VERSION:
+            lock['entries'].update(previous.get('entries', {}))
+    except (OSError, ValueError):
+        pass
+
+    base = Path(lib_path).absolute()
+    relative = []
+    for jar in classpaths:
+        jar = Path(jar).absolute()
+        try:
+            relative.append(str(jar.relative_to(base)))
+        except ValueError:
+            relative.append(str(jar))
+
+    lock['entries'][_lock_key(packages)] = relative
+
+    temp = path.with_name('%s.%d.tmp' % (_LOCK_FILE, os.getpid()))
+    try:
+        with temp.open('w', encoding='utf-8') as fp:
+            json.dump(lock, fp, ensure_ascii=False, indent=1)
+        os.replace(str(temp), str(path))
+    except OSError as e:
+        logger.warning("[Warning] Cannot write the classpath lockfile %s: %s", path, e)
+
+
+def _requested_packages(packages):
+    # 초기화할 분석기 API 패키지 목록을 {API 패키지 이름: 버전} 형태로 정리합니다.
     if len(packages) == 0:
         packages = {
             'KMR': "LATEST"
@@ -147,45 +225,114 @@ def initialize(java_options="--add-opens java.base/java.lang=ALL-UNNAMED -Xmx1g
         }
         logger.info("[Warning] KSS나 KIWI만 사용하고 있어, CORE 모듈만 자바로 초기화합니다.")
 
-    if not lib_path:
-        lib_path = Path.cwd()
+    return {getattr(API, k.upper()): v for k, v in packages.items()}
 
-    if force_download:
-        clear_all_downloaded_jars(lib_path)
+
+def _resolve_classpath(packages):
+    """
+    패키지들과 그 의존성을 모두 해석하고, 설치되지 않은 JAR 파일을 내려받습니다.
+    설치된 모든 artifact의 목록을 돌려줍니다.
+    """
+    deps = [Artifact('kr.bydelta', 'koalanlp-%s' % pack, version,
+                     'assembly' if pack in API._REQUIRE_ASSEMBLY_ else None)
+            for pack, version in packages.items()]
+    # Add py4j jar
+    deps.append(Artifact('net.sf.py4j', 'py4j', _PY4J_VERSION))
+
+    exclusions = [Artifact('com.jsuereth', 'sbt-pgp', '*')]
+
+    down_list = _resolve_artifacts_modified(deps, exclusions=exclusions)
+    down_list.sort(key=lambda a: a.repos.uri)
+
+    for artifact in down_list:
+        local_path = cache_manager.get_jar_path(artifact)
+        if artifact.repos != cache_manager.as_repos():
+            artifact.repos.download_jar(artifact, local_path)
+
+    wait_until_download_finished()
+    return list(index_manager.installed)
+
+
+def _prepare_classpath(lib_path, packages, refresh_lock=False):
+    """
+    JVM을 시작하지 않고, 패키지들의 classpath를 준비합니다.
+    기록된 classpath가 없으면 의존성을 해석하여 필요한 JAR 파일을 내려받고, 그 결과를 '.java/classpath.lock'에 기록합니다.
+    """
+    classpaths = None if refresh_lock else _read_lock(lib_path, packages)
+    if classpaths is not None:
+        logger.info("Using the resolved classpath recorded in %s" % str(Path(lib_path, '.java', _LOCK_FILE)))
+        return classpaths
 
     # Initialize cache & index manager
     global cache_manager, index_manager
     cache_manager = CacheManager(lib_path)
     index_manager = IndexManager(lib_path)
+    repos_manager.set_not_found_cache(cache_manager.pom_not_found)
+
+    # Get all installed JAR files
+    classpaths = [cache_manager.get_jar_path(artifact, filepath=True) for artifact in _resolve_classpath(packages)]
+    _write_lock(lib_path, packages, classpaths)
+    return classpaths
+
+
+def initialize(java_options="--add-opens java.base/java.lang=ALL-UNNAMED -Xmx1g -Dfile.encoding=utf-8", lib_path=None,
+               force_download=False, port=None, pool_size=None, refresh_lock=False, offline=False, bundle=None,
+               download_workers=None, **packages):
+    """
+    초기화 함수. 필요한 Java library를 다운받습니다.
+    한번 초기화 된 다음에는 :py:func:`koalanlp.Util.finalize` 을 사용해 종료하지 않으면 다시 초기화 할 수 없습니다.
+
+    :param str java_options: 자바 JVM option (기본값: "--add-opens java.base/java.lang=ALL-UNNAMED -Xmx1g -Dfile.encoding=utf-8")
+    :param Optional[str] lib_path: 자바 라이브러리를 저장할 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
+    :param bool force_download: 자바 라이브러리를 모두 다 다시 다운로드할 지의 여부. (기본값: False)
+    :param int port: Multiprocessing을 사용하는 경우에, Java 분석기와 소통하는 Python proxy를 어떤 port에서 열 것인지 결정합니다. (기본값: None = 25334)
+    :param int pool_size: 여러 스레드에서 동시에 분석하는 경우에, Java와 동시에 사용할 연결의 수. 연결을 미리 열어두고, 이 수 이상의 스레드는 연결이 반납될 때까지 기다립니다. (기본값: None = 제한 없이 필요할 때마다 연결)
+    :param bool refresh_lock: 의존성을 해석한 결과는 '.java/classpath.lock' 파일에 기록하여, 같은 패키지 목록으로 다시 초기화할 때는 의존성 해석과 다운로드를 건너뜁니다.
+            True이면 기록을 무시하고 의존성을 다시 해석합니다. "LATEST" 버전을 새로 확인하려면 사용하세요. (기본값: False)
+    :param bool offline: True이면 네트워크를 사용하지 않고, 같은 패키지 목록으로 초기화하며 기록한 '.java/classpath.lock'의 classpath만 사용합니다.
+            기록이 없거나 기록된 JAR 파일이 없으면 바로 오류를 냅니다. (기본값: False)
+    :param Optional[str] bundle: `koalanlp-bundle` 명령으로 만든 묶음(디렉터리 또는 .tar.gz 파일)의 경로.
+            지정하면 네트워크를 사용하지 않고 묶음 안의 JAR 파일만 사용하며, 요청한 패키지가 없거나 checksum이 다르면 바로 오류를 냅니다.
+            패키지를 지정하지 않으면 묶음 안의 패키지를 모두 사용합니다. (기본값: None)
+    :param Optional[int] download_workers: 동시에 내려받을 JAR 파일의 수. (기본값: None = 3)
+    :param Dict[str,str] packages: 사용할 분석기 API의 목록. (Keyword arguments; 기본값: KMR="LATEST")
+    :raise Exception: JVM이 2회 이상 초기화 될때 Exception.
+    :raise FileNotFoundError: 오프라인으로 초기화할 때, 필요한 classpath 기록이나 JAR 파일이 없는 경우.
+    :raise ValueError: 묶음에 요청한 패키지가 없거나, 묶음의 JAR 파일이 손상된 경우.
+    :raise DownloadException: JAR 파일을 내려받지 못했거나, 다시 받아도 저장소의 checksum과 다른 경우.
+    """
+    if bundle is None or len(packages) > 0:
+        packages = _requested_packages(packages)
+
+    if not lib_path:
+        lib_path = Path.cwd()
+
+    if force_download:
+        clear_all_downloaded_jars(lib_path)
+
+    if download_workers is not None:
+        configure_downloads(workers=download_workers)
 
     if not is_jvm_running():
         if _JAVA9_FIX not in java_options:
             java_options += ' ' + _JAVA9_FIX
 
         java_options = java_options.split(" ")
-        packages = {getattr(API, k.upper()): v for k, v in packages.items()}
-
-        deps = [Artifact('kr.bydelta', 'koalanlp-%s' % pack, version,
-                         'assembly' if pack in API._REQUIRE_ASSEMBLY_ else None)
-                for pack, version in packages.items()]
-        # Add py4j jar
-        deps.append(Artifact('net.sf.py4j', 'py4j', '0.10.8.1'))
-
-        exclusions = [Artifact('com.jsuereth', 'sbt-pgp', '*')]
-
-        down_list = _resolve_artifacts_modified(deps, exclusions=exclusions)
-        down_list.sort(key=lambda a: a.repos.uri)
 
-        for artifact in down_list:
-            local_path = cache_manager.get_jar_path(artifact)
-            if artifact.repos != cache_manager.as_repos():
-                artifact.repos.download_jar(artifact, local_path)
+        if bundle is not None:
+            from .bundle import load_bundle
+            classpaths = load_bundle(bundle, packages, lib_path)
+            logger.info("Using the bundled artifacts in %s" % str(bundle))
+        elif offline:
+            classpaths = _read_lock(lib_path, packages)
+            if classpaths is None:
+                raise FileNotFoundError("오프라인 모드로 %s 패키지를 초기화할 classpath 기록이 없거나, 기록된 JAR 파일이 없습니다. "
+                                        "네트워크에 연결된 상태에서 한 번 초기화하거나, koalanlp-bundle로 만든 묶음을 "
+                                        "bundle 인자로 지정해주세요." % str(packages))
+        else:
+            classpaths = _prepare_classpath(lib_path, packages, refresh_lock)
 
-        # Get all installed JAR files
-        classpaths = [cache_manager.get_jar_path(artifact, filepath=True)
-                      for artifact in index_manager.installed]
-        wait_until_download_finished()
-        start_jvm(java_options, classpaths, port=port)
+        start_jvm(java_options, classpaths, port=port, pool_size=pool_size)
 
 
         try:
@@ -242,7 +389,7 @@ def contains(string_list: List[str], tag) -> bool:
     """
 
     if type(tag) is PhraseTag or type(tag) is DependencyTag or type(tag) is CoarseEntityType or type(tag) is RoleType:
-        return koala_class_of('Util').contains(java_list([string(s) for s in string_list]), tag.reference)
+        return koala_class_of('Util').contains(java_list(string_list), tag.reference)
     else:
         return False
 
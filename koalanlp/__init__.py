@@ -1,4 +1,4 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from . import API, data, ExtUtil, proc, types, Util
+from . import API, aio, data, ExtUtil, proc, pool, serialize, types, Util
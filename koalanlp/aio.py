@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Union
+
+from .data import Sentence
+from .jvm import gateway_pool_size
+from .proc import SentenceSplitter, Tagger, Parser, EntityRecognizer, RoleLabeler
+
+
+def _running_loop():
+    # Python 3.7 이상에서는 실행 중인 loop를 직접 가져옵니다.
+    if hasattr(asyncio, 'get_running_loop'):
+        return asyncio.get_running_loop()
+    return asyncio.get_event_loop()
+
+
+class _AsyncAnalyzer(object):
+    """
+    분석기를 작업 스레드에서 실행하여, asyncio event loop를 막지 않고 분석 결과를 기다릴 수 있게 합니다.
+
+    :param analyzer: 작업 스레드에서 사용할 분석기 객체
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. 이보다 많은 요청은 앞선 요청이 끝날 때까지 기다립니다.
+            (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    """
+
+    def __init__(self, analyzer, max_concurrency: int = None, executor=None):
+        if max_concurrency is None:
+            max_concurrency = gateway_pool_size() or os.cpu_count() or 1
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency는 1 이상이어야 합니다.')
+
+        self._analyzer = analyzer
+        self.__max_concurrency = max_concurrency
+        self.__own_executor = executor is None
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency) if executor is None else executor
+        self.__semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        :rtype: int
+        :return: 동시에 분석할 수 있는 요청의 수
+        """
+        return self.__max_concurrency
+
+    async def _run(self, func, *args, **kwargs):
+        # 동시에 진행 중인 요청이 max_concurrency개를 넘지 않도록 기다린 다음(backpressure), 작업 스레드에서 분석합니다.
+        # 기다리는 중에 취소되면 분석을 시작하지 않으며, 분석 중에 취소되면 결과를 버립니다.
+        loop = _running_loop()
+        if loop not in self.__semaphores:
+            # Semaphore가 loop를 참조하므로 weak key만으로는 정리되지 않습니다. 닫힌 loop(asyncio.run 등)의 것은 여기서 버립니다.
+            for closed in [other for other in self.__semaphores.keys() if other.is_closed()]:
+                del self.__semaphores[closed]
+            self.__semaphores[loop] = asyncio.Semaphore(self.__max_concurrency)
+
+        async with self.__semaphores[loop]:
+            return await loop.run_in_executor(self.__executor, partial(func, *args, **kwargs))
+
+    def close(self):
+        """
+        분석에 사용하던 작업 스레드를 정리합니다. 직접 넘겨준 executor는 종료하지 않습니다.
+        """
+        if self.__own_executor:
+            self.__executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncSentenceSplitter(_AsyncAnalyzer):
+    """
+    asyncio에서 사용할 문장분리기를 생성합니다. :py:class:`koalanlp.proc.SentenceSplitter` 를 작업 스레드에서 실행합니다.
+
+    :param str api: 문장분리기 API 패키지.
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    """
+
+    def __init__(self, api: str, max_concurrency: int = None, executor=None):
+        super().__init__(SentenceSplitter(api), max_concurrency, executor)
+
+    async def sentences(self, *text) -> List[str]:
+        """
+        문단(들)을 문장으로 분리합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단(들). 각 인자는 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[str]
+        :return: 분리한 문장들. (flattened list)
+        """
+        return await self._run(self._analyzer.sentences, *text)
+
+    async def __call__(self, *args, **kwargs) -> List[str]:
+        """
+        문단을 문장으로 분리합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단(들). 각 인자는 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[str]
+        :return: 분리한 문장들. (flattened list)
+        """
+        return await self.sentences(*args)
+
+
+class AsyncTagger(_AsyncAnalyzer):
+    """
+    asyncio에서 사용할 품사분석기를 초기화합니다. :py:class:`koalanlp.proc.Tagger` 를 작업 스레드에서 실행합니다.
+    여러 요청을 동시에 기다리면, 작업 스레드마다 Java 분석기 객체를 따로 사용하여 JVM 안에서 동시에 분석합니다.
+
+    :param str api: 사용할 품사분석기의 유형.
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    :param kwargs: :py:class:`koalanlp.proc.Tagger` 를 생성할 때 넘겨줄 keyword 인자. (예: etri_key, kmr_light)
+    """
+
+    def __init__(self, api: str, max_concurrency: int = None, executor=None, **kwargs):
+        super().__init__(Tagger(api, **kwargs), max_concurrency, executor)
+
+    async def tag(self, *text: str) -> List[Sentence]:
+        """
+        문단(들)을 품사분석합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단들. 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과. (flattened list)
+        """
+        return await self._run(self._analyzer.tag, *text)
+
+    async def tagSentence(self, *text: str) -> List[Sentence]:
+        """
+        문장을 품사분석합니다. (인자 하나를 문장 하나로 간주합니다)
+
+        :param Union[str] text: 분석할 문장들. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과.
+        """
+        return await self._run(self._analyzer.tagSentence, *text)
+
+    async def tagBatch(self, texts: List[str], grouped: bool = False) -> Union[List[Sentence], List[List[Sentence]]]:
+        """
+        여러 문단을 한꺼번에 품사분석합니다.
+
+        :param List[str] texts: 분석할 문단들의 목록.
+        :param bool grouped: True이면 문단별로 묶은 결과를, False이면 tag()와 같이 이어붙인 결과를 돌려줍니다. (기본값 False)
+        :rtype: Union[List[Sentence],List[List[Sentence]]]
+        :return: 분석된 결과. grouped=False이면 flattened list, grouped=True이면 문단별 문장 list의 list.
+        """
+        return await self._run(self._analyzer.tagBatch, texts, grouped=grouped)
+
+    async def __call__(self, *args, **kwargs) -> List[Sentence]:
+        """
+        문단(들)을 품사분석합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단들. 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과. (flattened list)
+        """
+        return await self.tag(*args)
+
+
+class _AsyncCanAnalyzeProperty(_AsyncAnalyzer):
+    """
+    asyncio에서 사용할 특성 부착형 분석기를 초기화합니다.
+
+    :param analyzer: 작업 스레드에서 사용할 분석기 객체
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    """
+
+    async def analyze(self, *text) -> List[Sentence]:
+        """
+        문단(들)을 분석합니다.
+
+        :param Union[str,Sentence,List[str],List[Sentence]] text: 분석할 문단(들).
+                각 인자는 텍스트(str), 문장 객체(Sentence), 텍스트의 리스트, 문장 객체의 리스트 혼용 가능 (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과들. (flattened list)
+        """
+        return await self._run(self._analyzer.analyze, *text)
+
+    async def __call__(self, *args, **kwargs) -> List[Sentence]:
+        """
+        문단(들)을 분석합니다.
+
+        :param Union[str,Sentence,List[str],List[Sentence]] text: 분석할 문단(들).
+                각 인자는 텍스트(str), 문장 객체(Sentence), 텍스트의 리스트, 문장 객체의 리스트 혼용 가능 (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과들. (flattened list)
+        """
+        return await self.analyze(*args)
+
+
+class AsyncParser(_AsyncCanAnalyzeProperty):
+    """
+    asyncio에서 사용할 구문구조/의존구조 분석기를 초기화합니다. :py:class:`koalanlp.proc.Parser` 를 작업 스레드에서 실행합니다.
+
+    :param str api: 사용할 분석기의 유형.
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
+    """
+
+    def __init__(self, api: str, max_concurrency: int = None, executor=None, **kwargs):
+        super().__init__(Parser(api, **kwargs), max_concurrency, executor)
+
+
+class AsyncEntityRecognizer(_AsyncCanAnalyzeProperty):
+    """
+    asyncio에서 사용할 개체명 인식기를 초기화합니다. :py:class:`koalanlp.proc.EntityRecognizer` 를 작업 스레드에서 실행합니다.
+
+    :param str api: 사용할 분석기의 유형.
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
+    """
+
+    def __init__(self, api: str, max_concurrency: int = None, executor=None, **kwargs):
+        super().__init__(EntityRecognizer(api, **kwargs), max_concurrency, executor)
+
+
+class AsyncRoleLabeler(_AsyncCanAnalyzeProperty):
+    """
+    asyncio에서 사용할 의미역 분석기를 초기화합니다. :py:class:`koalanlp.proc.RoleLabeler` 를 작업 스레드에서 실행합니다.
+
+    :param str api: 사용할 분석기의 유형.
+    :param int max_concurrency: 동시에 분석할 수 있는 요청의 수. (기본값: None = Util.initialize의 pool_size 또는 CPU 코어 수)
+    :param executor: 분석을 실행할 concurrent.futures.Executor. (기본값: None = max_concurrency개의 스레드를 새로 만듦)
+    :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
+    """
+
+    def __init__(self, api: str, max_concurrency: int = None, executor=None, **kwargs):
+        super().__init__(RoleLabeler(api, **kwargs), max_concurrency, executor)
+
+
+# ----- Declare members exported -----
+
+__all__ = ['AsyncSentenceSplitter', 'AsyncTagger', 'AsyncParser', 'AsyncEntityRecognizer', 'AsyncRoleLabeler']
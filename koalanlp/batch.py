@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+큰 말뭉치 파일을 여러 작업 프로세스에 나누어 분석하고, 결과를 파일로 저장하는 명령행 도구입니다.
+
+    koalanlp-batch corpus.txt tagged.conllu --api eunjeon --processes 8 --format conllu
+
+중간에 종료되더라도, 같은 명령을 다시 실행하면 마지막으로 기록한 checkpoint부터 이어서 분석합니다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import Iterator, List, Tuple
+
+from .data import Sentence
+from .pool import ProcessPoolTagger, ProcessPoolAnalyzer
+from .proc import Parser, EntityRecognizer, RoleLabeler
+
+_ANALYZERS = {'tag': None, 'parse': Parser, 'entity': EntityRecognizer, 'role': RoleLabeler}  #: 작업별 분석기 class
+_CHECKPOINT_SUFFIX = '.checkpoint'  #: 출력 파일 이름 뒤에 붙여 checkpoint 파일 이름을 만듭니다.
+
+
+def _read_documents(path: str, input_format: str, field: str) -> Iterator[Tuple[dict, str]]:
+    # 입력 파일의 한 줄이 문서 하나입니다. 빈 줄도 문서로 세어, checkpoint의 문서 수와 줄 번호가 일치하게 합니다.
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            line = line.rstrip('\r\n')
+            if input_format == 'jsonl':
+                record = json.loads(line) if line.strip() else {}
+                yield record, record.get(field, '')
+            else:
+                yield {}, line
+
+
+def _word_json(word) -> dict:
+    return {'surface': word.surface, 'morphemes': [[morph.surface, morph.tag] for morph in word]}
+
+
+def _sentence_json(sentence: Sentence) -> dict:
+    result = {'text': sentence.surfaceString(), 'words': [_word_json(word) for word in sentence]}
+
+    if len(sentence.dependencies) > 0:
+        result['dependencies'] = [{'governor': edge.src.id if edge.src is not None else -1,
+                                   'dependent': edge.dest.id, 'type': edge.type, 'depType': edge.depType}
+                                  for edge in sentence.dependencies]
+    if len(sentence.roles) > 0:
+        result['roles'] = [{'predicate': edge.src.id, 'argument': edge.dest.id if edge.dest is not None else -1,
+                            'label': edge.label} for edge in sentence.roles]
+    if len(sentence.entities) > 0:
+        result['entities'] = [{'surface': entity.surface, 'label': entity.label, 'fineLabel': entity.fineLabel,
+                               'morphemes': [[morph.word.id, morph.id] for morph in entity]}
+                              for entity in sentence.entities]
+
+    return result
+
+
+def format_jsonl(number: int, record: dict, sentences: List[Sentence]) -> str:
+    """
+    문서 하나의 분석 결과를 JSON 한 줄로 만듭니다. JSONL 입력인 경우, 입력 record의 다른 항목도 함께 기록합니다.
+
+    :param int number: 문서 번호 (0부터 시작)
+    :param dict record: 입력 record
+    :param List[Sentence] sentences: 분석된 문장들
+    :rtype: str
+    :return: 줄바꿈으로 끝나는 JSON 문자열
+    """
+    output = dict(record) if record else {'id': number}
+    output['sentences'] = [_sentence_json(sentence) for sentence in sentences]
+    return json.dumps(output, ensure_ascii=False) + '\n'
+
+
+def format_conllu(number: int, record: dict, sentences: List[Sentence]) -> str:
+    """
+    문서 하나의 분석 결과를 CoNLL-U 형식으로 만듭니다.
+    어절 하나가 한 줄이며, XPOS에는 형태소 품사를 +로 이어붙여 기록하고 MISC에는 형태소 분석 결과를 기록합니다.
+
+    :param int number: 문서 번호 (0부터 시작)
+    :param dict record: 입력 record
+    :param List[Sentence] sentences: 분석된 문장들
+    :rtype: str
+    :return: 빈 줄로 끝나는 CoNLL-U 문자열
+    """
+    lines = ['# newdoc id = %d' % number]
+    for sent_id, sentence in enumerate(sentences):
+        lines.append('# sent_id = %d-%d' % (number, sent_id))
+        lines.append('# text = %s' % sentence.surfaceString())
+
+        for word in sentence:
+            edge = word.getGovernorEdge()
+            if edge is None:
+                head, deprel = '_', '_'
+            else:
+                head = str(edge.src.id + 1) if edge.src is not None else '0'
+                deprel = edge.depType if edge.depType is not None else edge.type
+
+            lines.append('\t'.join([str(word.id + 1), word.surface, '_', '_', '+'.join(m.tag for m in word), '_',
+                                    head, deprel, '_', 'Morphs=%s' % word.singleLineString()]))
+
+        lines.append('')
+
+    return '\n'.join(lines) + '\n'
+
+
+def format_line(number: int, record: dict, sentences: List[Sentence]) -> str:
+    """
+    문서 하나의 분석 결과를 한 줄로 만듭니다. 각 문장의 singleLineString()을 tab으로 이어붙입니다.
+
+    :param int number: 문서 번호 (0부터 시작)
+    :param dict record: 입력 record
+    :param List[Sentence] sentences: 분석된 문장들
+    :rtype: str
+    :return: 줄바꿈으로 끝나는 문자열
+    """
+    return '\t'.join(sentence.singleLineString() for sentence in sentences) + '\n'
+
+
+_FORMATTERS = {'jsonl': format_jsonl, 'conllu': format_conllu, 'line': format_line}  #: 출력 형식별 변환 함수
+
+
+def read_checkpoint(output: str) -> dict:
+    """
+    출력 파일의 checkpoint를 읽습니다.
+
+    :param str output: 출력 파일 경로
+    :rtype: dict
+    :return: 처리한 문서 수(documents), 출력 파일에 기록된 byte 수(offset), 분석에 걸린 시간(elapsed). checkpoint가 없으면 모두 0.
+    """
+    path = output + _CHECKPOINT_SUFFIX
+    if not os.path.exists(path):
+        return {'documents': 0, 'offset': 0, 'elapsed': 0.0}
+
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def write_checkpoint(output: str, documents: int, offset: int, elapsed: float):
+    """
+    출력 파일의 checkpoint를 기록합니다. 기록 중에 종료되어도 이전 checkpoint가 남도록, 임시 파일에 쓴 다음 교체합니다.
+
+    :param str output: 출력 파일 경로
+    :param int documents: 처리한 문서 수
+    :param int offset: 출력 파일에 기록된 byte 수
+    :param float elapsed: 분석에 걸린 시간(초)
+    """
+    path = output + _CHECKPOINT_SUFFIX
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump({'documents': documents, 'offset': offset, 'elapsed': elapsed}, file)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(path + '.tmp', path)
+
+
+def _open_pool(args):
+    options = dict(processes=args.processes, chunksize=args.chunksize, lib_path=args.lib_path,
+                   java_options=args.java_options)
+    if args.packages:
+        options['packages'] = dict(item.split('=', 1) for item in args.packages)
+    if args.etri_key:
+        options['etri_key'] = args.etri_key
+
+    analyzer = _ANALYZERS[args.task]
+    if analyzer is None:
+        pool = ProcessPoolTagger(args.api, **options)
+        return pool, lambda texts: pool.iterTag(texts, grouped=True)
+    else:
+        pool = ProcessPoolAnalyzer(analyzer, args.api, **options)
+        return pool, lambda texts: pool.iterAnalyze(texts, grouped=True)
+
+
+def run(args) -> dict:
+    """
+    명령행 인자에 따라 말뭉치를 분석하여 저장합니다.
+
+    :param args: :py:func:`parse_args` 의 결과
+    :rtype: dict
+    :return: 처리한 문서 수(documents), 이번 실행에서 분석한 문서 수(processed), 걸린 시간(elapsed), 초당 문서 수(throughput)
+    """
+    checkpoint = read_checkpoint(args.output)
+    if args.restart or not os.path.exists(args.output):
+        # 출력 파일이 없다면 checkpoint가 남아있더라도 처음부터 분석합니다.
+        checkpoint = {'documents': 0, 'offset': 0, 'elapsed': 0.0}
+    done = checkpoint['documents']
+    formatter = _FORMATTERS[args.format]
+
+    documents = islice(_read_documents(args.input, args.input_format, args.field), done, None)
+    records = deque()
+
+    def texts():
+        # 분석기로 보내는 문서의 record를 순서대로 보관해두었다가, 결과가 나오면 함께 기록합니다.
+        for record, text in documents:
+            records.append(record)
+            yield text
+
+    mode = 'r+b' if done > 0 else 'wb'
+    if mode == 'r+b':
+        logging.info("Resuming from checkpoint: %d documents already processed.", done)
+
+    pool, analyze = _open_pool(args)
+    begin = time.perf_counter()
+    processed = 0
+    try:
+        with open(args.output, mode) as output:
+            # checkpoint 이후에 기록된 내용은 다시 분석하므로 지웁니다.
+            output.seek(checkpoint['offset'])
+            output.truncate()
+
+            for sentences in analyze(texts()):
+                output.write(formatter(done + processed, records.popleft(), sentences).encode('utf-8'))
+                processed += 1
+
+                if processed % args.checkpoint_every == 0:
+                    output.flush()
+                    os.fsync(output.fileno())
+                    elapsed = checkpoint['elapsed'] + time.perf_counter() - begin
+                    write_checkpoint(args.output, done + processed, output.tell(), elapsed)
+                    logging.info("%d documents processed (%.1f docs/s)", done + processed,
+                                 processed / max(time.perf_counter() - begin, 1e-9))
+
+            output.flush()
+            os.fsync(output.fileno())
+            write_checkpoint(args.output, done + processed, output.tell(),
+                             checkpoint['elapsed'] + time.perf_counter() - begin)
+    finally:
+        pool.close()
+
+    elapsed = time.perf_counter() - begin
+    return {'documents': done + processed, 'processed': processed, 'elapsed': elapsed,
+            'throughput': processed / max(elapsed, 1e-9), 'processes': pool.processes}
+
+
+def parse_args(argv: List[str] = None):
+    """
+    명령행 인자를 해석합니다.
+
+    :param List[str] argv: 명령행 인자. (기본값: None = sys.argv[1:])
+    :return: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(prog='koalanlp-batch', description='말뭉치 파일을 여러 프로세스에서 분석하여 저장합니다.')
+    parser.add_argument('input', help='입력 파일. 한 줄이 문서 하나입니다.')
+    parser.add_argument('output', help='출력 파일. 같은 이름에 .checkpoint를 붙인 파일에 진행 상황을 기록합니다.')
+    parser.add_argument('--api', required=True, help='사용할 분석기 API (예: eunjeon, okt, hnn, etri)')
+    parser.add_argument('--task', choices=sorted(_ANALYZERS.keys()), default='tag',
+                        help='수행할 분석: 품사분석(tag), 구문분석(parse), 개체명 인식(entity), 의미역 분석(role) (기본값 tag)')
+    parser.add_argument('--format', choices=sorted(_FORMATTERS.keys()), default='jsonl', help='출력 형식 (기본값 jsonl)')
+    parser.add_argument('--input-format', choices=['text', 'jsonl'], default='text', help='입력 형식 (기본값 text)')
+    parser.add_argument('--field', default='text', help='JSONL 입력에서 분석할 문서가 담긴 항목 (기본값 text)')
+    parser.add_argument('--processes', type=int, default=None, help='작업 프로세스의 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--chunksize', type=int, default=16, help='작업 프로세스에 한 번에 보낼 문서의 수 (기본값 16)')
+    parser.add_argument('--checkpoint-every', type=int, default=1000, help='checkpoint를 기록할 문서 간격 (기본값 1000)')
+    parser.add_argument('--restart', action='store_true', help='checkpoint를 무시하고 처음부터 다시 분석합니다.')
+    parser.add_argument('--packages', nargs='*', default=None,
+                        help='작업 프로세스에서 초기화할 API와 버전 (예: hnn=LATEST etri=LATEST) (기본값: --api의 최신 버전)')
+    parser.add_argument('--etri-key', default=os.environ.get('ETRI_KEY'),
+                        help='ETRI 분석기의 API Key (기본값: 환경변수 ETRI_KEY)')
+    parser.add_argument('--java-options', default=None, help='작업 프로세스의 JVM option')
+    parser.add_argument('--lib-path', default=None, help="자바 라이브러리를 저장할 '.java' 디렉터리가 위치할 곳")
+
+    args = parser.parse_args(argv)
+    if args.checkpoint_every < 1:
+        parser.error('--checkpoint-every는 1 이상이어야 합니다.')
+
+    return args
+
+
+def main(argv: List[str] = None):
+    """
+    koalanlp-batch 명령의 시작점입니다.
+
+    :param List[str] argv: 명령행 인자. (기본값: None = sys.argv[1:])
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    args = parse_args(argv)
+    report = run(args)
+
+    print('%s(%s): %d documents in %.1fs, %.1f docs/s (%.1f docs/s per process, %d processes); %d documents in total'
+          % (args.task, args.api, report['processed'], report['elapsed'], report['throughput'],
+             report['throughput'] / report['processes'], report['processes'], report['documents']),
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
+
+
+# ----- Declare members exported -----
+
+__all__ = ['format_jsonl', 'format_conllu', 'format_line', 'read_checkpoint', 'write_checkpoint', 'run', 'parse_args',
+           'main']
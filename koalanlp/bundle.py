@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+인터넷에 연결된 컴퓨터에서 분석기 API 패키지와 그 의존성을 한 번 해석하여, 하나의 묶음(디렉터리 또는 .tar.gz 파일)으로 만드는 명령행 도구입니다.
+
+    koalanlp-bundle ./koalanlp-bundle --package KMR=LATEST --package HNN=2.1.4 --archive
+
+네트워크가 없는 컴퓨터에서는 묶음을 복사한 다음, ``Util.initialize(bundle='koalanlp-bundle.tar.gz', KMR='LATEST')``
+와 같이 초기화하면 네트워크를 전혀 사용하지 않고 묶음 안의 JAR 파일만 사용합니다.
+묶음 디렉터리는 Maven 저장소와 같은 구조이므로, ``MavenFileSystemRepos`` 저장소로도 사용할 수 있습니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from . import Util
+from .jip.cache import CacheManager
+from .jip.index import IndexManager
+from .jip.maven import Artifact
+from .jip.repository import RepositoryManager, MavenFileSystemRepos, MavenHttpRemoteRepos
+from .jip.util import DownloadException
+
+MANIFEST = 'bundle.json'  #: 묶음의 내용과 checksum을 기록하는 파일 이름
+FORMAT_VERSION = 1  #: 묶음 형식의 버전
+_ARCHIVE_SUFFIX = '.tar.gz'
+
+
+def _sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(str(path), 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _roots(packages: Dict[str, str]) -> List[str]:
+    # 묶음에 반드시 포함되어야 하는 artifact들
+    return ['kr.bydelta:koalanlp-%s' % pack for pack in packages] + ['net.sf.py4j:py4j']
+
+
+def create_bundle(path: str, packages: Dict[str, str], repositories: list = None, archive: bool = False) -> str:
+    """
+    분석기 API 패키지와 그 의존성을 모두 해석하고 내려받아, 하나의 묶음으로 만듭니다.
+    "LATEST" 버전은 묶음을 만들 때의 최신 버전으로 고정됩니다.
+
+    :param str path: 묶음을 만들 디렉터리의 경로. archive=True이면 만들 .tar.gz 파일의 경로.
+    :param Dict[str,str] packages: 묶음에 넣을 분석기 API의 목록. (:py:func:`koalanlp.Util.initialize` 의 packages와 같음)
+    :param list repositories: 의존성을 찾을 저장소(``MavenRepos``)들의 목록. (기본값: None = Util에 등록된 저장소)
+    :param bool archive: True이면 디렉터리 대신 .tar.gz 파일을 만듭니다. (기본값: False)
+    :rtype: str
+    :return: 만든 묶음의 경로
+    :raise FileExistsError: path에 이미 파일이나 비어있지 않은 디렉터리가 있는 경우.
+    :raise FileNotFoundError: 저장소에서 필요한 artifact를 찾지 못한 경우.
+    """
+    packages = Util._requested_packages(packages)
+    if archive and not path.endswith(_ARCHIVE_SUFFIX):
+        path += _ARCHIVE_SUFFIX
+    if os.path.exists(path) and (os.path.isfile(path) or len(os.listdir(path)) > 0):
+        raise FileExistsError('%s에 이미 파일이 있습니다.' % path)
+
+    saved = Util.repos_manager, Util.cache_manager, Util.index_manager
+    with tempfile.TemporaryDirectory() as work:
+        try:
+            # 작업 디렉터리에서 의존성을 해석하여, 이미 설치된 다른 JAR 파일이 섞이지 않도록 합니다.
+            if repositories is not None:
+                Util.repos_manager = RepositoryManager()
+                Util.repos_manager.repos = list(repositories)
+            Util.cache_manager = CacheManager(work)
+            Util.index_manager = IndexManager(work)
+            artifacts = Util._resolve_classpath(packages)
+            cache = Util.cache_manager
+        finally:
+            Util.repos_manager, Util.cache_manager, Util.index_manager = saved
+
+        found = {'%s:%s' % (artifact.group, artifact.artifact) for artifact in artifacts}
+        missing = [root for root in _roots(packages) if root not in found]
+        if len(missing) > 0:
+            raise FileNotFoundError('저장소에서 다음 artifact를 찾지 못했습니다: %s' % ', '.join(missing))
+
+        root = Path(work, 'bundle') if archive else Path(path)
+        entries = []
+        for artifact in sorted(artifacts, key=lambda a: a.id):
+            jar = cache.get_jar_path(artifact, filepath=True)
+            if not os.path.isfile(jar):
+                raise FileNotFoundError('%s의 JAR 파일을 내려받지 못했습니다.' % artifact)
+
+            # 내려받은 JAR 파일은 classifier가 붙은 파일이므로, Maven 저장소 구조에는 classifier 없이 둡니다.
+            plain = Artifact(artifact.group, artifact.artifact, artifact.version)
+            target = Path(root, plain.to_maven_name('jar'))
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(jar, str(target))
+
+            pom = cache.as_repos().get_artifact_uri(artifact, 'pom')
+            if os.path.isfile(pom):
+                shutil.copyfile(pom, str(Path(root, plain.to_maven_name('pom'))))
+
+            entries.append({'id': plain.id, 'jar': plain.to_maven_name('jar'), 'sha256': _sha256(target)})
+
+        versions = {artifact.artifact: artifact.version for artifact in artifacts if artifact.group == 'kr.bydelta'}
+        manifest = {
+            'format': FORMAT_VERSION,
+            'packages': {pack: versions['koalanlp-%s' % pack] for pack in packages},
+            'artifacts': entries
+        }
+        with Path(root, MANIFEST).open('w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=1)
+
+        if archive:
+            with tarfile.open(path, 'w:gz') as tar:
+                for item in sorted(root.iterdir()):
+                    tar.add(str(item), arcname=item.name)
+
+    return path
+
+
+def _extract(path: str, lib_path) -> Path:
+    # .tar.gz 묶음은 lib_path/.java/bundle/<checksum> 아래에 한 번만 풉니다.
+    target = Path(lib_path, '.java', 'bundle', _sha256(path)[:16])
+    if Path(target, MANIFEST).exists():
+        return target
+
+    temp = Path(str(target) + '.%d.tmp' % os.getpid())
+    with tarfile.open(path, 'r:*') as tar:
+        for member in tar.getmembers():
+            name = os.path.normpath(member.name)
+            if name.startswith('..') or os.path.isabs(name) or not (member.isfile() or member.isdir()):
+                raise ValueError('%s 묶음에 허용되지 않는 항목이 있습니다: %s' % (path, member.name))
+        tar.extractall(str(temp))
+
+    if Path(target, MANIFEST).exists():
+        # 다른 프로세스가 먼저 풀었다면 그 결과를 사용합니다.
+        shutil.rmtree(str(temp), ignore_errors=True)
+    else:
+        shutil.rmtree(str(target), ignore_errors=True)
+        os.replace(str(temp), str(target))
+    return target
+
+
+def read_manifest(path: str, lib_path=None) -> dict:
+    """
+    묶음에 기록된 내용을 읽습니다.
+
+    :param str path: 묶음 디렉터리 또는 .tar.gz 파일의 경로
+    :param Optional[str] lib_path: .tar.gz 묶음을 풀어둘 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
+    :rtype: dict
+    :return: 'packages' (패키지별 버전), 'artifacts' (JAR 파일별 id, 경로, sha256) 와 묶음 디렉터리 'root'를 담은 dict
+    :raise FileNotFoundError: 묶음이나 기록 파일이 없는 경우.
+    :raise ValueError: 지원하지 않는 형식인 경우.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError('%s 묶음이 없습니다.' % path)
+
+    root = _extract(path, lib_path or Path.cwd()) if os.path.isfile(path) else Path(path)
+    with Path(root, MANIFEST).open('r', encoding='utf-8') as file:
+        manifest = json.load(file)
+
+    if manifest.get('format') != FORMAT_VERSION:
+        raise ValueError('%s 묶음의 형식(%s)을 지원하지 않습니다.' % (path, manifest.get('format')))
+
+    manifest['root'] = str(root)
+    return manifest
+
+
+def load_bundle(path: str, packages: Dict[str, str] = None, lib_path=None, verify: bool = True) -> List[str]:
+    """
+    묶음에서 JVM을 시작할 classpath를 읽습니다. 네트워크를 사용하지 않습니다.
+
+    :param str path: 묶음 디렉터리 또는 .tar.gz 파일의 경로
+    :param Dict[str,str] packages: 사용할 분석기 API 패키지와 버전. "LATEST"는 묶음 안의 버전을 뜻합니다. (기본값: None = 묶음 전체)
+    :param Optional[str] lib_path: .tar.gz 묶음을 풀어둘 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
+    :param bool verify: JAR 파일의 sha256 checksum을 확인할지의 여부. (기본값: True)
+    :rtype: List[str]
+    :return: JAR 파일 경로의 목록
+    :raise FileNotFoundError: 묶음이나 JAR 파일이 없는 경우.
+    :raise ValueError: 요청한 패키지가 묶음에 없거나 버전이 다른 경우, 또는 JAR 파일의 checksum이 다른 경우.
+    """
+    manifest = read_manifest(path, lib_path)
+    bundled = manifest['packages']
+
+    for pack, version in (packages or {}).items():
+        pack = pack.lower()
+        if pack not in bundled:
+            raise ValueError('%s 묶음에 %s 패키지가 없습니다. (포함된 패키지: %s)' % (path, pack, ', '.join(sorted(bundled))))
+        if version.upper() != 'LATEST' and version != bundled[pack]:
+            raise ValueError('%s 묶음의 %s 패키지는 %s 버전입니다. (요청한 버전: %s)' % (path, pack, bundled[pack], version))
+
+    classpaths = []
+    for entry in manifest['artifacts']:
+        jar = Path(manifest['root'], entry['jar'])
+        if not jar.is_file():
+            raise FileNotFoundError('%s 묶음에 %s의 JAR 파일이 없습니다.' % (path, entry['id']))
+        if verify and _sha256(jar) != entry['sha256']:
+            raise ValueError('%s 묶음의 %s JAR 파일이 손상되었습니다. (checksum 불일치)' % (path, entry['id']))
+        classpaths.append(str(jar))
+
+    return classpaths
+
+
+def _repository(index: int, uri: str):
+    if uri.startswith('http://') or uri.startswith('https://'):
+        return MavenHttpRemoteRepos('bundle%d' % index, uri)
+    else:
+        return MavenFileSystemRepos('bundle%d' % index, uri)
+
+
+def main(argv: List[str] = None):
+    """
+    명령행 도구의 진입점입니다. ``koalanlp-bundle --help`` 로 사용법을 확인할 수 있습니다.
+
+    :param List[str] argv: 명령행 인자. (기본값: None = sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(prog='koalanlp-bundle',
+                                     description='분석기 API 패키지와 의존성을 네트워크 없이 사용할 수 있는 묶음으로 만듭니다.')
+    parser.add_argument('output', help='만들 묶음 디렉터리 (--archive인 경우 .tar.gz 파일)의 경로')
+    parser.add_argument('--package', action='append', required=True, metavar='API=VERSION',
+                        help='묶음에 넣을 분석기 API와 버전. 여러 번 지정 가능. (예: KMR=LATEST)')
+    parser.add_argument('--repository', action='append', default=None, metavar='URI',
+                        help='의존성을 찾을 Maven 저장소의 URL 또는 디렉터리. 여러 번 지정 가능. (기본값: KoalaNLP 기본 저장소)')
+    parser.add_argument('--archive', action='store_true', help='디렉터리 대신 .tar.gz 파일을 만듭니다.')
+    args = parser.parse_args(argv)
+
+    packages = {}
+    for package in args.package:
+        name, _, version = package.partition('=')
+        packages[name.upper()] = version or 'LATEST'
+
+    repositories = None
+    if args.repository is not None:
+        repositories = [_repository(index, uri) for index, uri in enumerate(args.repository)]
+
+    try:
+        path = create_bundle(args.output, packages, repositories=repositories, archive=args.archive)
+    except (OSError, ValueError, DownloadException) as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    print(path)
+
+
+if __name__ == '__main__':
+    main()
+
+
+# ----- Declare members exported -----
+
+__all__ = ['create_bundle', 'read_manifest', 'load_bundle', 'main']
@@ -3,21 +3,149 @@
 
 from .types import *
 from .jvm import *
+from array import array
+from functools import partial
+from importlib import import_module
 from typing import List, Optional, Union
 from builtins import type as typeof
 
 
+class _JavaReference(object):
+    """
+    Java 객체 참조를 저장하는 descriptor입니다.
+    문장을 일괄 변환하여 만든 객체는, Java 참조를 처음 사용할 때 문장의 Java 참조로부터 가져옵니다.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        reference = getattr(instance, '_reference', None)
+        if reference is None:
+            loader = getattr(instance, '_reference_loader', None)
+            if loader is not None:
+                object.__setattr__(instance, '_reference_loader', None)
+                try:
+                    reference = loader()
+                except JavaError as e:
+                    error_handler(e)
+                object.__setattr__(instance, '_reference', reference)
+
+        return reference
+
+    def __set__(self, instance, value):
+        object.__setattr__(instance, '_reference_loader', None)
+        object.__setattr__(instance, '_reference', value)
+
+
+def _attach_reference(obj, reference, *path):
+    # path: 호출할 Java 메서드 이름(str) 또는 List의 위치(int)
+    object.__setattr__(obj, '_reference_loader', partial(_java_item, reference, *path))
+
+
+class _LazyStructure(object):
+    """
+    문장의 구문구조, 의존구조, 의미역, 개체명 등을 처음 사용할 때 만드는 descriptor입니다.
+    만든 값은 객체의 __dict__에 저장되므로, 그 다음부터는 descriptor를 거치지 않습니다.
+    """
+
+    def __init__(self, name: str, default=None):
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        instance._load_structures()
+        if self.name not in instance.__dict__:
+            # 분석 결과가 없는 구조는 기본값으로 채워 둡니다.
+            instance.__dict__[self.name] = None if self.default is None else self.default()
+        return instance.__dict__[self.name]
+
+
+class _LazySlot(object):
+    """
+    __slots__에 저장하는 어절/형태소의 구문구조, 의존구조, 의미역, 개체명 값을 읽기 전에 문장의 구조를 먼저 만드는 descriptor입니다.
+    값은 원래의 slot에 그대로 저장합니다.
+    """
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.__doc__ = slot.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        instance._load_structures()
+        return self.slot.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+
+def _lazy_slots(cls, *names):
+    # 문장 구조에 속하는 slot을 _LazySlot으로 감쌉니다.
+    for name in names:
+        setattr(cls, name, _LazySlot(cls.__dict__[name]))
+    return cls
+
+
+_DETACHED = ('_reference', '_reference_loader', '_structure_loader')  #: 다른 프로세스로 보낼 때 제외할 속성
+_assign = object.__setattr__  #: 읽기 전용 속성 확인 없이 값을 저장하는 함수
+
+
+def _detached_state(obj) -> dict:
+    # pickle 등으로 다른 프로세스에 보낼 때에는 Java 참조를 제외합니다. 참조는 getReference()에서 다시 만듭니다.
+    # __slots__에 저장된 값과 __dict__에 저장된 값을 모두 모읍니다. 아직 만들지 않은 문장 구조는 먼저 만듭니다.
+    load_structures = getattr(obj, '_load_structures', None)
+    if load_structures is not None:
+        load_structures()
+
+    state = {name: getattr(obj, name) for cls in typeof(obj).__mro__ for name in getattr(cls, '__slots__', ())
+             if name not in _DETACHED and hasattr(obj, name)}
+    state.update((key, value) for key, value in getattr(obj, '__dict__', {}).items() if key not in _DETACHED)
+    return state
+
+
+def _release_reference(obj):
+    _assign(obj, '_reference', None)
+    _assign(obj, '_reference_loader', None)
+
+
+def _tree_nodes(tree) -> list:
+    if tree is None:
+        return []
+
+    nodes = [tree]
+    for child in tree:
+        nodes += _tree_nodes(child)
+    return nodes
+
+
+def _restore_state(obj, state: dict):
+    # 읽기 전용 속성도 다시 채울 수 있도록, __setattr__을 거치지 않고 저장합니다.
+    for name, value in state.items():
+        _assign(obj, name, value)
+
+
+def _java_item(reference, *path):
+    for step in path:
+        reference = getattr(reference, step)() if type(step) is str else reference.get(step)
+
+    return reference
+
+
 class _PyListWrap(object):
-    _ref_list = None
+    __slots__ = ('_ref_list', '_reference', '_reference_loader')
+    _FIXED = frozenset(['_ref_list'])  #: 한번 값을 정하면 바꿀 수 없는 속성
 
     def __setattr__(self, name, value):
-        if getattr(self, name) is None:
-            pass
-        elif name not in ['_ref_list']:
-            pass
-        elif name not in self.__dict__:
-            pass
-        else:
+        if name in self._FIXED and getattr(self, name, None) is not None:
             raise AttributeError("Can't touch {}".format(name))
 
         super().__setattr__(name, value)
@@ -25,6 +153,12 @@ class _PyListWrap(object):
     def __init__(self, ref_list):
         self._ref_list = ref_list
 
+    def __getstate__(self):
+        return _detached_state(self)
+
+    def __setstate__(self, state):
+        _restore_state(self, state)
+
     def __getitem__(self, item):
         """
         포함된 대상을 가져옵니다.
@@ -139,7 +273,7 @@ class Entity(_PyListWrap):
     label = None  #: 개체명 대분류 값
     fineLabel = None  #: 개체명 세분류 값
     originalLabel = None  #: 원본 분석기가 제시한 개체명 분류의 값.
-    reference = None
+    reference = _JavaReference()
 
     def __init__(self, surface: str, label: Union[str, CoarseEntityType], fineLabel: str, morphemes: List,
                  originalLabel: str = None):
@@ -165,7 +299,7 @@ class Entity(_PyListWrap):
             morph.entities.append(self)
 
     def __setattr__(self, name, value):
-        if getattr(self, name) is None:
+        if getattr(self, name, None) is None:
             pass
         elif name not in ['corefGroup', 'surface', 'label', 'fineLabel', 'originalLabel']:
             pass
@@ -179,11 +313,11 @@ class Entity(_PyListWrap):
     def getReference(self):
         if self.reference is None:
             try:
-                self.reference = koala_class_of('data.Entity')(string(self.surface),
+                self.reference = koala_class_of('data.Entity')(self.surface,
                                                                koala_enum_of('CoarseEntityType', self.label),
-                                                               string(self.fineLabel),
+                                                               self.fineLabel,
                                                                java_list([m.getReference() for m in self]),
-                                                               string(self.originalLabel))
+                                                               self.originalLabel)
             except JavaError as e:
                 error_handler(e)
 
@@ -284,7 +418,7 @@ class CoreferenceGroup(_PyListWrap):
         * :py:meth:`koalanlp.data.Sentence.getCorefGroups` 문장 내에 포함된 개체명 묶음 [CoreferenceGroup]들의 목록을 반환하는 API
         * :py:meth:`koalanlp.data.Entity.getCorefGroup` 각 개체명을 묶어 같은 지시 대상을 갖는 묶음인 [CoreferenceGroup]를 가져오는 API
     """
-    reference = None  #: Java CoreferenceGroup reference
+    reference = _JavaReference()  #: Java CoreferenceGroup reference
 
     def __init__(self, entities):
         """
@@ -328,7 +462,7 @@ class Tree(_PyListWrap):
         self.terminal = terminal
 
     def __setattr__(self, name, value):
-        if getattr(self, name) is None:
+        if getattr(self, name, None) is None:
             pass
         elif name not in ['label', 'terminal', 'children', 'parent']:
             pass
@@ -474,7 +608,7 @@ class SyntaxTree(Tree):
         * :py:class:`koalanlp.types.PhraseTag` 구구조의 형태 분류를 갖는 Enum 값
     """
     originalLabel = None  #: 원본 분석기의 표지자 값
-    reference = None
+    reference = _JavaReference()
 
     def __init__(self, label: Union[str, PhraseTag], terminal=None, children=None, originalLabel=None):
         """
@@ -500,7 +634,7 @@ class SyntaxTree(Tree):
             child.parent = self
 
     def __setattr__(self, name, value):
-        if getattr(self, name) is None:
+        if getattr(self, name, None) is None:
             pass
         elif name not in ['label', 'terminal', 'children', 'parent', 'originalLabel']:
             pass
@@ -517,7 +651,7 @@ class SyntaxTree(Tree):
                 self.reference = koala_class_of('data.SyntaxTree')(koala_enum_of('PhraseTag', self.label),
                                                                    self.terminal.getReference() if self.terminal is not None else None,
                                                                    java_list([t.getReference() for t in self]),
-                                                                   string(self.originalLabel))
+                                                                   self.originalLabel)
             except JavaError as e:
                 error_handler(e)
 
@@ -546,9 +680,14 @@ class DAGEdge(object):
     """
     DAG Edge를 저장합니다.
     """
-    src = None  #: Edge의 시작점.
-    dest = None  #: Edge의 종점.
-    label = None  #: Edge가 나타내는 관계
+    __slots__ = {
+        'src': 'Edge의 시작점.',
+        'dest': 'Edge의 종점.',
+        'label': 'Edge가 나타내는 관계',
+        '_reference': None,
+        '_reference_loader': None
+    }
+    _FIXED = frozenset(['src', 'dest', 'label'])  #: 한번 값을 정하면 바꿀 수 없는 속성
 
     def __init__(self, src, dest, label):
         assert dest is not None, "[dest]이 not None이어야 합니다."
@@ -556,14 +695,14 @@ class DAGEdge(object):
         self.dest = dest
         self.label = label
 
+    def __getstate__(self):
+        return _detached_state(self)
+
+    def __setstate__(self, state):
+        _restore_state(self, state)
+
     def __setattr__(self, name, value):
-        if getattr(self, name) is None:
-            pass
-        elif name not in ['src', 'dest', 'label']:
-            pass
-        elif name not in self.__dict__:
-            pass
-        else:
+        if name in self._FIXED and getattr(self, name, None) is not None:
             raise AttributeError("Can't touch {}".format(name))
 
         super().__setattr__(name, value)
@@ -626,12 +765,15 @@ class DepEdge(DAGEdge):
         * :py:meth:`koalanlp.types.PhraseTag` 의존구조의 형태 분류를 갖는 Enum 값 (구구조 분류와 같음)
         * :py:meth:`koalanlp.types.DependencyTag` 의존구조의 기능 분류를 갖는 Enum 값
     """
-    originalLabel = None  #: 원본 분석기의 표지자 값
-    type = None  #: 구문구조 표지자 값
-    governor = None  #: 의존구문구조의 지배소
-    dependent = None  #: 의존구문구조의 피지배소
-    depType = None  #: 의존구문구조 표지자 값
-    reference = None
+    __slots__ = {
+        'originalLabel': '원본 분석기의 표지자 값',
+        'type': '구문구조 표지자 값',
+        'governor': '의존구문구조의 지배소',
+        'dependent': '의존구문구조의 피지배소',
+        'depType': '의존구문구조 표지자 값'
+    }
+    _FIXED = frozenset(['src', 'dest', 'governor', 'dependent', 'label', 'type', 'depType', 'originalLabel'])
+    reference = _JavaReference()
 
     def __init__(self, governor=None, dependent=None, type=None, depType=None, originalLabel: str = None):
         """
@@ -659,18 +801,6 @@ class DepEdge(DAGEdge):
         self.dependent = self.dest
         self.reference = None
 
-    def __setattr__(self, name, value):
-        if getattr(self, name) is None:
-            pass
-        elif name not in ['src', 'dest', 'governor', 'dependent', 'label', 'type', 'depType', 'originalLabel']:
-            pass
-        elif name not in self.__dict__:
-            pass
-        else:
-            raise AttributeError("Can't touch {}".format(name))
-
-        super().__setattr__(name, value)
-
     def getReference(self):
         if self.reference is None:
             try:
@@ -679,7 +809,7 @@ class DepEdge(DAGEdge):
                     self.dependent.getReference(),
                     koala_enum_of('PhraseTag', self.type),
                     koala_enum_of('DependencyTag', self.depType),
-                    string(self.originalLabel))
+                    self.originalLabel)
             except JavaError as e:
                 error_handler(e)
 
@@ -771,11 +901,14 @@ class RoleEdge(DAGEdge):
         * :py:meth:`koalanlp.data.Sentence.getRoles` 전체 문장을 분석한 의미역 구조 [RoleEdge]를 가져오는 API
         * :py:class:`koalanlp.types.RoleType` 의미역 분류를 갖는 Enum 값
     """
-    originalLabel = None  #: 원본 분석기의 표지자 값
-    modifiers = []  #: 논항의 수식어구 목록.
-    predicate = None  #: 의미역 구조의 술어
-    argument = None  #: 의미역 구조의 논항
-    reference = None
+    __slots__ = {
+        'originalLabel': '원본 분석기의 표지자 값',
+        'modifiers': '논항의 수식어구 목록.',
+        'predicate': '의미역 구조의 술어',
+        'argument': '의미역 구조의 논항'
+    }
+    _FIXED = frozenset(['src', 'dest', 'predicate', 'argument', 'label', 'modifiers', 'originalLabel'])
+    reference = _JavaReference()
 
     def __init__(self, predicate, argument, label, modifiers: List = None, originalLabel: str = None):
         """
@@ -802,18 +935,6 @@ class RoleEdge(DAGEdge):
         self.argument = self.dest
         self.reference = None
 
-    def __setattr__(self, name, value):
-        if getattr(self, name) is None:
-            pass
-        elif name not in ['src', 'dest', 'predicate', 'argument', 'label', 'modifiers', 'originalLabel']:
-            pass
-        elif name not in self.__dict__:
-            pass
-        else:
-            raise AttributeError("Can't touch {}".format(name))
-
-        super().__setattr__(name, value)
-
     def getReference(self):
         if self.reference is None:
             try:
@@ -822,7 +943,7 @@ class RoleEdge(DAGEdge):
                     self.argument.getReference(),
                     koala_enum_of('RoleType', self.label),
                     java_list([w.getReference() for w in self.modifiers]),
-                    string(self.originalLabel))
+                    self.originalLabel)
             except JavaError as e:
                 error_handler(e)
 
@@ -901,14 +1022,19 @@ class Morpheme(object):
         * :py:class:`koalanlp.types.POS` 형태소의 분류를 담은 Enum class
     """
 
-    surface = ''  #: 형태소 표면형
-    id = None  #: 형태소의 어절 내 위치
-    tag = None  #: 형태소의 세종 품사
-    originalTag = None  #: 형태소의 원본분석기 품사
-    word = None  #: 형태소의 상위 어절.
-    wordSense = None  #: 형태소의 의미 어깨번호. :py:meth:`getWordSense` 참고.
-    entities = []  #: 형태소를 포함하는 개체명 목록. :py:meth:`getEntities` 참고.
-    reference = None
+    __slots__ = {
+        'surface': '형태소 표면형',
+        'id': '형태소의 어절 내 위치',
+        'tag': '형태소의 세종 품사',
+        'originalTag': '형태소의 원본분석기 품사',
+        'word': '형태소의 상위 어절.',
+        'wordSense': '형태소의 의미 어깨번호. :py:meth:`getWordSense` 참고.',
+        'entities': '형태소를 포함하는 개체명 목록. :py:meth:`getEntities` 참고.',
+        '_reference': None,
+        '_reference_loader': None
+    }
+    _FIXED = frozenset(['surface', 'tag', 'originalTag', 'id', 'word'])  #: 한번 값을 정하면 바꿀 수 없는 속성
+    reference = _JavaReference()
 
     def __init__(self, surface: str, tag: Union[str, POS], originalTag: str = None, reference=None):
         """
@@ -919,14 +1045,15 @@ class Morpheme(object):
         """
         assert surface is not None and tag is not None, "surface, tag가 None이 아니어야 합니다."
 
-        self.surface = surface
-        self.tag = tag if type(tag) is str else tag.name
-        self.originalTag = originalTag
+        # 생성 중에는 읽기 전용 여부를 확인할 필요가 없으므로, __setattr__을 거치지 않고 바로 저장합니다.
+        _assign(self, 'surface', surface)
+        _assign(self, 'tag', tag if type(tag) is str else tag.name)
+        _assign(self, 'originalTag', originalTag)
+        _assign(self, 'id', None)
+        _assign(self, 'word', None)
+        _assign(self, 'wordSense', None)
+        _assign(self, 'entities', [])
         self.reference = reference
-        self.id = None
-        self.word = None
-        self.wordSense = None
-        self.entities = []
 
         try:
             if self.reference is not None and self.reference.getWordSense() is not None:
@@ -935,24 +1062,28 @@ class Morpheme(object):
             error_handler(e)
 
     def __setattr__(self, name, value):
-        if getattr(self, name) is None:
-            pass
-        elif name not in ['surface', 'tag', 'originalTag', 'id', 'word']:
-            pass
-        elif name not in self.__dict__:
-            pass
-        else:
+        if name in self._FIXED and getattr(self, name, None) is not None:
             raise AttributeError("Can't touch {}".format(name))
 
         super().__setattr__(name, value)
 
+    def __getstate__(self):
+        return _detached_state(self)
+
+    def __setstate__(self, state):
+        _restore_state(self, state)
+
+    def _load_structures(self):
+        if self.word is not None:
+            self.word._load_structures()
+
     def getReference(self):
         if self.reference is None:
             try:
                 self.reference = koala_class_of('data.Morpheme')(
-                    string(self.surface),
+                    self.surface,
                     koala_enum_of('POS', self.tag),
-                    string(self.originalTag))
+                    self.originalTag)
             except JavaError as e:
                 error_handler(e)
 
@@ -1034,6 +1165,7 @@ class Morpheme(object):
 
         :return: [Entity]의 목록입니다. 분석 결과가 없으면 빈 리스트
         """
+        self._load_structures()
         return self.entities
 
     def getWord(self):
@@ -1190,20 +1322,27 @@ class Morpheme(object):
             else "%s/%s" % (self.surface, str(self.tag))
 
 
+_lazy_slots(Morpheme, 'entities')
+
+
 class Word(_PyListWrap):
     """
     어절을 표현하는 [Property] class입니다.
     """
-    surface = ''  #: 어절의 표면형
-    id = None  #: 어절의 문장 내 위치
-    morphemes = []  #: 어절 내 형태소 목록
-    entities = []  #: 개체명 분석을 했다면, 현재 어절이 속한 개체명 값. :py:meth:`getEntities` 참고
-    phrase = None  #: 구문분석을 했다면, 현재 어절이 속한 직속 상위 구구조(Phrase). :py:meth:`getPhrase` 참고
-    dependentEdges = []  #: 의존구문분석을 했다면, 현재 어절이 지배소인 하위 의존구문 구조의 값. :py:meth:`getDependentEdges` 참고.
-    governorEdge = None  #: 의존구문분석을 했다면, 현재 어절이 의존소인 상위 의존구문 구조의 값. :py:meth:`getGovernorEdge` 참고
-    argumentRoles = []  #: 의미역 분석을 했다면, 현재 어절이 술어로 기능하는 하위 의미역 구조의 목록. :py:meth:`getArgumentRoles` 참고.
-    predicateRoles = []  #: 의미역 분석을 했다면, 현재 어절이 논항인 상위 의미역 구조의 목록. :py:meth:`getPredicateRoles` 참고.
-    reference = None
+    __slots__ = {
+        'surface': '어절의 표면형',
+        'id': '어절의 문장 내 위치',
+        'morphemes': '어절 내 형태소 목록',
+        'entities': '개체명 분석을 했다면, 현재 어절이 속한 개체명 값. :py:meth:`getEntities` 참고',
+        'phrase': '구문분석을 했다면, 현재 어절이 속한 직속 상위 구구조(Phrase). :py:meth:`getPhrase` 참고',
+        'dependentEdges': '의존구문분석을 했다면, 현재 어절이 지배소인 하위 의존구문 구조의 값. :py:meth:`getDependentEdges` 참고.',
+        'governorEdge': '의존구문분석을 했다면, 현재 어절이 의존소인 상위 의존구문 구조의 값. :py:meth:`getGovernorEdge` 참고',
+        'argumentRoles': '의미역 분석을 했다면, 현재 어절이 술어로 기능하는 하위 의미역 구조의 목록. :py:meth:`getArgumentRoles` 참고.',
+        'predicateRoles': '의미역 분석을 했다면, 현재 어절이 논항인 상위 의미역 구조의 목록. :py:meth:`getPredicateRoles` 참고.',
+        '_structure_loader': None
+    }
+    _FIXED = frozenset(['surface', 'morphemes', 'id', '_ref_list'])  #: 한번 값을 정하면 바꿀 수 없는 속성
+    reference = _JavaReference()
 
     def __init__(self, surface, morphemes, reference=None):
         """
@@ -1214,45 +1353,41 @@ class Word(_PyListWrap):
         assert surface is not None and morphemes is not None and len(morphemes) > 0, \
             "morphemes가 list이고, surface가 None이 아니어야 합니다."
 
-        self.surface = surface
-        self.morphemes = morphemes
+        # 생성 중에는 읽기 전용 여부를 확인할 필요가 없으므로, __setattr__을 거치지 않고 바로 저장합니다.
+        _assign(self, 'surface', surface)
+        _assign(self, 'morphemes', morphemes)
+        _assign(self, 'id', None)
+        _assign(self, 'entities', [])
+        _assign(self, 'phrase', None)
+        _assign(self, 'dependentEdges', [])
+        _assign(self, 'governorEdge', None)
+        _assign(self, 'argumentRoles', [])
+        _assign(self, 'predicateRoles', [])
+        _assign(self, '_ref_list', morphemes)
+        _assign(self, '_structure_loader', None)
         self.reference = reference
-        self.id = None
-        self.entities = []
-        self.phrase = None
-        self.dependentEdges = []
-        self.governorEdge = None
-        self.argumentRoles = []
-        self.predicateRoles = []
-        super().__init__(self.morphemes)
 
         for i, morph in enumerate(self):
             morph.word = self
             morph.id = i
 
-    def __setattr__(self, name, value):
-        if getattr(self, name) is None:
-            pass
-        elif name not in ['surface', 'morphemes', 'id']:
-            pass
-        elif name not in self.__dict__:
-            pass
-        else:
-            raise AttributeError("Can't touch {}".format(name))
-
-        super().__setattr__(name, value)
-
     def getReference(self):
         if self.reference is None:
             try:
                 self.reference = koala_class_of('data.Word')(
-                    string(self.surface),
+                    self.surface,
                     java_list([m.getReference() for m in self]))
             except JavaError as e:
                 error_handler(e)
 
         return self.reference
 
+    def _load_structures(self):
+        # Java 분석 결과로 만든 어절은, 구문구조/의존구조 등을 문장에서 처음 사용할 때 만듭니다.
+        loader = getattr(self, '_structure_loader', None)
+        if loader is not None:
+            loader()
+
     def getSurface(self) -> str:
         """
 
@@ -1333,6 +1468,7 @@ class Word(_PyListWrap):
 
         :return: 어절의 상위 구구조 [SyntaxTree]. 분석 결과가 없으면 None
         """
+        self._load_structures()
         return self.phrase
 
     def getDependentEdges(self) -> List[DepEdge]:
@@ -1365,6 +1501,7 @@ class Word(_PyListWrap):
 
         :return: 어절이 지배하는 의존구문구조 [DepEdge]의 목록. 분석 결과가 없으면 빈 리스트.
         """
+        self._load_structures()
         return self.dependentEdges
 
     def getGovernorEdge(self) -> DepEdge:
@@ -1397,6 +1534,7 @@ class Word(_PyListWrap):
 
         :return: 어절이 지배당하는 의존구문구조 [DepEdge]. 분석 결과가 없으면 None
         """
+        self._load_structures()
         return self.governorEdge
 
     def getArgumentRoles(self) -> List[RoleEdge]:
@@ -1427,6 +1565,7 @@ class Word(_PyListWrap):
 
         :return: 어절이 술어로 기능하는 하위 의미역 구조 [RoleEdge]의 목록. 분석 결과가 없으면 빈 리스트.
         """
+        self._load_structures()
         return self.argumentRoles
 
     def getPredicateRoles(self) -> List[RoleEdge]:
@@ -1457,6 +1596,7 @@ class Word(_PyListWrap):
 
         :return: 어절이 논항인 상위 의미역 구조 [RoleEdge]. 분석 결과가 없으면 빈 리스트.
         """
+        self._load_structures()
         return self.predicateRoles
 
     def singleLineString(self) -> str:
@@ -1497,17 +1637,170 @@ class Word(_PyListWrap):
         return super().__eq__(other) and self.surface == other.surface
 
 
+_lazy_slots(Word, 'entities', 'phrase', 'dependentEdges', 'governorEdge', 'argumentRoles', 'predicateRoles')
+
+
+# ----- JVM에서 일괄 변환한 문장 표현 -----
+# Java 문장 하나는 Py4J 통신 1회로 아래와 같은 문자열 하나로 변환됩니다.
+#   어절 GS 형태소 GS 구문구조 GS 의존구문 GS 의미역 GS 개체명 GS 공지시어
+# 각 부분은 RS로 구분된 항목이고, 항목의 값은 US로 구분됩니다. 어절, 형태소는 문장 내 위치(index)로 참조합니다.
+# 구문구조는 분석 결과가 있는지만 표시하며, 결과가 있는 경우 기존 방식대로 변환합니다.
+
+_SEP_SENTENCE = '\x1c'
+_SEP_SECTION = '\x1d'
+_SEP_RECORD = '\x1e'
+_SEP_FIELD = '\x1f'
+
+
+def _sentence_encoder():
+    def build():
+        sent_cls, word_cls, morph_cls = [koala_class_of(name)._java_lang_class
+                                         for name in ['data.Sentence', 'data.Word', 'data.Morpheme']]
+        dep_cls, role_cls, entity_cls = [koala_class_of(name)._java_lang_class
+                                         for name in ['data.DepEdge', 'data.RoleEdge', 'data.Entity']]
+
+        word = java_concat(_SEP_FIELD, java_getter(word_cls, 'getSurface'), java_getter(word_cls, 'size'))
+        morph = java_concat(_SEP_FIELD,
+                            java_getter(morph_cls, 'getSurface'), java_getter(morph_cls, 'getTag', 'name'),
+                            java_getter(morph_cls, 'getOriginalTag'), java_getter(morph_cls, 'getWordSense'))
+        dep = java_concat(_SEP_FIELD,
+                          java_getter(dep_cls, 'getGovernor', 'getId'), java_getter(dep_cls, 'getDependent', 'getId'),
+                          java_getter(dep_cls, 'getType', 'name'), java_getter(dep_cls, 'getDepType', 'name'),
+                          java_getter(dep_cls, 'getOriginalLabel'))
+        role = java_concat(_SEP_FIELD,
+                           java_getter(role_cls, 'getPredicate', 'getId'), java_getter(role_cls, 'getArgument', 'getId'),
+                           java_getter(role_cls, 'getLabel', 'name'),
+                           java_getter(role_cls, 'getModifiers', tail=java_joining(java_getter(word_cls, 'getId'), ',')),
+                           java_getter(role_cls, 'getOriginalLabel'))
+        entity_morphs = java_joining(java_concat('.', java_getter(morph_cls, 'getWord', 'getId'),
+                                                 java_getter(morph_cls, 'getId')), ',')
+        entity = java_concat(_SEP_FIELD,
+                             java_getter(entity_cls, 'getSurface'), java_getter(entity_cls, 'getLabel', 'name'),
+                             java_getter(entity_cls, 'getFineLabel'), java_getter(entity_cls, 'getOriginalLabel'),
+                             entity_morphs)
+        coref = java_joining(java_concat(':', java_getter(entity_cls, 'getLabel', 'name'), entity_morphs), _SEP_FIELD)
+
+        sentence = java_concat(_SEP_SECTION,
+                               java_joining(word, _SEP_RECORD),
+                               java_joining(morph, _SEP_RECORD, flatten=True),
+                               java_getter(sent_cls, 'getSyntaxTree', 'getLabel', 'name'),
+                               java_getter(sent_cls, 'getDependencies', tail=java_joining(dep, _SEP_RECORD)),
+                               java_getter(sent_cls, 'getRoles', tail=java_joining(role, _SEP_RECORD)),
+                               java_getter(sent_cls, 'getEntities', tail=java_joining(entity, _SEP_RECORD)),
+                               java_getter(sent_cls, 'getCorefGroups', tail=java_joining(coref, _SEP_RECORD)))
+        return sentence
+
+    return java_cached('data.Sentence', build)
+
+
+def _sentence_function():
+    return java_cached('data.Sentence.function', lambda: java_function(_sentence_encoder()))
+
+
+def _sentence_list_encoder(grouped: bool):
+    # 문장 목록은 [목록 크기] FS 문장 FS 문장 ... 형태로 변환합니다.
+    # 문장 목록의 목록(grouped)은 목록 크기들을 쉼표로 이어붙이고, 모든 문장을 한 줄로 펼쳐서 변환합니다.
+    def build():
+        size = java_getter(java_class('java.util.List'), 'size')
+        if grouped:
+            sizes = java_joining(size, ',')
+        else:
+            sizes = size
+
+        return java_function(java_concat(_SEP_SENTENCE, sizes,
+                                         java_joining(_sentence_encoder(), _SEP_SENTENCE, flatten=grouped)))
+
+    return java_cached('data.Sentence.list.%s' % grouped, build)
+
+
+def _nullable(value: str) -> Optional[str]:
+    return None if value == NULL_MARK else value
+
+
+def _index(value: str, size: int) -> Optional[int]:
+    if value == NULL_MARK:
+        return None
+
+    value = int(value)
+    if not 0 <= value < size:
+        raise ValueError('Index %s is out of range' % value)
+    return value
+
+
+def _records(section: str, n_fields: int = None) -> List[List[str]]:
+    if section == '' or section == NULL_MARK:
+        return []
+
+    records = [record.split(_SEP_FIELD) for record in section.split(_SEP_RECORD)]
+    if n_fields is not None and any(len(record) != n_fields for record in records):
+        raise ValueError('Malformed record')
+    return records
+
+
+def _parse_sentence_payload(payload: str) -> dict:
+    # 문자열을 먼저 모두 해석/검증한 다음에 객체를 만들어야, 잘못된 문자열 때문에 객체가 일부만 만들어지지 않습니다.
+    sections = payload.split(_SEP_SECTION)
+    if len(sections) != 7:
+        raise ValueError('Malformed payload')
+
+    words = [(surface, int(size)) for surface, size in _records(sections[0], 2)]
+    # 의미 어깨번호는 Java의 Integer이므로, 객체마다 변환하는 경우와 같이 int로 저장합니다.
+    morphs = [(surface, tag, _nullable(original), int(sense) if _nullable(sense) is not None else None)
+              for surface, tag, original, sense in _records(sections[1], 4)]
+    if len(words) == 0 or any(size <= 0 for _, size in words) or sum(size for _, size in words) != len(morphs):
+        raise ValueError('Word and morpheme counts do not match')
+
+    n_words = len(words)
+    word_sizes = [size for _, size in words]
+
+    def morph_refs(refs: str):
+        if refs == '' or refs == NULL_MARK:
+            return []
+
+        result = []
+        for ref in refs.split(','):
+            word_id, morph_id = ref.split('.')
+            word_id = _index(word_id, n_words)
+            result.append((word_id, _index(morph_id, word_sizes[word_id])))
+        return result
+
+    def word_refs(refs: str):
+        return [] if refs == '' or refs == NULL_MARK else [_index(ref, n_words) for ref in refs.split(',')]
+
+    dependencies = [(_index(gov, n_words), _index(dep, n_words), tag, _nullable(dep_tag), _nullable(original))
+                    for gov, dep, tag, dep_tag, original in _records(sections[3], 5)]
+    roles = [(_index(pred, n_words), _index(arg, n_words), label, word_refs(modifiers), _nullable(original))
+             for pred, arg, label, modifiers, original in _records(sections[4], 5)]
+    entities = [(surface, label, fine_label, _nullable(original), morph_refs(refs), '%s:%s' % (label, refs))
+                for surface, label, fine_label, original, refs in _records(sections[5], 5)]
+
+    entity_keys = {}
+    for i, entity in enumerate(entities):
+        entity_keys.setdefault(entity[-1], i)
+    coref_groups = [[entity_keys[key] for key in group] for group in _records(sections[6])]
+
+    return {
+        'words': words,
+        'morphemes': morphs,
+        'syntaxTree': sections[2] != NULL_MARK,
+        'dependencies': dependencies,
+        'roles': roles,
+        'entities': entities,
+        'corefGroups': coref_groups
+    }
+
+
 class Sentence(_PyListWrap):
     """
     문장을 표현하는 [Property] class입니다.
     """
     words = []  #: 문장내 어절의 목록
-    syntaxTree = None  #: 문장의 최상위 구구조 (분석결과가 없으면 None) :py:meth:`getSyntaxTree` 참고.
-    dependencies = []  #: 문장에 포함된 모든 의존구문구조 (분석결과가 없으면 []). :py:meth:`getDependencies` 참고
-    roles = []  #: 문장에 포함된 모든 의미역 구조 (분석 결과가 없으면 []). :py:meth:`getRoles` 참고
-    entities = []  #: 문장에 포함된 모든 개체명 (분석 결과가 없으면 []). :py:meth:`getEntities` 참고
-    corefGroups = []  #: 문장 내에 포함된 공통 지시어 또는 대용어들의 묶음 (분석 결과가 없으면 []). :py:meth:`getCorefGroups` 참고
-    reference = None  #: Java 문장 타입
+    syntaxTree = _LazyStructure('syntaxTree')  #: 문장의 최상위 구구조 (분석결과가 없으면 None) :py:meth:`getSyntaxTree` 참고.
+    dependencies = _LazyStructure('dependencies', list)  #: 문장에 포함된 모든 의존구문구조 (분석결과가 없으면 []). :py:meth:`getDependencies` 참고
+    roles = _LazyStructure('roles', list)  #: 문장에 포함된 모든 의미역 구조 (분석 결과가 없으면 []). :py:meth:`getRoles` 참고
+    entities = _LazyStructure('entities', list)  #: 문장에 포함된 모든 개체명 (분석 결과가 없으면 []). :py:meth:`getEntities` 참고
+    corefGroups = _LazyStructure('corefGroups', list)  #: 문장 내에 포함된 공통 지시어 또는 대용어들의 묶음 (분석 결과가 없으면 []). :py:meth:`getCorefGroups` 참고
+    reference = _JavaReference()  #: Java 문장 타입
 
     def __init__(self, words=None, reference=None):
         """
@@ -1520,24 +1813,11 @@ class Sentence(_PyListWrap):
 
         if reference is not None:
             try:
-                self.words = py_list(reference,
-                                     lambda w: Word(surface=w.getSurface(),
-                                                    morphemes=py_list(w,
-                                                                      lambda m: Morpheme(surface=m.getSurface(),
-                                                                                         tag=m.getTag().name(),
-                                                                                         originalTag=m.getOriginalTag(),
-                                                                                         reference=m)),
-                                                    reference=w))
-                super().__init__(self.words)
-
-                self.syntaxTree = self.__recon_syntax_tree(reference.getSyntaxTree())
-                self.dependencies = py_list(reference.getDependencies(), self.__get_dep_edge)
-                self.roles = py_list(reference.getRoles(), self.__get_role)
-                self.entities = py_list(reference.getEntities(), self.__get_entity)
-                self.corefGroups = py_list(reference.getCorefGroups(), self.__get_coref)
-                self.reference = reference
+                payload = _sentence_function().apply(reference)
             except JavaError as e:
                 error_handler(e)
+
+            self.__init_from_java(payload, reference)
         else:
             self.words = words
             self.syntaxTree = None
@@ -1548,11 +1828,11 @@ class Sentence(_PyListWrap):
             self.reference = None
             super().__init__(words)
 
-        for i, word in enumerate(self):
-            word.id = i
+            for i, word in enumerate(self):
+                word.id = i
 
     def __setattr__(self, name, value):
-        if getattr(self, name) is None or len(getattr(self, name)) == 0:
+        if getattr(self, name, None) is None or len(getattr(self, name)) == 0:
             pass
         elif name not in ['words', 'syntaxTree', 'dependencies', 'roles', 'entities', 'corefGroups']:
             pass
@@ -1563,6 +1843,153 @@ class Sentence(_PyListWrap):
 
         super().__setattr__(name, value)
 
+    def _load_structures(self):
+        # Java 분석 결과로 만든 문장은, 어절과 형태소만 먼저 만들고 구문구조/의존구조/의미역/개체명은 처음 사용할 때 만듭니다.
+        loader = self.__dict__.pop('_structure_loader', None)
+        if loader is not None:
+            for word in self:
+                _assign(word, '_structure_loader', None)
+            try:
+                loader()
+            except Exception:
+                # 만들다 만 구조를 버리고, 다음에 사용할 때 다시 만들도록 되돌립니다.
+                self.__discard_structures()
+                self.__defer_structures(loader)
+                raise
+
+    def __discard_structures(self):
+        for name in ('syntaxTree', 'dependencies', 'roles', 'entities', 'corefGroups'):
+            self.__dict__.pop(name, None)
+
+        for word in self:
+            _assign(word, 'entities', [])
+            _assign(word, 'phrase', None)
+            _assign(word, 'dependentEdges', [])
+            _assign(word, 'governorEdge', None)
+            _assign(word, 'argumentRoles', [])
+            _assign(word, 'predicateRoles', [])
+            for morph in word:
+                _assign(morph, 'entities', [])
+
+    def __defer_structures(self, loader):
+        self.__dict__['_structure_loader'] = loader
+        for word in self:
+            _assign(word, '_structure_loader', self._load_structures)
+
+    def __init_from_java(self, payload: str, reference, *path):
+        # path가 주어진 경우, reference는 문장을 담고 있는 Java List이며 문장의 Java 참조는 처음 사용할 때 가져옵니다.
+        try:
+            parsed = _parse_sentence_payload(payload)
+        except (ValueError, KeyError):
+            # 표면형에 구분 문자가 포함된 경우 등에는, 객체마다 Java에 값을 요청하는 방식으로 변환합니다.
+            parsed = None
+
+        if parsed is not None:
+            self.__init_from_payload(parsed, reference, *path)
+        else:
+            try:
+                reference = _java_item(reference, *path)
+            except JavaError as e:
+                error_handler(e)
+            self.__init_from_reference(reference)
+
+        for i, word in enumerate(self):
+            word.id = i
+
+    def __init_from_payload(self, parsed: dict, reference, *path):
+        words = []
+        morphs = iter(parsed['morphemes'])
+        for word_id, (surface, size) in enumerate(parsed['words']):
+            morphemes = []
+            for morph_id in range(size):
+                morph_surface, tag, original, sense = next(morphs)
+                morph = Morpheme(surface=morph_surface, tag=tag, originalTag=original)
+                morph.wordSense = sense
+                _attach_reference(morph, reference, *path, word_id, morph_id)
+                morphemes.append(morph)
+
+            word = Word(surface=surface, morphemes=morphemes)
+            _attach_reference(word, reference, *path, word_id)
+            words.append(word)
+
+        self.words = words
+        super().__init__(self.words)
+
+        if len(path) > 0:
+            _attach_reference(self, reference, *path)
+        else:
+            self.reference = reference
+
+        if parsed['syntaxTree'] or any(len(parsed[key]) > 0 for key in ['dependencies', 'roles', 'entities']):
+            self.__defer_structures(partial(self.__init_structures_from_payload, parsed, reference, *path))
+
+    def __init_structures_from_payload(self, parsed: dict, reference, *path):
+        try:
+            if parsed['syntaxTree']:
+                self.syntaxTree = self.__recon_syntax_tree(_java_item(reference, *path, 'getSyntaxTree'))
+            else:
+                self.syntaxTree = None
+        except JavaError as e:
+            error_handler(e)
+
+        dependencies = []
+        for i, (gov, dep, tag, dep_tag, original) in enumerate(parsed['dependencies']):
+            edge = DepEdge(governor=self[gov] if gov is not None else None, dependent=self[dep],
+                           type=tag, depType=dep_tag, originalLabel=original)
+            _attach_reference(edge, reference, *path, 'getDependencies', i)
+            dependencies.append(edge)
+        self.dependencies = dependencies
+
+        roles = []
+        for i, (pred, arg, label, modifiers, original) in enumerate(parsed['roles']):
+            edge = RoleEdge(predicate=self[pred], argument=self[arg] if arg is not None else None, label=label,
+                            modifiers=[self[w] for w in modifiers], originalLabel=original)
+            _attach_reference(edge, reference, *path, 'getRoles', i)
+            roles.append(edge)
+        self.roles = roles
+
+        entities = []
+        for i, (surface, label, fine_label, original, morphs, _) in enumerate(parsed['entities']):
+            entity = Entity(surface=surface, label=label, fineLabel=fine_label,
+                            morphemes=[self[w][m] for w, m in morphs], originalLabel=original)
+            _attach_reference(entity, reference, *path, 'getEntities', i)
+            entities.append(entity)
+        self.entities = entities
+
+        coref_groups = []
+        for i, members in enumerate(parsed['corefGroups']):
+            coref = CoreferenceGroup([self.entities[e] for e in members])
+            _attach_reference(coref, reference, *path, 'getCorefGroups', i)
+            coref_groups.append(coref)
+        self.corefGroups = coref_groups
+
+    def __init_from_reference(self, reference):
+        try:
+            self.words = py_list(reference,
+                                 lambda w: Word(surface=w.getSurface(),
+                                                morphemes=py_list(w,
+                                                                  lambda m: Morpheme(surface=m.getSurface(),
+                                                                                     tag=m.getTag().name(),
+                                                                                     originalTag=m.getOriginalTag(),
+                                                                                     reference=m)),
+                                                reference=w))
+            super().__init__(self.words)
+            self.reference = reference
+        except JavaError as e:
+            error_handler(e)
+
+        self.__defer_structures(partial(self.__init_structures_from_reference, reference))
+
+    def __init_structures_from_reference(self, reference):
+        try:
+            self.syntaxTree = self.__recon_syntax_tree(reference.getSyntaxTree())
+            self.dependencies = py_list(reference.getDependencies(), self.__get_dep_edge)
+            self.roles = py_list(reference.getRoles(), self.__get_role)
+            self.entities = py_list(reference.getEntities(), self.__get_entity)
+            self.corefGroups = py_list(reference.getCorefGroups(), self.__get_coref)
+        except JavaError as e:
+            error_handler(e)
+
     def __get_jword(self, jword) -> Optional[Word]:
         if jword is not None:
             return self[jword.getId()]
@@ -1641,6 +2068,10 @@ class Sentence(_PyListWrap):
             error_handler(e)
 
     def getReference(self):
+        if '_structure_loader' in self.__dict__:
+            # 구조를 아직 만들지 않았다면, Java 분석 결과를 그대로 사용하면 됩니다.
+            return self.reference
+
         try:
             if self.reference is None:
                 self.reference = koala_class_of('data.Sentence')(java_list([w.getReference() for w in self]))
@@ -1664,6 +2095,24 @@ class Sentence(_PyListWrap):
 
         return self.reference
 
+    def detach(self):
+        """
+        문장과 문장에 포함된 모든 객체의 Java 참조를 놓아, JVM이 Java 분석 결과를 정리할 수 있게 합니다.
+        구문구조, 의존구조 등 아직 만들지 않은 구조는 먼저 Python 객체로 만듭니다.
+        Java 참조가 다시 필요하면 :py:meth:`getReference` 가 Python 객체의 값으로 새로 만듭니다.
+
+        :rtype: Sentence
+        :return: Java 참조를 놓은 이 문장
+        """
+        self._load_structures()
+
+        objects = [self] + self.words + [morph for word in self for morph in word]
+        objects += self.dependencies + self.roles + self.entities + self.corefGroups + _tree_nodes(self.syntaxTree)
+        for obj in objects:
+            _release_reference(obj)
+
+        return self
+
     def getSyntaxTree(self) -> SyntaxTree:
         """
         구문분석을 했다면, 최상위 구구조(Phrase)를 돌려줍니다.
@@ -1963,10 +2412,397 @@ class Sentence(_PyListWrap):
         return self.surfaceString()
 
     @staticmethod
-    def fromJava(ref):
-        return Sentence(reference=ref)
+    def fromJava(ref, detached: bool = False):
+        """
+        Java 문장을 변환합니다.
+
+        :param ref: Java KoalaNLP의 Sentence
+        :param bool detached: True이면 변환한 다음 Java 참조를 놓습니다. :py:meth:`detach` 참고. (기본값 False)
+        :rtype: Sentence
+        :return: 변환된 문장
+        """
+        sentence = Sentence(reference=ref)
+        return sentence.detach() if detached else sentence
+
+    @staticmethod
+    def fromJavaList(ref, grouped: bool = False, detached: bool = False):
+        """
+        Java 문장의 List를 Py4J 통신 1회로 변환합니다. 각 문장의 Java 참조는 처음 사용할 때 가져옵니다.
+
+        :param ref: Java KoalaNLP의 Sentence를 담은 List. (grouped=True이면 List의 List)
+        :param bool grouped: List의 List를 변환할 것인지의 여부 (기본값 False)
+        :param bool detached: True이면 변환한 다음 Java 참조를 놓습니다. :py:meth:`detach` 참고. (기본값 False)
+        :rtype: Union[List[Sentence],List[List[Sentence]]]
+        :return: 변환된 문장의 목록. grouped=True이면 안쪽 List별로 묶은 목록.
+        """
+        try:
+            payload = _sentence_list_encoder(grouped).apply(ref)
+        except JavaError as e:
+            error_handler(e)
+
+        sizes, payload = payload.split(_SEP_SENTENCE, 1)
+        sizes = [int(size) for size in sizes.split(',')] if sizes != '' else []
+        payloads = payload.split(_SEP_SENTENCE)
+        positions = [(i, j) if grouped else (j,) for i, size in enumerate(sizes) for j in range(size)]
+
+        if len(positions) == 0:
+            sentences = []
+        elif len(payloads) == len(positions):
+            sentences = []
+            for sent_payload, position in zip(payloads, positions):
+                sentence = Sentence.__new__(Sentence)
+                sentence.__init_from_java(sent_payload, ref, *position)
+                sentences.append(sentence)
+        else:
+            # 문장 사이의 구분 문자가 표면형에 포함된 경우에는, 문장마다 변환합니다.
+            try:
+                sentences = [Sentence.fromJava(_java_item(ref, *position)) for position in positions]
+            except JavaError as e:
+                error_handler(e)
+
+        if detached:
+            for sentence in sentences:
+                sentence.detach()
+
+        if not grouped:
+            return sentences
+
+        result = []
+        for size in sizes:
+            result.append(sentences[:size])
+            sentences = sentences[size:]
+        return result
+
+
+_NO_HEAD = -2  #: 의존구조 분석 결과가 없는 어절의 지배소 위치
+_ENUM_ORDINALS = {}  #: Enum class별, 명칭과 순서 번호의 대응표
+
+
+def _enum_ordinals(enum) -> dict:
+    # Enum 값을 처음 사용할 때, 명칭 -> 순서 번호 대응표를 한 번 만들어 둡니다.
+    if enum not in _ENUM_ORDINALS:
+        _ENUM_ORDINALS[enum] = {value.name: value.ordinal for value in enum.values()}
+    return _ENUM_ORDINALS[enum]
+
+
+def _enum_names(enum) -> dict:
+    return {ordinal: name for name, ordinal in _enum_ordinals(enum).items()}
+
+
+def _optional_module(name: str, feature: str):
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError('%s을 사용하려면 %s 패키지를 설치해야 합니다.' % (feature, name))
+
+
+class TaggedBatch(object):
+    """
+    여러 문단의 분석 결과를, 형태소/어절/문장별 Python 객체 대신 열(column) 단위의 배열로 저장하는 class입니다.
+    표면형은 UTF-8 bytes 하나에 이어붙이고, 품사와 의존구조는 정수 배열(array.array)에 저장하므로
+    많은 문단을 분석할 때 메모리와 객체 생성 비용이 적습니다.
+
+    각 열은 Arrow의 가변 길이 배열과 같은 방식으로 저장됩니다. 예를 들어 i번째 형태소의 표면형은
+    ``surfaces[surfaceOffsets[i]:surfaceOffsets[i + 1]]`` 이고, i번째 어절의 형태소들은
+    ``wordOffsets[i]`` 부터 ``wordOffsets[i + 1]`` 직전까지의 형태소입니다.
+
+    아래를 참고해보세요.
+
+    * :py:meth:`koalanlp.proc.Tagger.tagColumnar` 품사 분석 결과를 TaggedBatch로 받는 API
+    * :py:meth:`toNumpy` 각 열을 복사 없이 NumPy 배열로 가져오는 API
+    * :py:meth:`toArrow` 각 열을 복사 없이 Arrow RecordBatch로 가져오는 API
+
+    원본 품사 표기, 의미 어깨번호, 구문구조, 의미역, 개체명은 저장하지 않습니다.
+    """
+    __slots__ = {
+        'surfaces': '형태소 표면형을 모두 이어붙인 UTF-8 bytearray',
+        'surfaceOffsets': '형태소별 표면형의 시작 위치 (int64 array, 길이는 형태소 수 + 1)',
+        'tags': '형태소의 세종 품사 순서 번호 (:py:attr:`koalanlp.types.POS.ordinal`, int32 array)',
+        'wordSurfaces': '어절 표면형을 모두 이어붙인 UTF-8 bytearray',
+        'wordSurfaceOffsets': '어절별 표면형의 시작 위치 (int64 array, 길이는 어절 수 + 1)',
+        'wordOffsets': '어절별 첫 형태소의 위치 (int64 array, 길이는 어절 수 + 1)',
+        'heads': '어절의 지배소 어절의 문장 내 위치 (int32 array). 최상위 어절은 -1, 의존구조 분석 결과가 없으면 -2',
+        'depTypes': '어절이 의존소인 의존구조의 구문구조 표지자 순서 번호 (PhraseTag, int32 array). 없으면 -1',
+        'depLabels': '어절이 의존소인 의존구조의 기능 표지자 순서 번호 (DependencyTag, int32 array). 없으면 -1',
+        'sentenceOffsets': '문장별 첫 어절의 위치 (int64 array, 길이는 문장 수 + 1)',
+        'documentOffsets': '문단별 첫 문장의 위치 (int64 array, 길이는 문단 수 + 1)'
+    }
+
+    def __init__(self):
+        """
+        빈 TaggedBatch를 생성합니다. 분석 결과로부터 만들 때에는 :py:meth:`fromSentences` 를 사용하세요.
+        """
+        self.surfaces = bytearray()
+        self.surfaceOffsets = array('q', [0])
+        self.tags = array('i')
+        self.wordSurfaces = bytearray()
+        self.wordSurfaceOffsets = array('q', [0])
+        self.wordOffsets = array('q', [0])
+        self.heads = array('i')
+        self.depTypes = array('i')
+        self.depLabels = array('i')
+        self.sentenceOffsets = array('q', [0])
+        self.documentOffsets = array('q', [0])
+
+    def __append(self, words, morphs, dependencies):
+        # words: (표면형, 형태소 수)의 목록, morphs: (표면형, 품사 이름)의 목록,
+        # dependencies: (지배소 위치, 의존소 위치, 구문구조 표지자, 기능 표지자)의 목록
+        pos, phrase, dep_tag = _enum_ordinals(POS), _enum_ordinals(PhraseTag), _enum_ordinals(DependencyTag)
+        tags = [pos[tag] for _, tag in morphs]
+
+        heads = [_NO_HEAD] * len(words)
+        dep_types = [-1] * len(words)
+        dep_labels = [-1] * len(words)
+        for governor, dependent, tag, label in dependencies:
+            if dependent is None or heads[dependent] != _NO_HEAD:
+                continue
+
+            heads[dependent] = -1 if governor is None else governor
+            dep_types[dependent] = phrase[tag]
+            dep_labels[dependent] = -1 if label is None else dep_tag[label]
+
+        for surface, _ in morphs:
+            self.surfaces.extend(surface.encode('utf-8'))
+            self.surfaceOffsets.append(len(self.surfaces))
+
+        morph_end = self.wordOffsets[-1]
+        for surface, size in words:
+            self.wordSurfaces.extend(surface.encode('utf-8'))
+            self.wordSurfaceOffsets.append(len(self.wordSurfaces))
+            morph_end += size
+            self.wordOffsets.append(morph_end)
+
+        self.tags.extend(tags)
+        self.heads.extend(heads)
+        self.depTypes.extend(dep_types)
+        self.depLabels.extend(dep_labels)
+        self.sentenceOffsets.append(len(self.heads))
+
+    def __append_sentence(self, sentence):
+        self.__append([(word.surface, len(word)) for word in sentence],
+                      [(morph.surface, morph.tag) for word in sentence for morph in word],
+                      [(edge.governor.id if edge.governor is not None else None,
+                        edge.dependent.id if edge.dependent is not None else None, edge.type, edge.depType)
+                       for edge in sentence.dependencies])
+
+    def __append_payload(self, payload: str) -> bool:
+        # Sentence의 일괄 변환 문자열에서 어절, 형태소, 의존구조만 읽습니다. 잘못된 문자열이면 아무것도 추가하지 않습니다.
+        try:
+            sections = payload.split(_SEP_SECTION)
+            if len(sections) != 7:
+                return False
+
+            words = [(surface, int(size)) for surface, size in _records(sections[0], 2)]
+            morphs = [(surface, tag) for surface, tag, _, _ in _records(sections[1], 4)]
+            if len(words) == 0 or any(size <= 0 for _, size in words) or \
+                    sum(size for _, size in words) != len(morphs):
+                return False
+
+            n_words = len(words)
+            dependencies = [(_index(gov, n_words), _index(dep, n_words), tag, _nullable(dep_tag))
+                            for gov, dep, tag, dep_tag, _ in _records(sections[3], 5)]
+            self.__append(words, morphs, dependencies)
+            return True
+        except (ValueError, KeyError):
+            return False
+
+    def __close_document(self):
+        self.documentOffsets.append(len(self.sentenceOffsets) - 1)
+
+    @staticmethod
+    def fromSentences(sentences, grouped: bool = False):
+        """
+        분석된 문장들을 TaggedBatch로 변환합니다.
+
+        :param Union[List[Sentence],List[List[Sentence]]] sentences: 변환할 문장의 목록. grouped=True이면 문단별 문장 목록의 목록.
+        :param bool grouped: 문단별로 묶인 목록을 변환할 것인지의 여부. False이면 전체를 문단 하나로 봅니다. (기본값 False)
+        :rtype: TaggedBatch
+        :return: 변환된 결과
+        """
+        batch = TaggedBatch()
+        for group in (sentences if grouped else [sentences]):
+            for sentence in group:
+                batch.__append_sentence(sentence)
+            batch.__close_document()
+
+        return batch
+
+    @staticmethod
+    def fromJavaList(ref):
+        """
+        Java 문장 List의 List를 Py4J 통신 1회로 TaggedBatch로 변환합니다. 안쪽 List 하나를 문단 하나로 봅니다.
+        형태소, 어절, 문장마다 Python 객체를 만들지 않습니다.
+
+        :param ref: Java KoalaNLP의 Sentence를 담은 List의 List.
+        :rtype: TaggedBatch
+        :return: 변환된 결과
+        """
+        try:
+            payload = _sentence_list_encoder(True).apply(ref)
+        except JavaError as e:
+            error_handler(e)
+
+        sizes, payload = payload.split(_SEP_SENTENCE, 1)
+        sizes = [int(size) for size in sizes.split(',')] if sizes != '' else []
+        payloads = payload.split(_SEP_SENTENCE)
+        # 문장 사이의 구분 문자가 표면형에 포함된 경우에는, 문장마다 변환합니다.
+        whole = len(payloads) == sum(sizes)
+
+        batch = TaggedBatch()
+        index = 0
+        for i, size in enumerate(sizes):
+            for j in range(size):
+                if not whole or not batch.__append_payload(payloads[index]):
+                    try:
+                        batch.__append_sentence(Sentence.fromJava(_java_item(ref, i, j)))
+                    except JavaError as e:
+                        error_handler(e)
+                index += 1
+            batch.__close_document()
+
+        return batch
+
+    def __len__(self) -> int:
+        """
+        :rtype: int
+        :return: 저장된 문장의 수
+        """
+        return len(self.sentenceOffsets) - 1
+
+    def __getitem__(self, item):
+        """
+        문장을 Sentence 객체로 만들어 가져옵니다. 객체는 가져올 때마다 새로 만듭니다.
+
+        :param Union[int,slice] item: 가져올 문장의 위치
+        :rtype: Union[Sentence,List[Sentence]]
+        :return: 해당 위치의 문장
+        """
+        if type(item) is slice:
+            return [self.__sentence(i) for i in range(*item.indices(len(self)))]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError('TaggedBatch index out of range')
+        return self.__sentence(item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.__sentence(i)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TaggedBatch) and \
+            all(getattr(self, name) == getattr(other, name) for name in TaggedBatch.__slots__)
+
+    def getDocumentCount(self) -> int:
+        """
+        :rtype: int
+        :return: 저장된 문단의 수
+        """
+        return len(self.documentOffsets) - 1
+
+    def getDocument(self, index: int) -> List:
+        """
+        문단에 속한 문장들을 Sentence 객체로 만들어 가져옵니다.
+
+        :param int index: 가져올 문단의 위치
+        :rtype: List[Sentence]
+        :return: 해당 문단의 문장 목록
+        """
+        return self[self.documentOffsets[index]:self.documentOffsets[index + 1]]
+
+    def getSurface(self, index: int) -> str:
+        """
+        :param int index: 형태소의 위치 (전체 형태소 중에서)
+        :rtype: str
+        :return: 해당 형태소의 표면형
+        """
+        return self.surfaces[self.surfaceOffsets[index]:self.surfaceOffsets[index + 1]].decode('utf-8')
+
+    def getWordSurface(self, index: int) -> str:
+        """
+        :param int index: 어절의 위치 (전체 어절 중에서)
+        :rtype: str
+        :return: 해당 어절의 표면형
+        """
+        return self.wordSurfaces[self.wordSurfaceOffsets[index]:self.wordSurfaceOffsets[index + 1]].decode('utf-8')
+
+    def __sentence(self, index: int):
+        pos, phrase, dep_tag = _enum_names(POS), _enum_names(PhraseTag), _enum_names(DependencyTag)
+        begin, end = self.sentenceOffsets[index], self.sentenceOffsets[index + 1]
+
+        words = []
+        for w in range(begin, end):
+            morphs = [Morpheme(surface=self.getSurface(m), tag=pos[self.tags[m]])
+                      for m in range(self.wordOffsets[w], self.wordOffsets[w + 1])]
+            words.append(Word(surface=self.getWordSurface(w), morphemes=morphs))
+        sentence = Sentence(words)
+
+        dependencies = []
+        for w in range(begin, end):
+            head = self.heads[w]
+            if head == _NO_HEAD:
+                continue
+
+            label = self.depLabels[w]
+            dependencies.append(DepEdge(governor=sentence[head] if head >= 0 else None, dependent=sentence[w - begin],
+                                        type=phrase[self.depTypes[w]], depType=dep_tag[label] if label >= 0 else None))
+        sentence.dependencies = dependencies
+        return sentence
+
+    def toNumpy(self) -> dict:
+        """
+        각 열을 NumPy 배열로 가져옵니다. 배열은 데이터를 복사하지 않고 이 객체의 메모리를 그대로 사용합니다.
+
+        :rtype: Dict[str,numpy.ndarray]
+        :return: 열 이름(:py:class:`TaggedBatch` 의 속성 이름)과 배열의 dict. 표면형 열은 uint8 배열입니다.
+        """
+        numpy = _optional_module('numpy', 'TaggedBatch.toNumpy')
+
+        result = {}
+        for name in TaggedBatch.__slots__:
+            values = getattr(self, name)
+            dtype = numpy.uint8 if type(values) is bytearray else numpy.dtype(values.typecode)
+            result[name] = numpy.frombuffer(values, dtype=dtype)
+        return result
+
+    def toArrow(self):
+        """
+        문장을 하나의 행으로 하는 Arrow RecordBatch로 가져옵니다. 배열은 데이터를 복사하지 않고 이 객체의 메모리를 그대로 사용합니다.
+        'words' 열은 어절 struct(surface, head, depType, depLabel, morphemes)의 list이며,
+        'morphemes'는 형태소 struct(surface, tag)의 list입니다.
+
+        :rtype: pyarrow.RecordBatch
+        :return: 문장별 RecordBatch. 문단의 경계는 :py:attr:`documentOffsets` 를 사용하세요.
+        """
+        pa = _optional_module('pyarrow', 'TaggedBatch.toArrow')
+
+        def column(name, arrow_type, size=None):
+            values = getattr(self, name)
+            size = len(values) if size is None else size
+            return pa.Array.from_buffers(arrow_type, size, [None, pa.py_buffer(values)])
+
+        def strings(data, offsets):
+            return pa.Array.from_buffers(pa.large_string(), len(getattr(self, offsets)) - 1,
+                                         [None, pa.py_buffer(getattr(self, offsets)), pa.py_buffer(getattr(self, data))])
+
+        morphemes = pa.StructArray.from_arrays([strings('surfaces', 'surfaceOffsets'), column('tags', pa.int32())],
+                                               ['surface', 'tag'])
+        words = pa.StructArray.from_arrays([strings('wordSurfaces', 'wordSurfaceOffsets'),
+                                            column('heads', pa.int32()), column('depTypes', pa.int32()),
+                                            column('depLabels', pa.int32()),
+                                            pa.LargeListArray.from_arrays(column('wordOffsets', pa.int64()),
+                                                                          morphemes)],
+                                           ['surface', 'head', 'depType', 'depLabel', 'morphemes'])
+        sentences = pa.LargeListArray.from_arrays(column('sentenceOffsets', pa.int64()), words)
+        return pa.RecordBatch.from_arrays([sentences], ['words'])
+
+    def __repr__(self) -> str:
+        return 'TaggedBatch(%d documents, %d sentences, %d words, %d morphemes)' % \
+               (self.getDocumentCount(), len(self), len(self.heads), len(self.tags))
 
 
 # ----- define members exported -----
 
-__all__ = ['Entity', 'CoreferenceGroup', 'SyntaxTree', 'DepEdge', 'RoleEdge', 'Morpheme', 'Word', 'Sentence']
+__all__ = ['Entity', 'CoreferenceGroup', 'SyntaxTree', 'DepEdge', 'RoleEdge', 'Morpheme', 'Word', 'Sentence',
+           'TaggedBatch']
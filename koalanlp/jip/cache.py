@@ -20,8 +20,11 @@
 # SOFTWARE.
 #
 import codecs
+import json
 import os
 import shutil
+import threading
+import time
 
 from koalanlp.jip.repository import MavenRepos
 
@@ -32,8 +35,8 @@ class CacheRepository(MavenRepos):
             basepath = os.getcwd()
 
         uri = os.path.expanduser(os.path.join(str(basepath), '.java', 'cache'))
-        if not os.path.exists(uri):
-            os.makedirs(uri)
+        # several threads or processes may create the same directories at the same time
+        os.makedirs(uri, exist_ok=True)
 
         super(CacheRepository, self).__init__('cache', uri)
 
@@ -46,8 +49,7 @@ class CacheRepository(MavenRepos):
     def get_artifact_dir(self, artifact):
         directory = os.path.join(self.uri, artifact.group,
                                  artifact.artifact)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
         return directory
 
     def download_jar(self, artifact, local_path=None):
@@ -69,19 +71,68 @@ class CacheRepository(MavenRepos):
 
     def put_pom(self, artifact, data):
         path = self.get_artifact_uri(artifact, 'pom')
-        f = codecs.open(path, mode='w', encoding='utf-8')
+        # POMs are fetched concurrently; write to a temporary file first so that readers never see a partial file
+        temp = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+        f = codecs.open(temp, mode='w', encoding='utf-8')
         f.write(data)
         f.close()
+        os.replace(temp, path)
 
     def put_jar(self, artifact, jarpath):
         path = self.get_artifact_uri(artifact, 'jar')
         shutil.copy(jarpath, path)
 
 
+class PomNotFoundCache(object):
+    """ Remembers, across runs, which POMs a remote repository does not have """
+    TTL = 7 * 24 * 3600  # forget after a week, so that newly published artifacts are found again
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.modified = False
+        self.entries = {}
+
+        try:
+            with codecs.open(path, mode='r', encoding='utf-8') as f:
+                entries = json.load(f)
+            now = time.time()
+            self.entries = {key: stamp for key, stamp in entries.items() if now - stamp < self.TTL}
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def key(uri, artifact):
+        return '%s %s' % (uri, artifact.id)
+
+    def contains(self, uri, artifact):
+        return self.key(uri, artifact) in self.entries
+
+    def add(self, uri, artifact):
+        with self.lock:
+            self.entries[self.key(uri, artifact)] = time.time()
+            self.modified = True
+
+    def save(self):
+        with self.lock:
+            if not self.modified:
+                return
+
+            temp = '%s.%d.tmp' % (self.path, os.getpid())
+            try:
+                with codecs.open(temp, mode='w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+                os.replace(temp, self.path)
+                self.modified = False
+            except OSError:
+                pass
+
+
 class CacheManager(object):
     def __init__(self, basepath):
         self.enable = True
         self.cache = CacheRepository(basepath)
+        self.pom_not_found = PomNotFoundCache(os.path.join(self.cache.uri, 'pom_not_found.json'))
 
     def set_enable(self, enable):
         self.enable = enable
@@ -124,4 +175,4 @@ class CacheManager(object):
             return pom_in_cache
 
 
-__all__ = ['CacheManager']
+__all__ = ['CacheManager', 'PomNotFoundCache']
@@ -24,7 +24,7 @@ import sys
 import re
 from xml.etree import ElementTree
 from string import Template, whitespace
-from koalanlp.jip.util import logger
+from koalanlp.jip.util import logger, http_get
 
 
 def _parse_version_string(version: str):
@@ -44,11 +44,8 @@ def _parse_version_string(version: str):
 
 
 def _retrieve_latest_version(group, artifact) -> str:
-    import requests
-    import re
-
     url = 'https://repo1.maven.org/maven2/%s/%s' % (group.replace('.', '/'), artifact)
-    result = requests.get(url).text
+    result = http_get(url).text
     result = [line[0].split('/')[-1]
               for line in re.findall('href="(\\d+\\.\\d+\\.\\d+(-[A-Za-z]+(\\.\\d+)?)?)/"', result)]
     version = max(result, key=_parse_version_string)
@@ -189,11 +186,10 @@ class Pom(object):
                 parent_pom = self.cache_manager.get_artifact_pom(artifact)
             else:
                 parent_pom = None
-                for repos in self.repos_manager.repos:
-                    parent_pom = repos.download_pom(artifact)
-                    if parent_pom is not None:
-                        self.cache_manager.put_artifact_pom(artifact, parent_pom)
-                        break
+                found = self.repos_manager.find_pom(artifact)
+                if found is not None:
+                    parent_pom = found[0]
+                    self.cache_manager.put_artifact_pom(artifact, parent_pom)
 
             if parent_pom is not None:
                 self.parent = Pom(parent_pom, self.repos_manager, self.cache_manager)
@@ -235,11 +231,8 @@ class Pom(object):
             if scope is not None and scope == 'import':
                 artifact = Artifact(group_id, artifact_id, version)
 
-                import_pom = None
-                for repos in self.repos_manager.repos:
-                    import_pom = repos.download_pom(artifact)
-                    if import_pom is not None:
-                        break
+                found = self.repos_manager.find_pom(artifact)
+                import_pom = found[0] if found is not None else None
                 if import_pom is not None:
                     import_pom = Pom(import_pom, self.repos_manager, self.cache_manager)
                     dependency_management_version_dict.update(import_pom.get_dependency_management())
@@ -25,22 +25,24 @@ import locale
 import shutil
 import stat
 import time
-import hashlib
 import sys
 
-import urllib.error as urlerror
-import urllib.request as urlrequest
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from xml.etree import ElementTree
 
-from koalanlp.jip.util import DownloadException, download, download_string, logger
+from koalanlp.jip.util import DownloadException, PARTIAL_SUFFIX, download_file, download_string, file_checksum, http_get, \
+    logger
 
 
 class RepositoryManager(object):
     MAVEN_LOCAL_REPOS = ('local', os.path.expanduser(os.path.join('~', '.m2', 'repository')), 'local')
     MAVEN_PUBLIC_REPOS = ('public', "https://repo1.maven.org/maven2/", 'remote')
+    POM_WORKERS = 16
 
     def __init__(self):
         self.repos = []
+        self.not_found_cache = None
+        self.executor = None
 
         for repo in [self.MAVEN_LOCAL_REPOS, self.MAVEN_PUBLIC_REPOS]:
             # create repos in order
@@ -57,12 +59,61 @@ class RepositoryManager(object):
             sys.exit(1)
 
         if repo not in self.repos:
+            if isinstance(repo, MavenHttpRemoteRepos):
+                repo.not_found_cache = self.not_found_cache
             if order is not None:
                 self.repos.insert(order, repo)
             else:
                 self.repos.append(repo)
             logger.debug('[Repository] Added: %s' % repo.name)
 
+    def set_not_found_cache(self, cache):
+        """ share a persistent record of missing POMs with all remote repositories """
+        self.not_found_cache = cache
+        for repo in self.repos:
+            if isinstance(repo, MavenHttpRemoteRepos):
+                repo.not_found_cache = cache
+
+    def find_pom(self, artifact):
+        """ return (pom, repos) of the first repository that has the pom, or None.
+        Local repositories are checked in order; remote repositories are queried concurrently and the first hit wins. """
+        repos_list = list(self.repos)
+        remote = [repos for repos in repos_list if isinstance(repos, MavenHttpRemoteRepos)]
+        local = [repos for repos in repos_list if repos not in remote]
+
+        # snapshot lookup updates the artifact with the timestamp of the repository, so query them one by one
+        if artifact.is_snapshot() or len(remote) < 2:
+            local = repos_list
+            remote = []
+
+        for repos in local:
+            pom = repos.download_pom(artifact)
+            if pom is not None:
+                return pom, repos
+
+        if len(remote) == 0:
+            return None
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.POM_WORKERS)
+
+        futures = {self.executor.submit(repos.download_pom, artifact): repos for repos in remote}
+        try:
+            for future in as_completed(futures):
+                try:
+                    pom = future.result()
+                except Exception as e:
+                    logger.warning('[Warning] Failed to check pom of %s from %s: %s', artifact, futures[future].name, e)
+                    continue
+
+                if pom is not None:
+                    return pom, futures[future]
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return None
+
 
 class MavenRepos(object):
     def __init__(self, name, uri):
@@ -113,7 +164,9 @@ class MavenFileSystemRepos(MavenRepos):
         if os.path.exists(maven_file_path):
             local_jip_path = os.path.join(local_path, artifact.to_jip_name())
             logger.info("[Downloading] %s" % maven_file_path)
-            shutil.copy(maven_file_path, local_jip_path)
+            # copy next to the target first, so an interrupted copy never looks like an installed jar
+            shutil.copy(maven_file_path, local_jip_path + PARTIAL_SUFFIX)
+            os.replace(local_jip_path + PARTIAL_SUFFIX, local_jip_path)
             logger.info("[Finished] %s completed" % local_jip_path)
         else:
             logger.error("[Error] File not found %s" % maven_file_path)
@@ -144,21 +197,24 @@ class MavenHttpRemoteRepos(MavenRepos):
     def __init__(self, name, uri):
         MavenRepos.__init__(self, name, uri)
         self.pom_cache = {}
-        self.pom_not_found_cache = []
+        self.pom_not_found_cache = set()
+        self.not_found_cache = None
 
     def download_jar(self, artifact, local_path):
         maven_path = self.get_artifact_uri(artifact, 'jar')
         logger.info('[Downloading] jar from %s' % maven_path)
         local_jip_path = os.path.join(local_path, artifact.to_jip_name())
-        local_f = open(local_jip_path, 'wb')
-        # download jar asyncly
-        download(maven_path, local_f, True)
-        # self.logger.info('[Finished] %s downloaded ' % maven_path)
+        # download jar asyncly; it appears at local_jip_path only after its checksum is verified
+        download_file(maven_path, local_jip_path, True)
 
     def download_pom(self, artifact):
         if artifact in self.pom_not_found_cache:
             return None
 
+        if self.not_found_cache is not None and self.not_found_cache.contains(self.uri, artifact):
+            self.pom_not_found_cache.add(artifact)
+            return None
+
         if artifact in self.pom_cache:
             return self.pom_cache[artifact]
 
@@ -177,8 +233,11 @@ class MavenHttpRemoteRepos(MavenRepos):
             self.pom_cache[artifact] = data
 
             return data
-        except DownloadException:
-            self.pom_not_found_cache.append(artifact)
+        except DownloadException as e:
+            self.pom_not_found_cache.add(artifact)
+            if self.not_found_cache is not None and e.is_not_found():
+                # remember only real 404s; network failures should be retried next time
+                self.not_found_cache.add(self.uri, artifact)
             logger.info('[Skipped] Pom file not found at %s' % maven_path)
             return None
 
@@ -215,19 +274,16 @@ class MavenHttpRemoteRepos(MavenRepos):
 
     def last_modified(self, artifact):
         metadata_path = self.get_metadata_path(artifact)
-        try:
-            fd = urlrequest.urlopen(metadata_path)
-            if 'last-modified' in fd.headers:
-                ts = fd.headers['last-modified']
-                fd.close()
+        with http_get(metadata_path, stream=True) as response:
+            if response.status_code >= 400:
+                return None
+            if 'last-modified' in response.headers:
+                ts = response.headers['last-modified']
                 locale.setlocale(locale.LC_TIME, 'en_US')
                 last_modified = time.strptime(ts, '%a, %d %b %Y %H:%M:%S %Z')
                 return time.mktime(last_modified)
             else:
-                fd.close()
                 return 0
-        except urlerror.HTTPError:
-            return None
 
     def download_check_sum(self, checksum_type, origin_file_name):
         """ return pre calculated checksum value, only avaiable for remote repos """
@@ -239,22 +295,9 @@ class MavenHttpRemoteRepos(MavenRepos):
 
     @staticmethod
     def checksum(filepath, checksum_type):
-        if checksum_type == 'md5':
-            hasher = hashlib.md5()
-        elif checksum_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
+        if checksum_type not in ('md5', 'sha1'):
             raise ValueError()
-
-        buf_size = 1024 * 8
-        file_to_check = open(filepath, 'r')
-        buf = file_to_check.read(buf_size)
-        while len(buf) > 0:
-            hasher.update(buf)
-            buf = file_to_check.read(buf_size)
-
-        file_to_check.close()
-        return hasher.hexdigest()
+        return file_checksum(filepath, checksum_type)
 
 
 __all__ = ['RepositoryManager']
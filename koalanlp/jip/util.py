@@ -20,15 +20,30 @@
 # SOFTWARE.
 #
 
+import os
 import sys
 import time
 import queue
+import hashlib
 import threading
 import logging
 
 JIP_USER_AGENT = 'jip-koalanlp/1.0'
 BUF_SIZE = 4096
 
+# HTTP transport settings (see configure_session)
+POOL_CONNECTIONS = 8  # number of hosts to keep connection pools for
+POOL_MAXSIZE = 16  # keep-alive connections per host
+TIMEOUT = (10, 60)  # (connect, read) seconds
+MAX_RETRIES = 3  # retries on connection errors and 429/5xx answers
+BACKOFF_FACTOR = 0.5  # seconds; doubled on every retry
+
+# JAR download settings (see configure_downloads)
+DOWNLOAD_WORKERS = 3  # files downloaded at the same time
+PROGRESS_INTERVAL = 5  # seconds between progress reports
+PARTIAL_SUFFIX = '.part'  # must not end with '.jar', or IndexManager takes it as installed
+CHECKSUM_TYPES = ('sha1', 'md5')  # checksum files looked up next to a jar, in this order
+
 # Logging setup
 logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
 logging.getLogger("requests").setLevel(logging.WARNING)
@@ -37,7 +52,67 @@ logger = logging.getLogger('koalanlp.jip')
 
 
 class DownloadException(Exception):
-    pass
+    def is_not_found(self):
+        """ True if the server answered that the file does not exist (not a network failure) """
+        error = self.args[1] if len(self.args) > 1 else None
+        response = getattr(error, 'response', None)
+        return response is not None and response.status_code in (404, 410)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def configure_session(pool_connections=None, pool_maxsize=None, timeout=None, max_retries=None, backoff_factor=None):
+    """ change the HTTP transport settings; the shared session is rebuilt on the next request """
+    global POOL_CONNECTIONS, POOL_MAXSIZE, TIMEOUT, MAX_RETRIES, BACKOFF_FACTOR, _session
+
+    with _session_lock:
+        if pool_connections is not None:
+            POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            POOL_MAXSIZE = pool_maxsize
+        if timeout is not None:
+            TIMEOUT = timeout
+        if max_retries is not None:
+            MAX_RETRIES = max_retries
+        if backoff_factor is not None:
+            BACKOFF_FACTOR = backoff_factor
+
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def session():
+    """ shared requests.Session that keeps connections to the Maven hosts alive and retries failed requests """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(total=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR,
+                              status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                                      max_retries=retry)
+
+                new_session = requests.Session()
+                new_session.headers['User-Agent'] = JIP_USER_AGENT
+                new_session.mount('http://', adapter)
+                new_session.mount('https://', adapter)
+                _session = new_session
+
+    return _session
+
+
+def http_get(url, **kwargs):
+    """ GET through the shared session, with the default timeout """
+    kwargs.setdefault('timeout', TIMEOUT)
+    return session().get(url, **kwargs)
 
 
 def download(url, target, asynchronous=False, close_target=False, quiet=True):
@@ -49,14 +124,13 @@ def download(url, target, asynchronous=False, close_target=False, quiet=True):
     else:
         try:
             t0 = time.time()
-            source = requests.get(url, headers={'User-Agent': JIP_USER_AGENT})
-            source.raise_for_status()
-            size = source.headers['Content-Length']
-            if not quiet:
-                logger.info('[Downloading] %s %s bytes to download' % (url, size))
-            for buf in source.iter_content(BUF_SIZE):
-                target.write(buf)
-            source.close()
+            with http_get(url, stream=True) as source:
+                source.raise_for_status()
+                size = source.headers.get('Content-Length', 'unknown')
+                if not quiet:
+                    logger.info('[Downloading] %s %s bytes to download' % (url, size))
+                for buf in source.iter_content(BUF_SIZE):
+                    target.write(buf)
             if close_target:
                 target.close()
             t1 = time.time()
@@ -70,7 +144,7 @@ def download(url, target, asynchronous=False, close_target=False, quiet=True):
 def download_string(url):
     import requests
     try:
-        response = requests.get(url, headers={'User-Agent': JIP_USER_AGENT})
+        response = http_get(url)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException:
@@ -78,38 +152,223 @@ def download_string(url):
         raise DownloadException(url, e)
 
 
+def file_checksum(path, checksum_type):
+    """ hex digest of a file; checksum_type is a hashlib name such as 'sha1' or 'md5' """
+    hasher = hashlib.new(checksum_type)
+    with open(path, 'rb') as f:
+        for buf in iter(lambda: f.read(BUF_SIZE * 16), b''):
+            hasher.update(buf)
+    return hasher.hexdigest()
+
+
+def _published_checksum(url):
+    # (type, hex digest) from the .sha1/.md5 file next to url; (None, None) if none is published
+    for checksum_type in CHECKSUM_TYPES:
+        try:
+            # some repositories append the file name after the digest
+            digest = download_string(url + '.' + checksum_type).split()
+        except DownloadException:
+            continue
+        if digest:
+            return checksum_type, digest[0].lower()
+    return None, None
+
+
+def _fetch_partial(url, partial, progress):
+    # continue (or start) writing url into partial, resuming from its current size with a Range request
+    offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+    headers = {'Range': 'bytes=%d-' % offset} if offset > 0 else {}
+
+    with http_get(url, stream=True, headers=headers) as source:
+        if offset > 0 and source.status_code == 416:
+            # nothing left to fetch; the checksum tells whether the partial file is really complete
+            return
+        source.raise_for_status()
+        if source.status_code != 206:
+            # the server ignored the Range header and sends the whole file
+            offset = 0
+
+        size = source.headers.get('Content-Length')
+        size = offset + int(size) if size is not None else None
+        logger.info('[Downloading] %s %s bytes to download' % (url, size if size is not None else 'unknown'))
+        if progress is not None:
+            progress.start(offset, size)
+        if offset > 0:
+            logger.info('[Downloading] Resuming %s from byte %d' % (url, offset))
+
+        with open(partial, 'ab' if offset > 0 else 'wb') as target:
+            for buf in source.iter_content(BUF_SIZE * 16):
+                target.write(buf)
+                if progress is not None:
+                    progress.advance(len(buf))
+
+
+def download_file(url, path, asynchronous=False, progress=None):
+    """ download url to the file path.
+    The data goes to path + PARTIAL_SUFFIX first, so an interrupted download resumes where it stopped,
+    and it is moved to path only after it matches the checksum the repository publishes.
+    progress (a DownloadThreadPool) is told about every byte and finished file """
+    import requests
+
+    if asynchronous:
+        pool.submit_file(url, path)
+        return
+
+    partial = path + PARTIAL_SUFFIX
+    for _ in range(2):
+        try:
+            _fetch_partial(url, partial, progress)
+        except requests.exceptions.RequestException:
+            _, e, _ = sys.exc_info()
+            raise DownloadException(url, e)
+
+        checksum_type, expected = _published_checksum(url)
+        if expected is None:
+            logger.warning('[Warning] No checksum published for %s, skipped verification' % url)
+        elif file_checksum(partial, checksum_type) != expected:
+            # a corrupted or stale partial file; start over from the first byte once
+            logger.warning('[Warning] %s checksum mismatch for %s, downloading again' % (checksum_type, url))
+            os.remove(partial)
+            continue
+
+        os.replace(partial, path)
+        logger.info('[Finished] %s verified and installed' % path)
+        if progress is not None:
+            progress.finish()
+        return
+
+    raise DownloadException(url, 'checksum mismatch')
+
+
+def configure_downloads(workers=None, progress_interval=None):
+    """ change the number of parallel JAR downloads and how often their progress is reported """
+    global DOWNLOAD_WORKERS, PROGRESS_INTERVAL
+
+    if workers is not None:
+        if workers < 1:
+            raise ValueError('workers must be positive: %d' % workers)
+        DOWNLOAD_WORKERS = workers
+        pool.resize(workers)
+    if progress_interval is not None:
+        PROGRESS_INTERVAL = progress_interval
+
+
 def wait_until_download_finished():
-    pool.join()
+    """ wait for the asynchronous downloads; raise the first failure and return the download statistics """
+    return pool.join()
 
 
 class DownloadThreadPool(object):
     def __init__(self, size=3):
+        self.size = size
         self.queue = queue.Queue()
-        self.workers = [threading.Thread(target=self._do_work) for _ in range(size)]
-        self.initialized = False
+        self.workers = 0
+        self.lock = threading.Lock()
+        self.errors = []
+        self._reset()
+
+    def _reset(self):
+        self.files = 0
+        self.finished = 0
+        self.bytes = 0
+        self.total_bytes = 0
+        self.started_at = None
+        self.reported_at = 0
 
     def init_threads(self):
-        for worker in self.workers:
-            worker.setDaemon(True)
-            worker.start()
-        self.initialized = True
+        with self.lock:
+            while self.workers < self.size:
+                threading.Thread(target=self._do_work, daemon=True).start()
+                self.workers += 1
+
+    def resize(self, size):
+        self.size = size
+        with self.lock:
+            # surplus workers stop when they take a None task
+            for _ in range(self.workers - size):
+                self.queue.put(None)
+            self.workers = min(self.workers, size)
 
     def _do_work(self):
         while True:
-            url, target = self.queue.get()
-            download(url, target, close_target=True, quiet=False)
-            self.queue.task_done()
+            task = self.queue.get()
+            try:
+                if task is None:
+                    return
+                task()
+            except Exception:
+                _, e, _ = sys.exc_info()
+                logger.error('[Error] %s' % str(e))
+                with self.lock:
+                    self.errors.append(e)
+            finally:
+                self.queue.task_done()
 
     def join(self):
         self.queue.join()
 
+        with self.lock:
+            stats = self.stats()
+            errors = self.errors
+            self.errors = []
+            self._reset()
+
+        if stats['files'] > 0:
+            logger.info('[Finished] %d/%d files, %.1f MB in %.1f secs (%.1f MB/s)' %
+                        (stats['finished'], stats['files'], stats['bytes'] / 1e6, stats['elapsed'],
+                         stats['throughput'] / 1e6))
+        if errors:
+            raise errors[0]
+        return stats
+
     def submit(self, url, target):
-        if not self.initialized:
-            self.init_threads()
-        self.queue.put((url, target))
+        self._put(lambda: download(url, target, close_target=True, quiet=False))
+
+    def submit_file(self, url, path):
+        self._put(lambda: download_file(url, path, progress=self))
+
+    def _put(self, task):
+        self.init_threads()
+        with self.lock:
+            self.files += 1
+            if self.started_at is None:
+                self.started_at = self.reported_at = time.time()
+        self.queue.put(task)
+
+    # progress of the download_file tasks
+    def start(self, offset, size):
+        with self.lock:
+            self.bytes += offset
+            if size is not None:
+                self.total_bytes += size
+
+    def advance(self, size):
+        with self.lock:
+            self.bytes += size
+            now = time.time()
+            if now - self.reported_at < PROGRESS_INTERVAL:
+                return
+            self.reported_at = now
+            stats = self.stats()
+
+        logger.info('[Progress] %d/%d files, %.1f/%.1f MB (%.1f MB/s)' %
+                    (stats['finished'], stats['files'], stats['bytes'] / 1e6, stats['total_bytes'] / 1e6,
+                     stats['throughput'] / 1e6))
+
+    def finish(self):
+        with self.lock:
+            self.finished += 1
+
+    def stats(self):
+        """ files submitted/finished, bytes downloaded/expected, elapsed seconds and bytes per second """
+        elapsed = time.time() - self.started_at if self.started_at is not None else 0.0
+        return {'files': self.files, 'finished': self.finished, 'bytes': self.bytes,
+                'total_bytes': self.total_bytes, 'elapsed': elapsed,
+                'throughput': self.bytes / elapsed if elapsed > 0 else 0.0}
 
 
-pool = DownloadThreadPool(3)
+pool = DownloadThreadPool(DOWNLOAD_WORKERS)
 
 
-__all__ = ['DownloadException', 'download', 'download_string', 'wait_until_download_finished', 'logger']
+__all__ = ['DownloadException', 'configure_session', 'session', 'http_get', 'download', 'download_string',
+           'file_checksum', 'download_file', 'configure_downloads', 'wait_until_download_finished', 'logger']
@@ -2,25 +2,75 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import threading
 from typing import List, Dict, Tuple, Optional
-from py4j.java_gateway import JavaGateway, GatewayParameters, CallbackServerParameters, launch_gateway, \
-    DEFAULT_PYTHON_PROXY_PORT
-from py4j.java_collections import JavaArray
-from py4j.protocol import Py4JJavaError as JavaError
+from py4j.java_gateway import JavaGateway, GatewayClient, GatewayParameters, CallbackServerParameters, \
+    CallbackConnection, launch_gateway, DEFAULT_PYTHON_PROXY_PORT
+from py4j.protocol import Py4JJavaError as JavaError, get_return_value
 
 _CLASS_DIC = {}
+_HANDLE_DIC = {}
 GATEWAY = None
 
+NULL_MARK = '\x00'  #: JVM에서 일괄 변환한 문자열에서 null 값을 나타내는 표지
+_NULL_ANSWER = '!yn\n'  # Py4J 응답 형식으로 표현한 null 값
+
 
 def is_jvm_running():
     global GATEWAY
     return GATEWAY is not None
 
 
-def start_jvm(option, classpath, port: int = None):
+class _PooledGatewayClient(GatewayClient):
+    """
+    Java와의 연결을 최대 pool_size개까지 미리 열어두고 나누어 쓰는 GatewayClient입니다.
+    각 스레드는 명령을 보내는 동안 연결 하나를 혼자 사용하며, pool_size개의 연결이 모두 사용 중이면 반납될 때까지 기다립니다.
+    단, Java가 호출한 Python 함수(callback)에서 보내는 명령은 기다리지 않습니다. 그 callback을 부른 명령이 이미 자리를 차지한 채
+    callback이 끝나기를 기다리고 있으므로, 기다리면 서로를 기다리며 멈추게 됩니다.
+    """
+
+    def __init__(self, pool_size: int, **kwargs):
+        super().__init__(**kwargs)
+        self.pool_size = pool_size
+        self.__slots = threading.BoundedSemaphore(pool_size)
+        self.__holding = threading.local()
+
+    def warm_up(self):
+        # 연결을 미리 열어두어, 처음 동시에 들어오는 요청이 연결을 맺느라 기다리지 않게 합니다.
+        connections = [self._get_connection() for _ in range(self.pool_size - len(self.deque))]
+        for connection in connections:
+            self._give_back_connection(connection)
+
+    def send_command(self, command, retry=True, binary=False):
+        # 재시도처럼 같은 스레드 안에서 다시 호출되는 경우에는 이미 얻은 자리를 그대로 사용합니다.
+        # Callback server의 스레드에서 보내는 명령은, 그 callback을 부른 명령의 자리를 빌려 쓰는 것으로 봅니다.
+        if getattr(self.__holding, 'slot', False) or isinstance(threading.current_thread(), CallbackConnection):
+            return super().send_command(command, retry=retry, binary=binary)
+
+        with self.__slots:
+            self.__holding.slot = True
+            try:
+                return super().send_command(command, retry=retry, binary=binary)
+            finally:
+                self.__holding.slot = False
+
+
+class _PooledJavaGateway(JavaGateway):
+    def __init__(self, pool_size: int, **kwargs):
+        self.__pool_size = pool_size
+        super().__init__(**kwargs)
+
+    def _create_gateway_client(self):
+        return _PooledGatewayClient(self.__pool_size, gateway_parameters=self.gateway_parameters)
+
+
+def start_jvm(option, classpath, port: int = None, pool_size: int = None):
     import os
     global GATEWAY
 
+    if pool_size is not None and pool_size < 1:
+        raise ValueError('pool_size는 1 이상이어야 합니다.')
+
     jarpath = None
     for path in classpath:
         if 'py4j' in path:
@@ -33,11 +83,59 @@ def start_jvm(option, classpath, port: int = None):
     if port is None:
         port = DEFAULT_PYTHON_PROXY_PORT
     logging.info("Callback server will use port number %s", port)
-    GATEWAY = JavaGateway(gateway_parameters=GatewayParameters(port=gateway_port, auto_close=True),
-                          callback_server_parameters=CallbackServerParameters(port=port))
+
+    parameters = dict(gateway_parameters=GatewayParameters(port=gateway_port, auto_close=True),
+                      callback_server_parameters=CallbackServerParameters(port=port))
+    if pool_size is None:
+        GATEWAY = JavaGateway(**parameters)
+    else:
+        GATEWAY = _PooledJavaGateway(pool_size, **parameters)
+        GATEWAY._gateway_client.warm_up()
+        logging.info("Gateway connection pool opened %s connections", pool_size)
+
     return is_jvm_running()
 
 
+def gateway_pool_size() -> Optional[int]:
+    """
+    Java와 동시에 사용할 수 있는 연결의 수를 돌려줍니다.
+
+    :rtype: Optional[int]
+    :return: 연결 pool을 사용하는 경우 pool의 크기. 제한 없이 필요할 때마다 연결하는 경우 None.
+    """
+    return getattr(GATEWAY._gateway_client, 'pool_size', None) if is_jvm_running() else None
+
+
+def jvm_memory(collect: bool = False) -> Dict[str, int]:
+    """
+    JVM의 heap 사용량과, Python 쪽에서 참조하고 있어 JVM이 정리할 수 없는 Java 객체의 수를 돌려줍니다.
+
+    :param bool collect: True이면 Python과 JVM의 garbage collection을 먼저 실행합니다. (기본값 False)
+    :rtype: Dict[str,int]
+    :return: 'heapUsed', 'heapTotal', 'heapMax' (byte 단위)와 'gatewayObjects' (Py4J가 Python을 위해 보관 중인 Java 객체의 수.
+             측정에 사용하는 객체 몇 개가 포함됩니다.)
+    """
+    from gc import collect as collect_python
+
+    if collect:
+        # Python 객체가 정리되어야 Py4J가 Java 객체를 놓으므로, Python 쪽을 먼저 정리합니다.
+        collect_python()
+        class_of('java.lang.System').gc()
+
+    try:
+        objects = GATEWAY.java_gateway_server.getGateway().getBindings().size()
+        runtime = class_of('java.lang.Runtime').getRuntime()
+        total = runtime.totalMemory()
+        return {
+            'heapUsed': total - runtime.freeMemory(),
+            'heapTotal': total,
+            'heapMax': runtime.maxMemory(),
+            'gatewayObjects': objects
+        }
+    except JavaError as e:
+        error_handler(e)
+
+
 def check_jvm():
     class_of('java.lang.String')('123')
 
@@ -53,6 +151,7 @@ def shutdown_jvm():
 
     # Remove cached class dictionary
     _CLASS_DIC.clear()
+    _HANDLE_DIC.clear()
 
     # Execute garbage collection
     collect()
@@ -65,13 +164,15 @@ def class_of(*path):
     strpath = '.'.join(path)
     level = GATEWAY.jvm
 
-    if strpath not in _CLASS_DIC:
+    cls = _CLASS_DIC.get(strpath)
+    if cls is None:
         for package in path:
             level = level.__getattr__(package)
 
-        _CLASS_DIC[strpath] = level
+        # 여러 스레드가 동시에 찾은 경우에도, 먼저 등록된 값을 함께 사용합니다.
+        cls = _CLASS_DIC.setdefault(strpath, level)
 
-    return _CLASS_DIC[strpath]
+    return cls
 
 
 def koala_class_of(*path):
@@ -97,29 +198,30 @@ def koala_cast_of(obj, *path):
 
 
 def string(s: str):
+    # Py4J는 Python str을 Java String으로 자동 변환하므로, Java 객체가 별도로 필요하지 않다면 str을 그대로 넘기는 것이 좋습니다.
+    # 이 함수는 Java 생성자를 호출하므로 통신이 1회 더 발생합니다.
+    # 길이 1인 문자열이 char 인자를 받는 메서드로 연결되는 것을 막아야 하는 경우에만 사용합니다.
     return class_of('java.lang.String')(s) if s is not None else None
 
 
-def py_list(result, item_converter) -> List:
+def py_list(result, item_converter, encoder=None) -> List:
+    """
+    Java의 Collection 또는 배열을 Python list로 변환합니다. 원소 개수와 관계없이 Py4J 통신 1회로 모든 원소를 가져옵니다.
+
+    :param result: 변환할 Java Collection이나 배열 (Python list인 경우 그대로 사용)
+    :param item_converter: 각 원소를 변환할 함수
+    :param encoder: 원소를 변환할 :py:func:`java_list_encoder` 결과. (기본값: None = 원소를 그대로 가져옴)
+    :rtype: List
+    :return: 변환된 list
+    """
     if result is None:
         return []
 
-    if type(result) is JavaArray:
-        items = []
-
-        length = len(result)
-        for i in range(length):
-            items.append(result[i])
+    if type(result) is not list:
+        if encoder is None:
+            encoder = java_cached('jvm.py_list', java_list_encoder)
 
-        result = items
-    elif type(result) is not list:
-        items = []
-
-        it = result.iterator()
-        while it.hasNext():
-            items.append(it.next())
-
-        result = items
+        result = _py_answers(encoder.apply(result))
 
     return [item_converter(item) for item in result]
 
@@ -132,13 +234,14 @@ def py_triple(result) -> Optional[Tuple]:
 
 
 def py_dict(result, key_converter=None, value_converter=None) -> Dict:
-    dic = {}
-    keys = result.keySet().toArray()
+    def build():
+        entry = class_of('java.lang.Class').forName('java.util.Map$Entry')
+        return java_list_encoder(java_answer(entry, 'getKey'), java_answer(entry, 'getValue'))
 
-    for key in keys:
+    dic = {}
+    for key, value in py_list(result.entrySet(), lambda t: t, encoder=java_cached('jvm.py_dict', build)):
         py_key = key_converter(key) if key_converter is not None else key
-        py_value = result.get(key)
-        py_value = value_converter(py_value) if value_converter is not None else py_value
+        py_value = value_converter(value) if value_converter is not None else value
 
         dic[py_key] = py_value
 
@@ -197,6 +300,317 @@ def java_varargs(pylist, java_class):
     return varargs
 
 
+# ----- JVM 내부 일괄 처리용 MethodHandle 조합 -----
+# 아래 함수들은 java.lang.invoke의 MethodHandle을 조합하여, 여러 번의 getter 호출을 JVM 내부에서 한 번에 처리합니다.
+# 만들어지는 handle은 모두 (Object)String 형태이며, 조합 결과는 JVM이 종료될 때까지 재사용됩니다.
+
+def java_cached(key, factory):
+    """
+    JVM이 종료될 때까지 유지할 객체를 생성하거나, 이미 생성된 객체를 가져옵니다.
+
+    :param key: 객체를 구분할 key
+    :param factory: 객체를 생성할 함수
+    :return: 생성된 객체
+    """
+    handle = _HANDLE_DIC.get(key)
+    if handle is None:
+        # 여러 스레드가 동시에 생성한 경우에도, 먼저 등록된 객체를 함께 사용합니다.
+        handle = _HANDLE_DIC.setdefault(key, factory())
+
+    return handle
+
+
+def java_class(*path):
+    return class_of(*path)._java_lang_class
+
+
+def _method_handles():
+    return class_of('java.lang.invoke.MethodHandles')
+
+
+def _method_of(owner, name, *param_types):
+    method = owner.getMethod(name, java_varargs(list(param_types), class_of('java.lang.Class')))
+    return _method_handles().publicLookup().unreflect(method)
+
+
+def _as_object_string(handle):
+    return handle.asType(class_of('java.lang.invoke.MethodType').methodType(java_class('java.lang.String'),
+                                                                           java_class('java.lang.Object')))
+
+
+def _null_safe(handle, null_value: str = NULL_MARK):
+    # handle이 받는 인자가 null이면 null_value를 돌려주도록 합니다.
+    arg_type = handle.type().parameterType(0)
+    if arg_type.isPrimitive():
+        return handle
+
+    handles = _method_handles()
+    is_null = _method_of(java_class('java.util.Objects'), 'isNull', java_class('java.lang.Object'))
+    is_null = is_null.asType(handle.type().changeReturnType(class_of('java.lang.Boolean').TYPE))
+    null_value = handles.dropArguments(handles.constant(java_class('java.lang.String'), null_value), 0,
+                                       java_varargs([arg_type], class_of('java.lang.Class')))
+    return handles.guardWithTest(is_null, null_value, handle)
+
+
+def java_getter(owner, *names, tail=None, null_value: str = NULL_MARK):
+    """
+    owner 객체에서 getter를 연달아 호출하고, 그 결과를 문자열로 변환하는 handle을 만듭니다.
+    중간에 null 값을 만나면 null_value를 돌려줍니다.
+
+    :param owner: getter를 호출할 객체의 java.lang.Class
+    :param Union[str,MethodHandle] names: 순서대로 호출할 getter 이름들 또는 :py:func:`java_call` 결과 (가변인자)
+    :param tail: 마지막 getter의 결과를 문자열로 변환할 (Object)String 형태의 MethodHandle. (기본값: None = Objects.toString)
+    :param str null_value: null 값 대신 돌려줄 문자열. (기본값: :py:data:`NULL_MARK`)
+    :return: (Object)String 형태의 MethodHandle
+    """
+    handles = _method_handles()
+    getters = []
+    for name in names:
+        getter = _method_of(owner, name) if type(name) is str else name
+        getters.append(getter)
+        owner = getter.type().returnType()
+
+    if tail is None:
+        tail = _method_of(java_class('java.util.Objects'), 'toString',
+                          java_class('java.lang.Object'), java_class('java.lang.String'))
+        tail = handles.insertArguments(tail, 1, java_varargs([null_value], class_of('java.lang.Object')))
+
+    # 뒤에서부터 앞 getter의 결과를 뒷 handle의 인자로 넘기도록 연결합니다.
+    handle = tail
+    for getter in reversed(getters):
+        handle = handle.asType(handle.type().changeParameterType(0, getter.type().returnType()))
+        handle = handles.filterReturnValue(getter, _null_safe(handle, null_value))
+
+    return _as_object_string(handle)
+
+
+def java_call(owner, name: str, *args):
+    """
+    owner 객체의 메서드에 인자를 고정하여, 객체만 받는 handle을 만듭니다. :py:func:`java_getter` 의 getter로 사용할 수 있습니다.
+    인자 개수가 같은 public 메서드 중 처음 찾은 메서드를 사용합니다.
+
+    :param owner: 메서드를 호출할 객체의 java.lang.Class
+    :param str name: 메서드 이름
+    :param args: 고정할 인자 값들 (가변인자)
+    :return: (owner)결과 형태의 MethodHandle
+    """
+    def build():
+        method_class = java_class('java.lang.reflect.Method')
+        return java_list_encoder(java_answer(), java_answer(method_class, 'getName'),
+                                 java_answer(method_class, 'getParameterCount'))
+
+    methods = [method for method, method_name, arity in py_list(owner.getMethods(), lambda t: t,
+                                                                encoder=java_cached('jvm.methods', build))
+               if method_name == name and arity == len(args)]
+    if len(methods) == 0:
+        raise AttributeError('%s has no public method %s with %s arguments' % (owner.getName(), name, len(args)))
+
+    method = _method_handles().publicLookup().unreflect(methods[0])
+    return _method_handles().insertArguments(method, 1, java_varargs(list(args), class_of('java.lang.Object')))
+
+
+def java_joining(element, delimiter: str, flatten: bool = False):
+    """
+    Java Collection의 각 원소를 element handle로 변환한 다음, delimiter로 이어붙이는 handle을 만듭니다.
+
+    :param element: 원소를 변환할 (Object)String 형태의 MethodHandle
+    :param str delimiter: 원소 사이의 구분자
+    :param bool flatten: Collection의 Collection인 경우, 한 단계 펼쳐서 원소를 처리할지의 여부 (기본값 False)
+    :return: (Object)String 형태의 MethodHandle
+    """
+    handles = _method_handles()
+    stream_class = java_class('java.util.stream.Stream')
+    function_class = java_class('java.util.function.Function')
+    as_function = class_of('java.lang.invoke.MethodHandleProxies').asInterfaceInstance
+
+    to_stream = _method_of(java_class('java.util.Collection'), 'stream')
+    mapper = handles.insertArguments(_method_of(stream_class, 'map', function_class), 1,
+                                     java_varargs([as_function(function_class, element)],
+                                                  class_of('java.lang.Object')))
+    collector = handles.insertArguments(_method_of(stream_class, 'collect',
+                                                   java_class('java.util.stream.Collector')), 1,
+                                        java_varargs([class_of('java.util.stream.Collectors').joining(delimiter)],
+                                                     class_of('java.lang.Object')))
+
+    handle = to_stream
+    if flatten:
+        flat_mapper = handles.insertArguments(_method_of(stream_class, 'flatMap', function_class), 1,
+                                              java_varargs([as_function(function_class, to_stream)],
+                                                           class_of('java.lang.Object')))
+        handle = handles.filterReturnValue(handle, flat_mapper)
+
+    handle = handles.filterReturnValue(handles.filterReturnValue(handle, mapper), collector)
+    return _null_safe(_as_object_string(handle))
+
+
+def java_concat(delimiter: str, *parts):
+    """
+    같은 객체에 여러 handle을 적용한 결과를 delimiter로 이어붙이는 handle을 만듭니다.
+
+    :param str delimiter: 결과 사이의 구분자
+    :param parts: 적용할 (Object)String 형태의 MethodHandle들 (가변인자)
+    :return: (Object)String 형태의 MethodHandle
+    """
+    handles = _method_handles()
+    char_sequence = java_class('java.lang.CharSequence')
+    char_sequence_array = class_of('java.lang.Class').forName('[Ljava.lang.CharSequence;')
+
+    join = _method_of(java_class('java.lang.String'), 'join', char_sequence, char_sequence_array)
+    join = handles.insertArguments(join, 0, java_varargs([delimiter], class_of('java.lang.Object')))
+    join = join.asCollector(char_sequence_array, len(parts))
+
+    parts = [part.asType(part.type().changeReturnType(char_sequence)) for part in parts]
+    handle = handles.filterArguments(join, 0, java_varargs(parts, class_of('java.lang.invoke.MethodHandle')))
+
+    # 모든 인자 자리에 같은 객체(0번째 인자)를 넣습니다.
+    new_type = class_of('java.lang.invoke.MethodType').methodType(java_class('java.lang.String'),
+                                                                  java_class('java.lang.Object'))
+    return handles.permuteArguments(handle, new_type, GATEWAY.new_array(GATEWAY.jvm.int, len(parts)))
+
+
+def java_function(handle):
+    """
+    MethodHandle을 java.util.function.Function 객체로 바꿉니다. 결과 객체의 apply 호출은 Py4J 통신 1회로 처리됩니다.
+
+    :param handle: (Object)Object 형태로 변환 가능한 MethodHandle
+    :return: java.util.function.Function 객체
+    """
+    return class_of('java.lang.invoke.MethodHandleProxies').asInterfaceInstance(
+        java_class('java.util.function.Function'), handle)
+
+
+def java_answer(owner=None, *names, tail=None):
+    """
+    owner 객체에서 getter를 연달아 호출한 결과를, Py4J가 응답을 보낼 때와 같은 형식의 문자열 한 줄로 변환하는 handle을 만듭니다.
+    Java 객체는 Py4J에 등록되어 참조로 전달되므로, 여러 객체의 참조를 한 번에 가져올 수 있습니다.
+
+    :param owner: getter를 호출할 객체의 java.lang.Class. (기본값: None = 객체 자체를 변환)
+    :param str names: 순서대로 호출할 getter 이름들 (가변인자)
+    :param tail: 마지막 getter의 결과를 변환할 (Object)String 형태의 MethodHandle. (기본값: None = Py4J 응답 형식)
+    :return: (Object)String 형태의 MethodHandle
+    """
+    if tail is None:
+        gateway = GATEWAY.java_gateway_server.getGateway()
+        answer = _method_of(java_class('py4j.Gateway'), 'getReturnObject', java_class('java.lang.Object'))
+        command = _method_of(java_class('py4j.Protocol'), 'getOutputCommand', java_class('py4j.ReturnObject'))
+        tail = _method_handles().filterReturnValue(answer.bindTo(gateway), command)
+
+    if owner is None:
+        return _as_object_string(tail)
+
+    return java_getter(owner, *names, tail=tail, null_value=_NULL_ANSWER)
+
+
+def java_list_encoder(*fields):
+    """
+    Java Collection이나 배열의 모든 원소를 Py4J 응답 형식으로 이어붙이는 Function을 만듭니다.
+    결과는 :py:func:`py_list` 의 encoder 인자로 사용합니다.
+
+    :param fields: 원소마다 적용할 :py:func:`java_answer` handle들. 2개 이상이면 원소 하나가 tuple이 됩니다. (기본값: 원소 자체)
+    :return: java.util.function.Function 객체
+    """
+    handles = _method_handles()
+    object_class = java_class('java.lang.Object')
+    string_class = java_class('java.lang.String')
+    object_array = class_of('java.lang.Class').forName('[Ljava.lang.Object;')
+
+    if len(fields) == 0:
+        fields = [java_answer()]
+    element = fields[0] if len(fields) == 1 else java_concat('', *fields)
+
+    # 첫 줄에는 원소 하나가 차지하는 줄 수를 적습니다.
+    header = handles.dropArguments(handles.constant(string_class, '!yi%d\n' % len(fields)), 0,
+                                   java_varargs([object_class], class_of('java.lang.Class')))
+    encoder = java_concat('', header, java_joining(element, ''))
+
+    # 배열은 List로 바꾸어 처리합니다.
+    is_array = _method_of(java_class('java.lang.Class'), 'isInstance', object_class).bindTo(object_array)
+    as_list = _method_of(java_class('java.util.Arrays'), 'asList', object_array).asFixedArity()
+    as_list = as_list.asType(class_of('java.lang.invoke.MethodType').methodType(object_class, object_class))
+    from_array = handles.filterArguments(encoder, 0, java_varargs([as_list], class_of('java.lang.invoke.MethodHandle')))
+    return java_function(handles.guardWithTest(is_array, from_array, encoder))
+
+
+def _py_answers(payload: str) -> list:
+    # java_list_encoder의 결과를 Py4J가 응답을 해석하는 방식 그대로 해석합니다.
+    client = GATEWAY._gateway_client
+    values = [get_return_value(line[1:], client) for line in payload.split('\n')[:-1]]
+    width = values[0]
+    if width == 1:
+        return values[1:]
+
+    return [tuple(values[i:i + width]) for i in range(1, len(values), width)]
+
+
+def java_bound_method(instance, name: str, *param_types):
+    """
+    Java 객체의 public 메서드를 그 객체에 묶은 MethodHandle을 만듭니다.
+
+    :param instance: 메서드를 호출할 Java 객체
+    :param str name: 메서드 이름
+    :param param_types: 메서드 인자들의 java.lang.Class (가변인자)
+    :return: instance가 묶인 MethodHandle
+    """
+    return _method_of(instance.getClass(), name, *param_types).bindTo(instance)
+
+
+def java_split_map(element, delimiter: str):
+    """
+    delimiter로 이어붙인 문자열을 JVM 안에서 나누고, 나뉜 각 부분에 element handle을 적용한 결과를 java.util.List로 모으는 handle을 만듭니다.
+    빈 부분도 그대로 유지합니다.
+
+    :param element: 나뉜 문자열을 받는 MethodHandle
+    :param str delimiter: 이어붙일 때 사용한 구분자
+    :return: (String)List 형태의 MethodHandle
+    """
+    handles = _method_handles()
+    string_class = java_class('java.lang.String')
+    stream_class = java_class('java.util.stream.Stream')
+    function_class = java_class('java.util.function.Function')
+    object_class = class_of('java.lang.Object')
+
+    split = _method_of(string_class, 'split', string_class, class_of('java.lang.Integer').TYPE)
+    split = handles.insertArguments(split, 1,
+                                    java_varargs([class_of('java.util.regex.Pattern').quote(delimiter), -1],
+                                                 object_class))
+    as_list = _method_of(java_class('java.util.Arrays'), 'asList',
+                         class_of('java.lang.Class').forName('[Ljava.lang.Object;')).asFixedArity()
+    as_list = as_list.asType(as_list.type().changeParameterType(0, split.type().returnType()))
+
+    mapper = handles.insertArguments(_method_of(stream_class, 'map', function_class), 1,
+                                     java_varargs([java_function(element)], object_class))
+    collector = handles.insertArguments(_method_of(stream_class, 'collect',
+                                                   java_class('java.util.stream.Collector')), 1,
+                                        java_varargs([class_of('java.util.stream.Collectors').toList()],
+                                                     object_class))
+
+    handle = handles.filterReturnValue(split, as_list)
+    handle = handles.filterReturnValue(handle, _method_of(java_class('java.util.Collection'), 'stream'))
+    return handles.filterReturnValue(handles.filterReturnValue(handle, mapper), collector)
+
+
+def java_list_map(element):
+    """
+    Java Collection의 각 원소에 element handle을 적용한 결과를 JVM 안에서 java.util.List로 모으는 handle을 만듭니다.
+
+    :param element: 원소를 받는 MethodHandle
+    :return: (Collection)List 형태의 MethodHandle
+    """
+    handles = _method_handles()
+    stream_class = java_class('java.util.stream.Stream')
+    object_class = class_of('java.lang.Object')
+
+    mapper = handles.insertArguments(_method_of(stream_class, 'map', java_class('java.util.function.Function')), 1,
+                                     java_varargs([java_function(element)], object_class))
+    collector = handles.insertArguments(_method_of(stream_class, 'collect',
+                                                   java_class('java.util.stream.Collector')), 1,
+                                        java_varargs([class_of('java.util.stream.Collectors').toList()],
+                                                     object_class))
+
+    handle = _method_of(java_class('java.util.Collection'), 'stream')
+    return handles.filterReturnValue(handles.filterReturnValue(handle, mapper), collector)
+
+
 def error_handler(e: JavaError):
     string = str(e)
     if 'NoClassDefFoundError' in string or \
@@ -231,8 +645,23 @@ __all__ = [
     'java_set',
     'java_pos_filter',
     'java_varargs',
+    'java_cached',
+    'java_class',
+    'java_getter',
+    'java_call',
+    'java_joining',
+    'java_concat',
+    'java_function',
+    'java_answer',
+    'java_list_encoder',
+    'java_bound_method',
+    'java_split_map',
+    'java_list_map',
+    'NULL_MARK',
     'is_jvm_running',
     'start_jvm',
+    'gateway_pool_size',
+    'jvm_memory',
     'check_jvm',
     'shutdown_jvm',
     'error_handler',
@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import logging
+import multiprocessing
+import pickle
+import queue
+import socket
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Union
+
+from . import Util
+from .data import Sentence
+from .proc import Tagger, Parser, EntityRecognizer, RoleLabeler
+
+_WARM_UP_TEXT = '하나의 예시 문장입니다.'  #: 작업 프로세스를 준비시킬 때 분석해보는 문장
+_READY = -1  #: 작업 프로세스가 준비되었음을 알리는 결과 번호
+_POLL_INTERVAL = 1.0  #: 결과를 기다리는 동안 작업 프로세스가 살아있는지 확인하는 간격(초)
+
+
+def _free_ports(count: int) -> List[int]:
+    # 서로 다른 포트를 얻기 위해, 소켓을 모두 열어둔 상태에서 번호를 확인한 다음 닫습니다.
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(('127.0.0.1', 0))
+            sockets.append(sock)
+
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+def _portable_error(e: Exception) -> Exception:
+    # Py4J의 JavaError처럼 다른 프로세스로 보낼 수 없는 오류는 메시지만 담아서 보냅니다.
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return Exception('%s: %s' % (type(e).__name__, str(e)))
+
+
+def _worker_main(port: int, options: dict, analyzer, api: str, kwargs: dict, tasks, results):
+    # 작업 프로세스: JVM을 따로 띄우고, 분석기를 만든 다음, 작업 큐가 빌 때(None)까지 분석합니다.
+    try:
+        Util.initialize(port=port, **options)
+        worker = analyzer(api, **kwargs)
+        worker(_WARM_UP_TEXT)
+        results.put((_READY, None, None))
+    except Exception as e:
+        results.put((_READY, None, _portable_error(e)))
+        Util.finalize()
+        return
+
+    try:
+        for index, documents in iter(tasks.get, None):
+            try:
+                if isinstance(worker, Tagger):
+                    output = worker.tagBatch(documents, grouped=True)
+                else:
+                    output = [worker.analyze(document) for document in documents]
+
+                results.put((index, output, None))
+            except Exception as e:
+                results.put((index, None, _portable_error(e)))
+    finally:
+        Util.finalize()
+
+
+class _ProcessPool(object):
+    """
+    여러 작업 프로세스에서 각자 JVM을 띄워 분석하는 분석기 묶음을 초기화합니다.
+
+    :param analyzer: 작업 프로세스에서 사용할 분석기 class (Tagger, Parser, EntityRecognizer, RoleLabeler)
+    :param str api: 사용할 분석기의 유형.
+    :param int processes: 작업 프로세스의 수. (기본값: None = CPU 코어 수)
+    :param int chunksize: 작업 프로세스에 한 번에 보낼 문단의 수. (기본값: 16)
+    :param List[int] ports: 작업 프로세스마다 Java와 소통하는 Python proxy가 사용할 port. (기본값: None = 빈 port를 찾아 사용)
+    :param Dict[str,str] packages: 작업 프로세스에서 초기화할 분석기 API의 목록. (기본값: None = {api: "LATEST"})
+    :param str java_options: 작업 프로세스의 JVM option (기본값: None = Util.initialize의 기본값)
+    :param str lib_path: 자바 라이브러리를 저장할 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
+    :param str start_method: multiprocessing의 프로세스 시작 방식 ('spawn', 'fork', 'forkserver'). (기본값: None = 시스템 기본값)
+    :param kwargs: 분석기를 생성할 때 넘겨줄 keyword 인자. (예: etri_key)
+    """
+
+    def __init__(self, analyzer, api: str, processes: int = None, chunksize: int = 16, ports: List[int] = None,
+                 packages: Dict[str, str] = None, java_options: str = None, lib_path: str = None,
+                 start_method: str = None, **kwargs):
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if processes < 1 or chunksize < 1:
+            raise ValueError('processes와 chunksize는 1 이상이어야 합니다.')
+        if ports is None:
+            ports = _free_ports(processes)
+        elif len(set(ports)) < processes:
+            raise ValueError('작업 프로세스 %d개가 사용할 서로 다른 port가 필요합니다.' % processes)
+
+        options = dict(packages) if packages else {api.upper(): 'LATEST'}
+
+        # 작업 프로세스들이 같은 lib_path에서 동시에 의존성을 내려받지 않도록, classpath는 여기서 한 번만 준비하고
+        # 작업 프로세스는 기록된 classpath로 초기화합니다.
+        lib_path = str(lib_path) if lib_path is not None else str(Path.cwd())
+        Util._prepare_classpath(lib_path, Util._requested_packages(dict(options)))
+
+        options['lib_path'] = lib_path
+        options['offline'] = True
+        if java_options is not None:
+            options['java_options'] = java_options
+
+        self.__chunksize = chunksize
+        self.__next_index = 0
+        self.__results = {}
+        self.__abandoned = set()
+        self.__lock = threading.Lock()
+
+        context = multiprocessing.get_context(start_method)
+        self.__tasks = context.Queue()
+        self.__queue = context.Queue()
+        self.__workers = [context.Process(target=_worker_main, daemon=True,
+                                          args=(port, options, analyzer, api, kwargs, self.__tasks, self.__queue))
+                          for port in ports[:processes]]
+
+        for process in self.__workers:
+            process.start()
+
+        # 모든 작업 프로세스의 JVM이 초기화되고 분석기가 준비될 때까지 기다립니다.
+        for _ in self.__workers:
+            _, _, error = self.__get()
+            if error is not None:
+                self.close()
+                raise error
+
+        logging.info("%d worker processes are ready for %s(%s).", processes, analyzer.__name__, api)
+
+    @property
+    def processes(self) -> int:
+        """
+        :rtype: int
+        :return: 작업 프로세스의 수
+        """
+        return len(self.__workers)
+
+    def _stream(self, documents: Iterable, max_pending: int = None) -> Iterator:
+        # 문단들을 chunksize개씩 작업 큐에 넣고, 처리된 결과를 입력 순서대로 돌려줍니다.
+        # 메모리 사용량을 제한하기 위해, 결과를 받지 않은 chunk는 max_pending개까지만 보냅니다.
+        if self.__tasks is None:
+            raise Exception('이미 종료된 작업 프로세스 묶음입니다.')
+        if max_pending is None:
+            max_pending = 2 * len(self.__workers)
+
+        pending = []
+        chunk = []
+        try:
+            for document in documents:
+                chunk.append(document)
+                if len(chunk) == self.__chunksize:
+                    pending.append(self.__submit(chunk))
+                    chunk = []
+
+                    if len(pending) >= max_pending:
+                        yield from self.__collect(pending.pop(0))
+
+            if len(chunk) > 0:
+                pending.append(self.__submit(chunk))
+
+            while len(pending) > 0:
+                yield from self.__collect(pending.pop(0))
+        finally:
+            # 중간에 순회를 멈춘 경우, 아직 받지 않은 결과는 도착하는 대로 버립니다.
+            with self.__lock:
+                for index in pending:
+                    if self.__results.pop(index, None) is None:
+                        self.__abandoned.add(index)
+
+    def __submit(self, chunk: list) -> int:
+        with self.__lock:
+            index = self.__next_index
+            self.__next_index += 1
+
+        self.__tasks.put((index, chunk))
+        return index
+
+    def __collect(self, index: int) -> list:
+        output, error = self.__receive(index)
+        if error is not None:
+            raise error
+
+        return output
+
+    def __receive(self, index: int):
+        # 다른 chunk의 결과가 먼저 도착하면, 해당 chunk를 기다리는 쪽에서 가져갈 수 있도록 보관합니다.
+        with self.__lock:
+            while index not in self.__results:
+                received, output, error = self.__get()
+                if received in self.__abandoned:
+                    self.__abandoned.remove(received)
+                else:
+                    self.__results[received] = (output, error)
+
+            return self.__results.pop(index)
+
+    def __get(self) -> tuple:
+        while True:
+            try:
+                return self.__queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if any(not process.is_alive() for process in self.__workers):
+                    raise Exception('작업 프로세스가 예기치 않게 종료되었습니다.')
+
+    def close(self):
+        """
+        작업 프로세스들의 JVM을 종료하고, 작업 프로세스를 모두 정리합니다.
+        """
+        if self.__tasks is None:
+            return
+
+        for _ in self.__workers:
+            self.__tasks.put(None)
+
+        for process in self.__workers:
+            process.join()
+
+        self.__tasks.close()
+        self.__queue.close()
+        self.__tasks = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ProcessPoolTagger(_ProcessPool):
+    """
+    여러 작업 프로세스에서 각자 JVM을 띄워 품사분석하는 품사분석기를 초기화합니다.
+    각 작업 프로세스는 서로 다른 port로 JVM을 초기화하고, 예시 문장을 분석하여 준비를 마친 다음 문단을 받아 분석합니다.
+    분석 결과는 Java 참조 없이 전달되며, 입력된 문단의 순서대로 돌려줍니다.
+
+    사용을 마친 다음에는 :py:meth:`close` 를 호출하거나, ``with`` 구문을 사용해 작업 프로세스를 종료해주세요.
+
+    :param str api: 사용할 품사분석기의 유형.
+    :param int processes: 작업 프로세스의 수. (기본값: None = CPU 코어 수)
+    :param int chunksize: 작업 프로세스에 한 번에 보낼 문단의 수. (기본값: 16)
+    :param List[int] ports: 작업 프로세스마다 Java와 소통하는 Python proxy가 사용할 port. (기본값: None = 빈 port를 찾아 사용)
+    :param Dict[str,str] packages: 작업 프로세스에서 초기화할 분석기 API의 목록. (기본값: None = {api: "LATEST"})
+    :param str java_options: 작업 프로세스의 JVM option (기본값: None = Util.initialize의 기본값)
+    :param str lib_path: 자바 라이브러리를 저장할 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
+    :param str start_method: multiprocessing의 프로세스 시작 방식 ('spawn', 'fork', 'forkserver'). (기본값: None = 시스템 기본값)
+    :param kwargs: :py:class:`koalanlp.proc.Tagger` 를 생성할 때 넘겨줄 keyword 인자. (예: etri_key, kmr_light)
+    """
+
+    def __init__(self, api: str, **kwargs):
+        super().__init__(Tagger, api, **kwargs)
+
+    def tag(self, *text: str) -> List[Sentence]:
+        """
+        문단(들)을 품사분석합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단들. 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과. (flattened list)
+        """
+        return self.tagBatch(_flatten(text))
+
+    def tagBatch(self, texts: List[str], grouped: bool = False) -> Union[List[Sentence], List[List[Sentence]]]:
+        """
+        여러 문단을 작업 프로세스에 나누어 품사분석합니다.
+
+        :param List[str] texts: 분석할 문단들의 목록.
+        :param bool grouped: True이면 문단별로 묶은 결과를, False이면 tag()와 같이 이어붙인 결과를 돌려줍니다. (기본값 False)
+        :rtype: Union[List[Sentence],List[List[Sentence]]]
+        :return: 분석된 결과. grouped=False이면 flattened list, grouped=True이면 문단별 문장 list의 list.
+        """
+        result = list(self.iterTag(texts, grouped=True))
+
+        if grouped:
+            return result
+        else:
+            return [sentence for group in result for sentence in group]
+
+    def iterTag(self, texts: Iterable[str], grouped: bool = False) -> Iterator[Union[Sentence, List[Sentence]]]:
+        """
+        여러 문단을 작업 프로세스에 나누어 품사분석하고, 분석이 끝나는 대로 문단의 순서에 맞추어 돌려줍니다.
+        아직 결과를 받지 않은 문단은 작업 프로세스 수의 2배 묶음(chunk)까지만 보내므로, 큰 말뭉치도 일정한 메모리로 분석할 수 있습니다.
+
+        :param Iterable[str] texts: 분석할 문단들. (예: 파일의 각 줄)
+        :param bool grouped: True이면 문단별 문장 list를, False이면 문장을 하나씩 돌려줍니다. (기본값 False)
+        :rtype: Iterator[Union[Sentence,List[Sentence]]]
+        :return: 분석된 문장 또는 문단별 문장 list.
+        """
+        return _ungroup(self._stream(_check_text(paragraph) for paragraph in texts), grouped)
+
+    def __call__(self, *args, **kwargs) -> List[Sentence]:
+        """
+        문단(들)을 품사분석합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단들. 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과. (flattened list)
+        """
+        return self.tag(*args)
+
+
+class ProcessPoolAnalyzer(_ProcessPool):
+    """
+    여러 작업 프로세스에서 각자 JVM을 띄워 분석하는 특성 부착형 분석기(구문분석, 의존구문분석, 개체명 인식, 의미역 분석)를 초기화합니다.
+    각 작업 프로세스는 서로 다른 port로 JVM을 초기화하고, 예시 문장을 분석하여 준비를 마친 다음 문단을 받아 분석합니다.
+    분석 결과는 Java 참조 없이 전달되며, 입력된 문단의 순서대로 돌려줍니다.
+
+    사용을 마친 다음에는 :py:meth:`close` 를 호출하거나, ``with`` 구문을 사용해 작업 프로세스를 종료해주세요.
+
+    :param analyzer: 사용할 분석기 class. (:py:class:`koalanlp.proc.Parser`, :py:class:`koalanlp.proc.EntityRecognizer`,
+            :py:class:`koalanlp.proc.RoleLabeler` 중 하나)
+    :param str api: 사용할 분석기의 유형.
+    :param int processes: 작업 프로세스의 수. (기본값: None = CPU 코어 수)
+    :param int chunksize: 작업 프로세스에 한 번에 보낼 문단의 수. (기본값: 16)
+    :param List[int] ports: 작업 프로세스마다 Java와 소통하는 Python proxy가 사용할 port. (기본값: None = 빈 port를 찾아 사용)
+    :param Dict[str,str] packages: 작업 프로세스에서 초기화할 분석기 API의 목록. (기본값: None = {api: "LATEST"})
+    :param str java_options: 작업 프로세스의 JVM option (기본값: None = Util.initialize의 기본값)
+    :param str lib_path: 자바 라이브러리를 저장할 '.java' 디렉터리/폴더가 위치할 곳. (기본값: None = os.cwd())
+    :param str start_method: multiprocessing의 프로세스 시작 방식 ('spawn', 'fork', 'forkserver'). (기본값: None = 시스템 기본값)
+    :param kwargs: 분석기를 생성할 때 넘겨줄 keyword 인자. (예: etri_key)
+    """
+
+    def __init__(self, analyzer, api: str, **kwargs):
+        if analyzer not in (Parser, EntityRecognizer, RoleLabeler):
+            raise TypeError('%s는 ProcessPoolAnalyzer에서 사용할 수 없습니다. '
+                            'Parser, EntityRecognizer, RoleLabeler 중 하나를 지정해주세요.' % str(analyzer))
+
+        super().__init__(analyzer, api, **kwargs)
+
+    def analyze(self, *text) -> List[Sentence]:
+        """
+        문단(들)을 분석합니다.
+
+        :param Union[str,Sentence,List[str],List[Sentence]] text: 분석할 문단(들).
+                각 인자는 텍스트(str), 문장 객체(Sentence), 텍스트의 리스트, 문장 객체의 리스트 혼용 가능 (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과들. (flattened list)
+        """
+        return list(self.iterAnalyze(text))
+
+    def iterAnalyze(self, texts: Iterable, grouped: bool = False) -> Iterator[Union[Sentence, List[Sentence]]]:
+        """
+        여러 문단을 작업 프로세스에 나누어 분석하고, 분석이 끝나는 대로 문단의 순서에 맞추어 돌려줍니다.
+
+        :param Iterable[Union[str,Sentence,List[str],List[Sentence]]] texts: 분석할 문단들.
+                각 항목은 텍스트(str), 문장 객체(Sentence), 텍스트의 리스트, 문장 객체의 리스트 중 하나.
+        :param bool grouped: True이면 항목별 문장 list를, False이면 문장을 하나씩 돌려줍니다. (기본값 False)
+        :rtype: Iterator[Union[Sentence,List[Sentence]]]
+        :return: 분석된 문장 또는 항목별 문장 list.
+        """
+        return _ungroup(self._stream(texts), grouped)
+
+    def __call__(self, *args, **kwargs) -> List[Sentence]:
+        """
+        문단(들)을 분석합니다.
+
+        :param Union[str,Sentence,List[str],List[Sentence]] text: 분석할 문단(들).
+                각 인자는 텍스트(str), 문장 객체(Sentence), 텍스트의 리스트, 문장 객체의 리스트 혼용 가능 (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과들. (flattened list)
+        """
+        return self.analyze(*args)
+
+
+def _flatten(text) -> list:
+    paragraphs = []
+    for paragraph in text:
+        if type(paragraph) is list:
+            paragraphs += _flatten(paragraph)
+        else:
+            paragraphs.append(paragraph)
+
+    return paragraphs
+
+
+def _ungroup(groups: Iterator[List[Sentence]], grouped: bool) -> Iterator:
+    for group in groups:
+        if grouped:
+            yield group
+        else:
+            yield from group
+
+
+def _check_text(paragraph) -> str:
+    if type(paragraph) is not str:
+        raise TypeError('%s type은 품사 분석을 수행할 수 없습니다.' % type(paragraph))
+
+    return paragraph
+
+
+# ----- Declare members exported -----
+
+__all__ = ['ProcessPoolTagger', 'ProcessPoolAnalyzer']
@@ -1,13 +1,288 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import hashlib
 import logging
-from typing import List, Tuple
+import random
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from . import API
-from .data import Sentence, Word
+from .data import Sentence, TaggedBatch, Word
 from .jvm import *
+from .serialize import dumps, loads
 from .types import POS
 
+_SEP_DOCUMENT = '\x1c'  #: 여러 문단을 한꺼번에 Java로 보낼 때 사용하는 구분자
+
+
+def _pos_pair_encoder():
+    # (표면형, 품사) Pair의 목록을 (표면형, 품사 이름) 값으로 한 번에 가져옵니다.
+    def build():
+        pair = java_class('kotlin.Pair')
+        return java_list_encoder(java_answer(pair, 'getFirst'),
+                                 java_answer(pair, 'getSecond', tail=java_answer(java_class('java.lang.Enum'), 'name')))
+
+    return java_cached('proc.POSPair', build)
+
+
+def _pos_pair(pair: Tuple[str, str]) -> Tuple[str, POS]:
+    return pair[0], POS.valueOf(pair[1])
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    # 순회 가능한 객체를 size개씩 끊어서, 필요할 때마다 읽어 list로 돌려줍니다.
+    if size < 1:
+        raise ValueError('batch_size는 1 이상이어야 합니다.')
+
+    items = iter(items)
+    chunk = list(islice(items, size))
+    while len(chunk) > 0:
+        yield chunk
+        chunk = list(islice(items, size))
+
+
+class _PerThreadAPI(object):
+    """
+    스레드마다 분석기 API 객체를 따로 만들어 사용합니다.
+    여러 스레드가 하나의 분석기를 공유하더라도 각 스레드는 자신의 Java 분석기 객체를 사용하므로, JVM 안에서 동시에 분석할 수 있습니다.
+    """
+
+    def __init__(self, factory):
+        self.__factory = factory
+        self.__local = threading.local()
+        self.api()
+
+    def api(self):
+        local = self.__local
+        if not hasattr(local, 'api'):
+            try:
+                local.api = self.__factory()
+            except JavaError as e:
+                error_handler(e)
+            local.handles = {}
+
+        return local.api
+
+    def apply_batch(self, method: str, texts: List[str]):
+        # 문단들을 구분자로 이어붙여 보내면, Java에서 나누어 분석한 결과를 List로 돌려줍니다.
+        api = self.api()
+        handles = self.__local.handles
+        try:
+            if method not in handles:
+                handle = java_bound_method(api, method, java_class('java.lang.String'))
+                handles[method] = java_function(java_split_map(handle, _SEP_DOCUMENT))
+
+            return handles[method].apply(_SEP_DOCUMENT.join(texts))
+        except JavaError as e:
+            error_handler(e)
+
+
+_UNCACHED_OPTIONS = frozenset(['etri_key', 'apiKey', 'useLightTagger', 'cache', 'detached'])  #: 분석 결과에 영향을 주지 않는 keyword 인자
+_DICTIONARY_VERSIONS = {}  #: API별로, 이 프로세스에서 사용자 사전에 추가한 내용의 digest
+
+
+def _update_dictionary_version(api: str, change):
+    # 사용자 사전이 바뀌면 digest를 갱신하여, 이전 사전으로 분석해 저장한 결과를 사용하지 않게 합니다.
+    api = api.lower()
+    digest = hashlib.sha256(_DICTIONARY_VERSIONS.get(api, '').encode('utf-8'))
+    digest.update(repr(change).encode('utf-8'))
+    _DICTIONARY_VERSIONS[api] = digest.hexdigest()
+
+
+def _package_version(api: str) -> Optional[str]:
+    # Util.initialize로 설치한 분석기 패키지의 버전. 파이썬 패키지를 쓰는 분석기이거나 초기화 전이라면 None.
+    from . import Util
+
+    if Util.index_manager is None:
+        return None
+
+    name = 'koalanlp-%s' % api.lower()
+    versions = sorted(str(artifact.version) for artifact in Util.index_manager.installed if artifact.artifact == name)
+    return ','.join(versions) if len(versions) > 0 else None
+
+
+def _cache_config(api: str, cls: str, kwargs: dict) -> tuple:
+    options = tuple(sorted((key, repr(value)) for key, value in kwargs.items() if key not in _UNCACHED_OPTIONS))
+    return api.lower(), cls, options, _package_version(api)
+
+
+def _normalize_text(text: str) -> str:
+    # 유니코드 정규화(NFC)를 하고, 앞뒤 공백을 없애며, 연속된 공백을 하나로 줄입니다.
+    return unicodedata.normalize('NFC', ' '.join(text.split()))
+
+
+class AnalysisCache(object):
+    """
+    분석 결과를 저장해두고, 같은 설정의 분석기가 같은 문단을 다시 분석할 때 저장된 결과를 돌려줍니다.
+    분석기를 만들 때 ``cache`` keyword 인자로 넘겨주면 됩니다. (예: ``Tagger(API.KMR, cache=AnalysisCache())``)
+
+    결과는 분석기 종류, 분석기 옵션(kmr_light, kha_preanal 등), 분석기 패키지 버전, 사용자 사전의 상태, 정규화한 문단으로 찾습니다.
+    :py:meth:`Dictionary.addUserDictionary` 등으로 사용자 사전을 바꾸면, 그 전에 저장한 결과는 더 이상 사용하지 않습니다.
+
+    최근에 사용한 결과는 메모리에 보관하고(LRU), path를 지정하면 sqlite 파일에도 보관합니다.
+    보관한 결과가 최대 크기를 넘으면, 가장 오래 사용하지 않은 결과부터 지웁니다.
+    저장된 결과로 만든 문장은 Java 참조가 없으며, 필요하면 getReference()가 새로 만듭니다.
+
+    여러 스레드에서 함께 사용할 수 있습니다. 다중 프로세스 분석기(:py:mod:`koalanlp.pool`)에는 넘겨줄 수 없습니다.
+
+    :param int max_memory: 메모리에 보관할 결과의 최대 크기 (byte). 0이면 메모리에 보관하지 않습니다. (기본값 64MB)
+    :param str path: 결과를 보관할 sqlite 파일의 경로. (기본값: None = 디스크에 보관하지 않음)
+    :param int max_disk: 파일에 보관할 결과의 최대 크기 (byte). (기본값 1GB)
+    :param normalize: 문단을 정규화하는 함수. 정규화한 결과가 같은 문단은 같은 결과를 돌려줍니다.
+            (기본값: NFC 정규화 후 연속된 공백을 하나로 줄임)
+    """
+
+    def __init__(self, max_memory: int = 64 * 1024 * 1024, path: str = None, max_disk: int = 1024 * 1024 * 1024,
+                 normalize=_normalize_text):
+        self.__lock = threading.RLock()
+        self.__normalize = normalize
+        self.__max_memory = max_memory
+        self.__memory = OrderedDict()
+        self.__memory_size = 0
+        self.__max_disk = max_disk
+        self.__disk = None
+        self.__disk_size = 0
+        self.__clock = 0
+        self.__stats = {'memoryHits': 0, 'diskHits': 0, 'misses': 0}
+
+        if path is not None:
+            self.__disk = sqlite3.connect(path, check_same_thread=False)
+            self.__disk.execute('CREATE TABLE IF NOT EXISTS results '
+                                '(key BLOB PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, used INTEGER NOT NULL)')
+            self.__disk.execute('CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+            self.__disk.commit()
+            size, clock = self.__disk.execute('SELECT COALESCE(SUM(size), 0), COALESCE(MAX(used), 0) FROM results')\
+                .fetchone()
+            self.__disk_size = size
+            self.__clock = clock
+
+    def _key(self, config: tuple, method: str, text: str) -> bytes:
+        key = (config, _DICTIONARY_VERSIONS.get(config[0]), method, self.__normalize(text))
+        return hashlib.sha256(repr(key).encode('utf-8')).digest()
+
+    def _get(self, key: bytes) -> Optional[List[Sentence]]:
+        with self.__lock:
+            value = self.__memory.get(key)
+            if value is not None:
+                self.__memory.move_to_end(key)
+                self.__stats['memoryHits'] += 1
+            elif self.__disk is not None:
+                row = self.__disk.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    value = bytes(row[0])
+                    self.__clock += 1
+                    self.__disk.execute('UPDATE results SET used = ? WHERE key = ?', (self.__clock, key))
+                    self.__disk.commit()
+                    self.__remember(key, value)
+                    self.__stats['diskHits'] += 1
+
+            if value is None:
+                self.__stats['misses'] += 1
+                return None
+
+        return loads(value)
+
+    def _put(self, key: bytes, sentences: List[Sentence]):
+        value = dumps(sentences)
+
+        with self.__lock:
+            self.__remember(key, value)
+
+            if self.__disk is not None and len(value) <= self.__max_disk:
+                self.__clock += 1
+                previous = self.__disk.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+                self.__disk.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                                    (key, value, len(value), self.__clock))
+                self.__disk_size += len(value) - (previous[0] if previous is not None else 0)
+
+                while self.__disk_size > self.__max_disk:
+                    # 가장 오래 사용하지 않은 결과부터 지웁니다.
+                    rows = self.__disk.execute('SELECT key, size FROM results ORDER BY used LIMIT 64').fetchall()
+                    self.__disk.executemany('DELETE FROM results WHERE key = ?', [(row[0],) for row in rows])
+                    self.__disk_size -= sum(row[1] for row in rows)
+                self.__disk.commit()
+
+    def __remember(self, key: bytes, value: bytes):
+        if len(value) > self.__max_memory:
+            return
+
+        if key in self.__memory:
+            self.__memory_size -= len(self.__memory.pop(key))
+        self.__memory[key] = value
+        self.__memory_size += len(value)
+
+        while self.__memory_size > self.__max_memory:
+            _, evicted = self.__memory.popitem(last=False)
+            self.__memory_size -= len(evicted)
+
+    def getStats(self) -> Dict[str, Union[int, float]]:
+        """
+        저장된 결과를 얼마나 사용했는지 돌려줍니다.
+
+        :rtype: Dict[str,Union[int,float]]
+        :return: 'hits' (저장된 결과를 돌려준 횟수), 'memoryHits', 'diskHits', 'misses' (새로 분석한 문단의 수),
+                 'hitRate' (hits / (hits + misses)), 'memoryBytes', 'diskBytes' (보관 중인 결과의 크기)를 담은 dict
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['hits'] = stats['memoryHits'] + stats['diskHits']
+            total = stats['hits'] + stats['misses']
+            stats['hitRate'] = stats['hits'] / total if total > 0 else 0.0
+            stats['memoryBytes'] = self.__memory_size
+            stats['diskBytes'] = self.__disk_size
+            return stats
+
+    def clear(self):
+        """
+        저장된 결과를 모두 지웁니다.
+        """
+        with self.__lock:
+            self.__memory.clear()
+            self.__memory_size = 0
+            if self.__disk is not None:
+                self.__disk.execute('DELETE FROM results')
+                self.__disk.commit()
+                self.__disk_size = 0
+
+    def close(self):
+        """
+        sqlite 파일을 닫습니다.
+        """
+        with self.__lock:
+            if self.__disk is not None:
+                self.__disk.close()
+                self.__disk = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _cached_groups(cache: Optional[AnalysisCache], config: tuple, method: str, texts: List[str], analyze) -> list:
+    # 문단마다 저장된 결과를 찾고, 없는 문단만 모아서 analyze(문단 목록)로 분석한 다음 저장합니다.
+    if cache is None:
+        return analyze(texts)
+
+    keys = [cache._key(config, method, text) for text in texts]
+    result = [cache._get(key) for key in keys]
+    missing = [i for i, group in enumerate(result) if group is None]
+
+    if len(missing) > 0:
+        for i, group in zip(missing, analyze([texts[i] for i in missing])):
+            cache._put(keys[i], group)
+            result[i] = group
+
+    return result
+
 
 class SentenceSplitter(object):
     """
@@ -19,10 +294,18 @@ class SentenceSplitter(object):
     def __init__(self, api: str):
         self.__is_native = API.is_python_native(api)
         try:
-            self.__api = API.query(api, __class__.__name__)()
+            self.__apis = _PerThreadAPI(API.query(api, __class__.__name__))
         except JavaError as e:
             error_handler(e)
 
+    @property
+    def __api(self):
+        return self.__apis.api()
+
+    def _java_api(self):
+        # Pipeline이 Java 분석기 객체를 직접 연결할 때 사용합니다. Python으로 구현된 분석기라면 None.
+        return None if self.__is_native else self.__apis.api()
+
     def sentences(self, *text) -> List[str]:
         """
         문단(들)을 문장으로 분리합니다.
@@ -40,7 +323,7 @@ class SentenceSplitter(object):
                     result += self.__api.invoke(paragraph)
                 else:
                     try:
-                        result += py_list(self.__api.invoke(string(paragraph)), lambda x: x)
+                        result += py_list(self.__api.invoke(paragraph), lambda x: x)
                     except JavaError as e:
                         error_handler(e)
             else:
@@ -48,6 +331,18 @@ class SentenceSplitter(object):
 
         return result
 
+    def iterSentences(self, texts: Iterable[str]) -> Iterator[str]:
+        """
+        여러 문단을 차례로 문장으로 분리하여, 분리된 문장을 입력 순서대로 하나씩 돌려줍니다.
+        문단을 필요할 때마다 읽으므로, 큰 말뭉치도 일정한 메모리로 처리할 수 있습니다.
+
+        :param Iterable[str] texts: 분석할 문단들. 파일의 각 줄처럼 순회할 수 있는 객체라면 무엇이든 가능.
+        :rtype: Iterator[str]
+        :return: 분리한 문장들.
+        """
+        for paragraph in texts:
+            yield from self.sentences(paragraph)
+
     def __call__(self, *args, **kwargs) -> List[str]:
         """
         문단을 문장으로 분리합니다.
@@ -77,8 +372,7 @@ class SentenceSplitter(object):
                 raise TypeError('%s type은 sentencesTagged를 실행할 수 없습니다.' % (type(paragraph)))
 
             try:
-                result += py_list(koala_class_of('proc', 'SentenceSplitter').INSTANCE.invoke(reference),
-                                  item_converter=Sentence.fromJava)
+                result += Sentence.fromJavaList(koala_class_of('proc', 'SentenceSplitter').INSTANCE.invoke(reference))
             except JavaError as e:
                 error_handler(e)
 
@@ -96,36 +390,57 @@ class Tagger(object):
     :keyword bool kha_preanal: Khaiii 분석기의 경우, 기분석 사전을 사용할지의 여부. (기본값 True)
     :keyword bool kha_errorpatch: Khaiii 분석기의 경우, 오분석 사전 사용 여부 (기본값 True)
     :keyword bool kha_restore: Khaiii 분석기의 경우, 형태소 재구성 여부 (기본값 True)
+    :keyword bool detached: True이면 분석 결과를 Python 객체로 모두 옮긴 다음 Java 참조를 바로 놓습니다.
+            분석 결과를 오래 보관할 때 JVM 메모리를 차지하지 않습니다. :py:meth:`koalanlp.data.Sentence.detach` 참고. (기본값 False)
+    :keyword AnalysisCache cache: 분석 결과를 저장해두고 같은 문단에 다시 사용할 :py:class:`AnalysisCache`. (기본값 None)
 
     :keyword str apiKey: ETRI 분석기의 경우, ETRI에서 발급받은 API Key (2.2.0 삭제 예정)
     :keyword bool useLightTagger: 코모란(KMR) 분석기의 경우, 경량 분석기를 사용할 것인지의 여부. (2.2.0 삭제 예정)
+
+    여러 스레드에서 하나의 품사분석기를 함께 사용할 수 있습니다. 스레드마다 Java 분석기 객체를 따로 만들어 사용하므로,
+    여러 스레드의 분석이 JVM 안에서 동시에 진행됩니다. 동시에 사용할 연결의 수는 :py:func:`koalanlp.Util.initialize` 의 pool_size로 정합니다.
     """
 
     def __init__(self, api: str, **kwargs):
         self.__is_native = API.is_python_native(api)
+        self.__detached = kwargs.get('detached', False)
         try:
             if api == API.ETRI:
                 if 'apiKey' in kwargs:
                     logging.warning('2.2.0부터 %s의 키워드 인자 "apiKey"가 삭제될 예정입니다. '
                                     '2.1.0부터 추가된 인자인 "etri_key"를 사용해주세요.', __class__.__name__)
                     kwargs['etri_key'] = kwargs['apiKey']
-                self.__api = API.query(api, __class__.__name__)(kwargs['etri_key'])
+                factory = partial(API.query(api, __class__.__name__), kwargs['etri_key'])
             elif api == API.KMR:
                 if 'useLightTagger' in kwargs:
                     logging.warning('2.2.0부터 %s의 키워드 인자 "useLightTagger"가 삭제될 예정입니다. '
                                     '2.1.0부터 추가된 인자인 "kmr_light"를 사용해주세요.', __class__.__name__)
                     kwargs['kmr_light'] = kwargs['useLightTagger']
-                self.__api = API.query(api, __class__.__name__)(kwargs.get('kmr_light', False))
+                factory = partial(API.query(api, __class__.__name__), kwargs.get('kmr_light', False))
             elif api == API.KHAIII:
                 config = koala_class_of('khaiii', 'KhaiiiConfig')(kwargs.get('kha_preanal', True),
                                                                   kwargs.get('kha_errorpatch', True),
                                                                   kwargs.get('kha_restore', True))
-                self.__api = API.query(api, __class__.__name__)(kwargs['kha_resource'], config)
+                factory = partial(API.query(api, __class__.__name__), kwargs['kha_resource'], config)
             else:
-                self.__api = API.query(api, __class__.__name__)()
+                factory = API.query(api, __class__.__name__)
+
+            self.__apis = _PerThreadAPI(factory)
         except JavaError as e:
             error_handler(e)
 
+        self.__cache = kwargs.get('cache')
+        self.__cache_config = _cache_config(api, __class__.__name__, kwargs)
+
+    @property
+    def __api(self):
+        # 여러 스레드에서 함께 사용하는 경우, 스레드마다 따로 만든 Java 분석기 객체를 사용합니다.
+        return self.__apis.api()
+
+    def _java_api(self):
+        # Pipeline이 Java 분석기 객체를 직접 연결할 때 사용합니다. Python으로 구현된 분석기라면 None.
+        return None if self.__is_native else self.__apis.api()
+
     def tag(self, *text: str) -> List[Sentence]:
         """
         문단(들)을 품사분석합니다.
@@ -134,22 +449,7 @@ class Tagger(object):
         :rtype: List[Sentence]
         :return: 분석된 결과. (flattened list)
         """
-        result = []
-        for paragraph in text:
-            if type(paragraph) is list:
-                result += self.tag(*paragraph)
-            elif type(paragraph) is str:
-                if self.__is_native:
-                    result += self.__api.tag(paragraph)
-                else:
-                    try:
-                        result += py_list(self.__api.tag(string(paragraph)), item_converter=Sentence.fromJava)
-                    except JavaError as e:
-                        error_handler(e)
-            else:
-                raise TypeError('%s type은 품사 분석을 수행할 수 없습니다.' % (type(paragraph)))
-
-        return result
+        return self.tagBatch(self.__flatten(text))
 
     def tagSentence(self, *text: str) -> List[Sentence]:
         """
@@ -159,20 +459,125 @@ class Tagger(object):
         :rtype: List[Sentence]
         :return: 분석된 결과.
         """
-        result = []
-        for sentence in text:
-            if type(sentence) is str:
-                if self.__is_native:
-                    result.append(self.__api.tagSentence(sentence))
+        return self.tagSentenceBatch(list(text))
+
+    def tagBatch(self, texts: List[str], grouped: bool = False) -> Union[List[Sentence], List[List[Sentence]]]:
+        """
+        여러 문단을 한꺼번에 품사분석합니다.
+        문단 목록 전체를 한 번에 Java로 보내어 분석하고, 분석 결과도 한 번에 받아오므로 문단이 많을수록 빠릅니다.
+
+        :param List[str] texts: 분석할 문단들의 목록.
+        :param bool grouped: True이면 문단별로 묶은 결과를, False이면 tag()와 같이 이어붙인 결과를 돌려줍니다. (기본값 False)
+        :rtype: Union[List[Sentence],List[List[Sentence]]]
+        :return: 분석된 결과. grouped=False이면 flattened list, grouped=True이면 문단별 문장 list의 list.
+        """
+        texts = self.__check_texts(texts, '품사 분석')
+        result = _cached_groups(self.__cache, self.__cache_config, 'tag', texts, self.__tag_groups)
+
+        if grouped:
+            return result
+        else:
+            return [sentence for group in result for sentence in group]
+
+    def __tag_groups(self, texts: List[str]) -> List[List[Sentence]]:
+        if self.__is_native:
+            return [self.__api.tag(paragraph) for paragraph in texts]
+        elif len(texts) == 0:
+            return []
+        elif any(_SEP_DOCUMENT in paragraph for paragraph in texts):
+            # 구분자가 포함된 문단이 있다면, 문단마다 따로 분석합니다.
+            try:
+                return [Sentence.fromJavaList(self.__api.tag(paragraph), detached=self.__detached)
+                        for paragraph in texts]
+            except JavaError as e:
+                error_handler(e)
+        else:
+            return Sentence.fromJavaList(self.__apis.apply_batch('tag', texts), grouped=True,
+                                         detached=self.__detached)
+
+    def tagSentenceBatch(self, texts: List[str]) -> List[Sentence]:
+        """
+        여러 문장을 한꺼번에 품사분석합니다. (항목 하나를 문장 하나로 간주합니다)
+        문장 목록 전체를 한 번에 Java로 보내어 분석하고, 분석 결과도 한 번에 받아옵니다.
+
+        :param List[str] texts: 분석할 문장들의 목록.
+        :rtype: List[Sentence]
+        :return: 분석된 결과. 입력된 문장마다 하나씩.
+        """
+        texts = self.__check_texts(texts, '품사 분석')
+        result = _cached_groups(self.__cache, self.__cache_config, 'tagSentence', texts,
+                                lambda batch: [[sentence] for sentence in self.__tag_sentences(batch)])
+        return [group[0] for group in result]
+
+    def __tag_sentences(self, texts: List[str]) -> List[Sentence]:
+        if self.__is_native:
+            return [self.__api.tagSentence(sentence) for sentence in texts]
+        elif len(texts) == 0:
+            return []
+        elif any(_SEP_DOCUMENT in sentence for sentence in texts):
+            try:
+                return [Sentence.fromJava(self.__api.tagSentence(sentence), detached=self.__detached)
+                        for sentence in texts]
+            except JavaError as e:
+                error_handler(e)
+        else:
+            return Sentence.fromJavaList(self.__apis.apply_batch('tagSentence', texts), detached=self.__detached)
+
+    def tagColumnar(self, texts: List[str]) -> TaggedBatch:
+        """
+        여러 문단을 한꺼번에 품사분석하여, 열(column) 단위로 저장한 결과를 돌려줍니다.
+        형태소, 어절, 문장마다 Python 객체를 만들지 않으므로, 많은 문단을 분석할 때 메모리와 변환 시간이 적게 듭니다.
+
+        :param List[str] texts: 분석할 문단들의 목록.
+        :rtype: TaggedBatch
+        :return: 분석된 결과. 문단 하나가 :py:class:`koalanlp.data.TaggedBatch` 의 문단 하나가 됩니다.
+        """
+        texts = self.__check_texts(texts, '품사 분석')
+
+        if self.__is_native or self.__cache is not None or len(texts) == 0 or \
+                any(_SEP_DOCUMENT in paragraph for paragraph in texts):
+            return TaggedBatch.fromSentences(self.tagBatch(texts, grouped=True), grouped=True)
+        else:
+            return TaggedBatch.fromJavaList(self.__apis.apply_batch('tag', texts))
+
+    def iterTag(self, texts: Iterable[str], batch_size: int = 64,
+                grouped: bool = False) -> Iterator[Union[Sentence, List[Sentence]]]:
+        """
+        여러 문단을 차례로 품사분석하여, 분석된 결과를 입력 순서대로 하나씩 돌려줍니다.
+        문단을 batch_size개씩 모아 :py:meth:`tagBatch` 로 분석하므로, 일괄 분석의 속도를 내면서도 전체 결과를 메모리에 담지 않습니다.
+
+        :param Iterable[str] texts: 분석할 문단들. 파일의 각 줄처럼 순회할 수 있는 객체라면 무엇이든 가능.
+        :param int batch_size: 한 번에 Java로 보낼 문단의 수. (기본값 64)
+        :param bool grouped: True이면 문단별 문장 list를, False이면 문장을 하나씩 돌려줍니다. (기본값 False)
+        :rtype: Iterator[Union[Sentence,List[Sentence]]]
+        :return: 분석된 문장 또는 문단별 문장 list.
+        """
+        for batch in _chunks(texts, batch_size):
+            for group in self.tagBatch(batch, grouped=True):
+                if grouped:
+                    yield group
                 else:
-                    try:
-                        result.append(Sentence.fromJava(self.__api.tagSentence(string(sentence))))
-                    except JavaError as e:
-                        error_handler(e)
+                    yield from group
+
+    @staticmethod
+    def __flatten(text) -> list:
+        paragraphs = []
+        for paragraph in text:
+            if type(paragraph) is list:
+                paragraphs += Tagger.__flatten(paragraph)
             else:
-                raise TypeError('%s type은 품사 분석을 수행할 수 없습니다.' % (type(sentence)))
+                paragraphs.append(paragraph)
 
-        return result
+        return paragraphs
+
+    @staticmethod
+    def __check_texts(texts, task: str) -> List[str]:
+        texts = list(texts)
+        for paragraph in texts:
+            if type(paragraph) is not str:
+                raise TypeError('%s type은 %s을 수행할 수 없습니다.' % (type(paragraph), task))
+
+        return texts
 
     def __call__(self, *args, **kwargs) -> List[Sentence]:
         """
@@ -192,23 +597,39 @@ class __CanAnalyzeProperty(object):
     :param str api: 사용할 분석기의 유형.
     :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
 
+    :keyword bool detached: True이면 분석 결과를 Python 객체로 모두 옮긴 다음 Java 참조를 바로 놓습니다. (기본값 False)
+    :keyword AnalysisCache cache: 분석 결과를 저장해두고 같은 텍스트 문단에 다시 사용할 :py:class:`AnalysisCache`. (기본값 None)
     :keyword str apiKey: ETRI 분석기의 경우, ETRI에서 발급받은 API Key (2.2.0 삭제 예정)
+
+    여러 스레드에서 하나의 분석기를 함께 사용할 수 있으며, 스레드마다 Java 분석기 객체를 따로 만들어 사용합니다.
     """
 
     def __init__(self, api: str, cls: str, **kwargs):
         self.__is_native = API.is_python_native(api)
+        self.__detached = kwargs.get('detached', False)
         try:
             if api == API.ETRI:
                 if 'apiKey' in kwargs:
                     logging.warning('2.2.0부터 %s의 키워드 인자 "apiKey"가 삭제될 예정입니다. '
                                     '2.1.0부터 추가된 인자인 "etri_key"를 사용해주세요.', __class__.__name__)
                     kwargs['etri_key'] = kwargs['apiKey']
-                self.__api = API.query(api, cls)(kwargs['etri_key'])
+                self.__apis = _PerThreadAPI(partial(API.query(api, cls), kwargs['etri_key']))
             else:
-                self.__api = API.query(api, cls)()
+                self.__apis = _PerThreadAPI(API.query(api, cls))
         except JavaError as e:
             error_handler(e)
 
+        self.__cache = kwargs.get('cache')
+        self.__cache_config = _cache_config(api, cls, kwargs)
+
+    @property
+    def __api(self):
+        return self.__apis.api()
+
+    def _java_api(self):
+        # Pipeline이 Java 분석기 객체를 직접 연결할 때 사용합니다. Python으로 구현된 분석기라면 None.
+        return None if self.__is_native else self.__apis.api()
+
     def analyze(self, *text) -> List[Sentence]:
         """
         문단(들)을 분석합니다.
@@ -221,20 +642,15 @@ class __CanAnalyzeProperty(object):
         result = []
         for paragraph in text:
             if type(paragraph) is str:
-                if self.__is_native:
-                    result += self.__api.analyze(paragraph)
-                else:
-                    try:
-                        result += py_list(self.__api.analyze(string(paragraph)), item_converter=Sentence.fromJava)
-                    except JavaError as e:
-                        error_handler(e)
+                result += _cached_groups(self.__cache, self.__cache_config, 'analyze', [paragraph],
+                                         lambda batch: [self.__analyze_text(batch[0])])[0]
             elif type(paragraph) is Sentence:
                 if self.__is_native:
                     result += self.__api.analyze(paragraph)
                 else:
                     ref = paragraph.getReference()
                     try:
-                        result.append(Sentence.fromJava(self.__api.analyze(ref)))
+                        result.append(Sentence.fromJava(self.__api.analyze(ref), detached=self.__detached))
                     except JavaError as e:
                         error_handler(e)
             elif type(paragraph) is list:
@@ -244,6 +660,63 @@ class __CanAnalyzeProperty(object):
 
         return result
 
+    def __analyze_text(self, paragraph: str) -> List[Sentence]:
+        if self.__is_native:
+            return self.__api.analyze(paragraph)
+        else:
+            try:
+                return Sentence.fromJavaList(self.__api.analyze(paragraph), detached=self.__detached)
+            except JavaError as e:
+                error_handler(e)
+
+    def __analyze_batch(self, texts: List[str]) -> List[List[Sentence]]:
+        return Sentence.fromJavaList(self.__apis.apply_batch('analyze', texts), grouped=True, detached=self.__detached)
+
+    def analyzeColumnar(self, texts: List[str]) -> TaggedBatch:
+        """
+        여러 문단을 한꺼번에 분석하여, 열(column) 단위로 저장한 결과를 돌려줍니다.
+        형태소, 어절, 문장마다 Python 객체를 만들지 않으며, 형태소와 의존구조 분석 결과만 저장합니다.
+
+        :param List[Union[str,Sentence,List[Sentence]]] texts: 분석할 문단들의 목록.
+        :rtype: TaggedBatch
+        :return: 분석된 결과. 항목 하나가 :py:class:`koalanlp.data.TaggedBatch` 의 문단 하나가 됩니다.
+        """
+        texts = list(texts)
+        batch = [paragraph for paragraph in texts if type(paragraph) is str and _SEP_DOCUMENT not in paragraph]
+
+        if self.__is_native or self.__cache is not None or len(texts) == 0 or len(batch) < len(texts):
+            return TaggedBatch.fromSentences([self.analyze(paragraph) for paragraph in texts], grouped=True)
+        else:
+            return TaggedBatch.fromJavaList(self.__apis.apply_batch('analyze', batch))
+
+    def iterAnalyze(self, texts: Iterable, batch_size: int = 64,
+                    grouped: bool = False) -> Iterator[Union[Sentence, List[Sentence]]]:
+        """
+        여러 문단을 차례로 분석하여, 분석된 결과를 입력 순서대로 하나씩 돌려줍니다.
+        연속된 텍스트 문단은 batch_size개씩 모아 한 번에 Java로 보내므로, 일괄 분석의 속도를 내면서도 전체 결과를 메모리에 담지 않습니다.
+
+        :param Iterable[Union[str,Sentence,List[str],List[Sentence]]] texts: 분석할 문단들.
+                각 항목은 텍스트(str), 문장 객체(Sentence), 텍스트의 리스트, 문장 객체의 리스트 중 하나.
+        :param int batch_size: 한 번에 Java로 보낼 문단의 수. (기본값 64)
+        :param bool grouped: True이면 항목별 문장 list를, False이면 문장을 하나씩 돌려줍니다. (기본값 False)
+        :rtype: Iterator[Union[Sentence,List[Sentence]]]
+        :return: 분석된 문장 또는 항목별 문장 list.
+        """
+        for chunk in _chunks(texts, batch_size):
+            batch = [paragraph for paragraph in chunk if type(paragraph) is str and _SEP_DOCUMENT not in paragraph]
+
+            if self.__is_native or len(batch) < len(chunk):
+                # 텍스트가 아닌 항목이 섞인 경우에는 항목마다 따로 분석합니다.
+                results = [self.analyze(paragraph) for paragraph in chunk]
+            else:
+                results = _cached_groups(self.__cache, self.__cache_config, 'analyze', batch, self.__analyze_batch)
+
+            for group in results:
+                if grouped:
+                    yield group
+                else:
+                    yield from group
+
     def __call__(self, *args, **kwargs) -> List[Sentence]:
         """
         문단(들)을 분석합니다.
@@ -262,6 +735,7 @@ class Parser(__CanAnalyzeProperty):
 
     :param str api: 사용할 분석기의 유형.
     :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
+    :keyword bool detached: True이면 분석 결과의 Java 참조를 바로 놓습니다. (기본값 False)
     :keyword str apiKey: ETRI 분석기의 경우, ETRI에서 발급받은 API Key (2.2.0 삭제 예정)
     """
 
@@ -275,6 +749,7 @@ class EntityRecognizer(__CanAnalyzeProperty):
 
     :param str api: 사용할 분석기의 유형.
     :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
+    :keyword bool detached: True이면 분석 결과의 Java 참조를 바로 놓습니다. (기본값 False)
     :keyword str apiKey: ETRI 분석기의 경우, ETRI에서 발급받은 API Key (2.2.0 삭제 예정)
     """
 
@@ -288,6 +763,7 @@ class RoleLabeler(__CanAnalyzeProperty):
 
     :param str api: 사용할 분석기의 유형.
     :keyword str etri_key: ETRI 분석기의 경우, ETRI에서 발급받은 API Key
+    :keyword bool detached: True이면 분석 결과의 Java 참조를 바로 놓습니다. (기본값 False)
     :keyword str apiKey: ETRI 분석기의 경우, ETRI에서 발급받은 API Key (2.2.0 삭제 예정)
     """
 
@@ -295,6 +771,400 @@ class RoleLabeler(__CanAnalyzeProperty):
         super().__init__(api, __class__.__name__, **kwargs)
 
 
+class Pipeline(object):
+    """
+    문장분리, 품사분석, 구문분석, 개체명 인식, 의미역 분석을 차례로 실행하는 분석 흐름을 만듭니다.
+    각 단계의 분석 결과를 Python 객체로 바꾸지 않고 Java 객체 그대로 다음 단계에 넘기며, 마지막 단계가 끝난 다음에 한 번만 변환합니다.
+    단계마다 걸린 시간을 :py:meth:`getTimings` 로 확인할 수 있습니다.
+
+    :param Tagger tagger: 품사분석에 사용할 분석기
+    :param analyzers: 품사분석 다음에 차례로 실행할 분석기들 (:py:class:`Parser`, :py:class:`EntityRecognizer`, :py:class:`RoleLabeler`) (가변인자)
+    :param SentenceSplitter splitter: 품사분석 전에 문장을 분리할 문장분리기. 지정하면 분리된 문장마다 tagSentence로 품사분석합니다.
+            (기본값: None = 품사분석기가 문장을 분리)
+    :param bool detached: True이면 분석 결과를 Python 객체로 모두 옮긴 다음 Java 참조를 바로 놓습니다. (기본값 False)
+
+    Python으로 구현된 분석기가 포함되어 있으면, 각 분석기를 차례로 호출합니다.
+    여러 스레드에서 하나의 분석 흐름을 함께 사용할 수 있으며, 스레드마다 Java 분석기 객체를 따로 사용합니다.
+    """
+
+    def __init__(self, tagger: Tagger, *analyzers, splitter: SentenceSplitter = None, detached: bool = False):
+        if type(tagger) is not Tagger:
+            raise TypeError('%s type은 품사분석 단계에 사용할 수 없습니다.' % type(tagger))
+        for analyzer in analyzers:
+            if not isinstance(analyzer, (Parser, EntityRecognizer, RoleLabeler)):
+                raise TypeError('%s type은 분석 단계에 사용할 수 없습니다.' % type(analyzer))
+        if splitter is not None and type(splitter) is not SentenceSplitter:
+            raise TypeError('%s type은 문장분리 단계에 사용할 수 없습니다.' % type(splitter))
+
+        self.__splitter = splitter
+        self.__tagger = tagger
+        self.__analyzers = list(analyzers)
+        self.__detached = detached
+        self.__is_native = any(stage._java_api() is None for stage in self.__stages())
+        self.__local = threading.local()
+
+        self.__names = []
+        for stage in self.__stages():
+            name = stage.__class__.__name__
+            count = sum(1 for previous in self.__names if previous.split('#')[0] == name)
+            self.__names.append(name if count == 0 else '%s#%d' % (name, count + 1))
+        self.__names.append('convert')
+
+        self.__timings_lock = threading.Lock()
+        self.resetTimings()
+
+    def __stages(self) -> list:
+        return ([self.__splitter] if self.__splitter is not None else []) + [self.__tagger] + self.__analyzers
+
+    def __functions(self):
+        # 스레드마다 그 스레드의 Java 분석기 객체를 연결한 함수를 만들어 둡니다.
+        local = self.__local
+        if not hasattr(local, 'first'):
+            try:
+                string_class = java_class('java.lang.String')
+                sentence_class = java_class('kr.bydelta.koala.data.Sentence')
+
+                if self.__splitter is not None:
+                    first = java_bound_method(self.__splitter._java_api(), 'invoke', string_class)
+                    elements = [java_bound_method(self.__tagger._java_api(), 'tagSentence', string_class)]
+                else:
+                    first = java_bound_method(self.__tagger._java_api(), 'tag', string_class)
+                    elements = []
+                elements += [java_bound_method(analyzer._java_api(), 'analyze', sentence_class)
+                             for analyzer in self.__analyzers]
+
+                local.first = java_function(first)
+                local.first_batch = java_function(java_split_map(first, _SEP_DOCUMENT))
+                local.rest = [java_function(java_list_map(java_list_map(element))) for element in elements]
+            except JavaError as e:
+                error_handler(e)
+
+        return local
+
+    def __record(self, index: int, start: float):
+        elapsed = time.perf_counter() - start
+        with self.__timings_lock:
+            self.__timings[self.__names[index]] += elapsed
+
+    def __run(self, texts: List[str]) -> List[List[Sentence]]:
+        if len(texts) == 0:
+            return []
+        elif self.__is_native:
+            return self.__run_python(texts)
+
+        functions = self.__functions()
+        try:
+            # 문단별 결과 list의 list를 Java 안에서 만들고, 단계마다 그 list를 한 번에 넘깁니다.
+            start = time.perf_counter()
+            if any(_SEP_DOCUMENT in paragraph for paragraph in texts):
+                value = java_list([functions.first.apply(paragraph) for paragraph in texts])
+            else:
+                value = functions.first_batch.apply(_SEP_DOCUMENT.join(texts))
+            self.__record(0, start)
+
+            for index, function in enumerate(functions.rest, 1):
+                start = time.perf_counter()
+                value = function.apply(value)
+                self.__record(index, start)
+        except JavaError as e:
+            error_handler(e)
+
+        start = time.perf_counter()
+        result = Sentence.fromJavaList(value, grouped=True, detached=self.__detached)
+        self.__record(len(self.__names) - 1, start)
+        return result
+
+    def __run_python(self, texts: List[str]) -> List[List[Sentence]]:
+        index = 0
+        start = time.perf_counter()
+        if self.__splitter is not None:
+            groups = [self.__splitter.sentences(paragraph) for paragraph in texts]
+            self.__record(index, start)
+
+            index += 1
+            start = time.perf_counter()
+            groups = [self.__tagger.tagSentenceBatch(group) for group in groups]
+        else:
+            groups = self.__tagger.tagBatch(texts, grouped=True)
+        self.__record(index, start)
+
+        for analyzer in self.__analyzers:
+            index += 1
+            start = time.perf_counter()
+            groups = [analyzer.analyze(group) for group in groups]
+            self.__record(index, start)
+
+        return groups
+
+    def analyze(self, *text) -> List[Sentence]:
+        """
+        문단(들)을 분석합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단들. 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과. (flattened list)
+        """
+        paragraphs = []
+        for paragraph in text:
+            if type(paragraph) is list:
+                paragraphs += paragraph
+            else:
+                paragraphs.append(paragraph)
+
+        return self.analyzeBatch(paragraphs)
+
+    def analyzeBatch(self, texts: List[str], grouped: bool = False) -> Union[List[Sentence], List[List[Sentence]]]:
+        """
+        여러 문단을 한꺼번에 분석합니다. 단계마다 문단 목록 전체를 한 번에 처리합니다.
+
+        :param List[str] texts: 분석할 문단들의 목록.
+        :param bool grouped: True이면 문단별로 묶은 결과를, False이면 analyze()와 같이 이어붙인 결과를 돌려줍니다. (기본값 False)
+        :rtype: Union[List[Sentence],List[List[Sentence]]]
+        :return: 분석된 결과. grouped=False이면 flattened list, grouped=True이면 문단별 문장 list의 list.
+        """
+        texts = list(texts)
+        for paragraph in texts:
+            if type(paragraph) is not str:
+                raise TypeError('%s type은 분석을 수행할 수 없습니다.' % type(paragraph))
+
+        result = self.__run(texts)
+
+        if grouped:
+            return result
+        else:
+            return [sentence for group in result for sentence in group]
+
+    def iterAnalyze(self, texts: Iterable[str], batch_size: int = 64,
+                    grouped: bool = False) -> Iterator[Union[Sentence, List[Sentence]]]:
+        """
+        여러 문단을 batch_size개씩 분석하여, 분석된 결과를 입력 순서대로 하나씩 돌려줍니다.
+
+        :param Iterable[str] texts: 분석할 문단들. 파일의 각 줄처럼 순회할 수 있는 객체라면 무엇이든 가능.
+        :param int batch_size: 한 번에 Java로 보낼 문단의 수. (기본값 64)
+        :param bool grouped: True이면 문단별 문장 list를, False이면 문장을 하나씩 돌려줍니다. (기본값 False)
+        :rtype: Iterator[Union[Sentence,List[Sentence]]]
+        :return: 분석된 문장 또는 문단별 문장 list.
+        """
+        for batch in _chunks(texts, batch_size):
+            for group in self.analyzeBatch(batch, grouped=True):
+                if grouped:
+                    yield group
+                else:
+                    yield from group
+
+    def getTimings(self) -> Dict[str, float]:
+        """
+        지금까지 각 단계에서 걸린 시간을 돌려줍니다.
+
+        :rtype: Dict[str,float]
+        :return: 단계 이름(분석기 class 이름, 같은 분석기가 여러 번 있으면 'Parser#2'처럼 번호를 붙임)과
+                 걸린 시간(초)의 dict. 'convert'는 마지막에 Python 객체로 변환하는 데 걸린 시간입니다.
+        """
+        with self.__timings_lock:
+            return OrderedDict(self.__timings)
+
+    def resetTimings(self):
+        """
+        각 단계에서 걸린 시간을 0으로 되돌립니다.
+        """
+        with self.__timings_lock:
+            self.__timings = OrderedDict((name, 0.0) for name in self.__names)
+
+    def __call__(self, *args, **kwargs) -> List[Sentence]:
+        """
+        문단(들)을 분석합니다.
+
+        :param Union[str,List[str]] text: 분석할 문단들. 텍스트와 string 리스트 혼용 가능. (가변인자)
+        :rtype: List[Sentence]
+        :return: 분석된 결과. (flattened list)
+        """
+        return self.analyze(*args)
+
+
+class _TokenBucket(object):
+    """
+    초당 rate개의 요청을 보낼 수 있도록 제한합니다. 쌓아둘 수 있는 요청은 최대 capacity개입니다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self):
+        # 요청을 보낼 수 있을 때까지 기다립니다.
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+                self.__updated = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait = (1 - self.__tokens) / self.__rate
+
+            time.sleep(wait)
+
+
+class ETRIExecutor(object):
+    """
+    ETRI Open API처럼 원격 서버에 문단마다 요청을 보내는 분석기를, 여러 작업 스레드에서 동시에 실행합니다.
+    하나의 요청이 늦어지더라도 다른 문단의 분석은 계속 진행되며, 요청 속도를 제한하고, 실패한 요청은 기다렸다가 다시 보냅니다.
+    같은 텍스트의 문단은 한 번만 요청하고, 같은 결과를 돌려줍니다.
+
+    :param analyzer: API.ETRI로 만든 분석기(:py:class:`Tagger`, :py:class:`Parser` 등).
+            문단 하나를 받아 문장 list를 돌려주는 함수라면 무엇이든 가능.
+    :param int max_concurrency: 동시에 보낼 수 있는 요청의 수. (기본값 4)
+    :param float rate: 1초에 보낼 수 있는 요청의 수. (기본값: None = 제한 없음)
+    :param int burst: 쉬고 있던 동안 모아두었다가 한꺼번에 보낼 수 있는 요청의 수. (기본값 1)
+    :param int max_retries: 실패한 요청을 다시 보낼 최대 횟수. 할당량을 아끼려면 작게 설정하세요. (기본값 3)
+    :param float backoff: 처음 실패한 후 다시 보내기까지 기다리는 시간(초). 실패할 때마다 두 배로 늘어납니다. (기본값 1.0)
+    :param float max_backoff: 다시 보내기까지 기다리는 최대 시간(초). (기본값 30.0)
+    :param retry_on: 다시 보낼 예외 type의 tuple. (기본값: Java 예외와 OSError)
+    """
+
+    def __init__(self, analyzer, max_concurrency: int = 4, rate: float = None, burst: int = 1, max_retries: int = 3,
+                 backoff: float = 1.0, max_backoff: float = 30.0, retry_on: tuple = (JavaError, OSError)):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency는 1 이상이어야 합니다.')
+        if rate is not None and rate <= 0:
+            raise ValueError('rate는 0보다 커야 합니다.')
+        if max_retries < 0:
+            raise ValueError('max_retries는 0 이상이어야 합니다.')
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError('backoff와 max_backoff는 0 이상이어야 합니다.')
+
+        self.__analyzer = analyzer
+        self.__bucket = _TokenBucket(rate, max(burst, 1)) if rate is not None else None
+        self.__max_retries = max_retries
+        self.__backoff = backoff
+        self.__max_backoff = max_backoff
+        self.__retry_on = retry_on
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.__lock = threading.Lock()
+        self.__pending = {}
+        self.__stats = {'requests': 0, 'retries': 0, 'failures': 0, 'deduplicated': 0}
+
+    def submit(self, text: str) -> Future:
+        """
+        문단 하나의 분석을 요청합니다. 같은 텍스트를 분석하는 중이라면, 새로 요청하지 않고 그 결과를 기다립니다.
+
+        :param str text: 분석할 문단
+        :rtype: concurrent.futures.Future
+        :return: 분석된 문장 list를 돌려줄 Future
+        """
+        if type(text) is not str:
+            raise TypeError('%s type은 ETRI 분석을 수행할 수 없습니다.' % type(text))
+
+        with self.__lock:
+            future = self.__pending.get(text)
+            if future is not None:
+                self.__stats['deduplicated'] += 1
+                return future
+
+            future = self.__executor.submit(self.__request, text)
+            self.__pending[text] = future
+
+        future.add_done_callback(partial(self.__forget, text))
+        return future
+
+    def __forget(self, text: str, future: Future):
+        with self.__lock:
+            if self.__pending.get(text) is future:
+                del self.__pending[text]
+
+    def __request(self, text: str) -> List[Sentence]:
+        delay = self.__backoff
+        for attempt in range(self.__max_retries + 1):
+            if self.__bucket is not None:
+                self.__bucket.acquire()
+
+            with self.__lock:
+                self.__stats['requests'] += 1
+
+            try:
+                return self.__analyzer(text)
+            except self.__retry_on as e:
+                if attempt >= self.__max_retries:
+                    with self.__lock:
+                        self.__stats['failures'] += 1
+                    raise
+
+                with self.__lock:
+                    self.__stats['retries'] += 1
+                logging.warning('ETRI 분석 요청이 실패하여, 다시 요청합니다. (%d/%d): %s', attempt + 1, self.__max_retries, e)
+
+                # 여러 요청이 동시에 실패하더라도 같은 순간에 다시 보내지 않도록, 기다리는 시간을 조금씩 다르게 합니다.
+                time.sleep(min(delay, self.__max_backoff) * random.uniform(0.5, 1.0))
+                delay *= 2
+
+    def analyze(self, texts: List[str], grouped: bool = False) -> Union[List[Sentence], List[List[Sentence]]]:
+        """
+        여러 문단을 동시에 분석합니다.
+
+        :param List[str] texts: 분석할 문단들의 목록.
+        :param bool grouped: True이면 문단별로 묶은 결과를, False이면 이어붙인 결과를 돌려줍니다. (기본값 False)
+        :rtype: Union[List[Sentence],List[List[Sentence]]]
+        :return: 분석된 결과. grouped=False이면 flattened list, grouped=True이면 문단별 문장 list의 list.
+        """
+        futures = {}
+        for text in texts:
+            if text in futures:
+                with self.__lock:
+                    self.__stats['deduplicated'] += 1
+            else:
+                futures[text] = self.submit(text)
+
+        result = [futures[text].result() for text in texts]
+
+        if grouped:
+            return result
+        else:
+            return [sentence for group in result for sentence in group]
+
+    def iterAnalyze(self, texts: Iterable[str], batch_size: int = 64,
+                    grouped: bool = False) -> Iterator[Union[Sentence, List[Sentence]]]:
+        """
+        여러 문단을 batch_size개씩 동시에 분석하여, 분석된 결과를 입력 순서대로 하나씩 돌려줍니다.
+
+        :param Iterable[str] texts: 분석할 문단들.
+        :param int batch_size: 한 번에 요청할 문단의 수. (기본값 64)
+        :param bool grouped: True이면 문단별 문장 list를, False이면 문장을 하나씩 돌려줍니다. (기본값 False)
+        :rtype: Iterator[Union[Sentence,List[Sentence]]]
+        :return: 분석된 문장 또는 문단별 문장 list.
+        """
+        for batch in _chunks(texts, batch_size):
+            for group in self.analyze(batch, grouped=True):
+                if grouped:
+                    yield group
+                else:
+                    yield from group
+
+    def getStats(self) -> Dict[str, int]:
+        """
+        :rtype: Dict[str,int]
+        :return: 'requests' (보낸 요청의 수), 'retries' (다시 보낸 요청의 수), 'failures' (끝내 실패한 문단의 수),
+                 'deduplicated' (중복되어 요청하지 않은 문단의 수)를 담은 dict
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def close(self):
+        """
+        진행 중인 요청이 끝나기를 기다린 다음, 작업 스레드를 정리합니다.
+        """
+        self.__executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class Dictionary(object):
     """
     사용자 정의 사전을 연결합니다.
@@ -304,6 +1174,7 @@ class Dictionary(object):
 
     def __init__(self, api: API):
         self.__is_native = API.is_python_native(api)
+        self.__api_name = api
         try:
             self.__api = API.query(api, __class__.__name__).INSTANCE
         except JavaError as e:
@@ -315,10 +1186,12 @@ class Dictionary(object):
 
         :param Tuple[str,POS] pairs: (표면형, 품사)의 가변형 인자
         """
+        _update_dictionary_version(self.__api_name, [(t[0], str(t[1])) for t in pairs])
+
         if self.__is_native:
             self.__api.addUserDictionary(*pairs)
         else:
-            surface_list = [string(t[0]) for t in pairs]
+            surface_list = [t[0] for t in pairs]
             tag_list = [t[1].reference for t in pairs]
             try:
                 self.__api.addUserDictionary(java_list(surface_list), java_list(tag_list))
@@ -345,9 +1218,9 @@ class Dictionary(object):
             else:
                 if len(tags) == 1:
                     tag = tags[0]
-                    return self.__api.contains(java_tuple(string(word), tag.reference))
+                    return self.__api.contains(java_tuple(word, tag.reference))
                 else:
-                    return self.__api.contains(string(word), java_set([tag.reference for tag in tags]))
+                    return self.__api.contains(word, java_set([tag.reference for tag in tags]))
         except JavaError as e:
             error_handler(e)
 
@@ -374,6 +1247,8 @@ class Dictionary(object):
         else:
             filter = {tag.name for tag in filter}
 
+        _update_dictionary_version(self.__api_name, (other.__api_name, fastAppend, sorted(filter)))
+
         if self.__is_native:
             self.__api.importFrom(other.__api, fastAppend, filter)
         else:
@@ -419,8 +1294,7 @@ class Dictionary(object):
             return self.__api.getItems()
         else:
             try:
-                return py_list(self.__api.getItems(),
-                               item_converter=lambda t: (t.getFirst(), POS.valueOf(t.getSecond().name())))
+                return py_list(self.__api.getItems(), item_converter=_pos_pair, encoder=_pos_pair_encoder())
             except JavaError as e:
                 error_handler(e)
 
@@ -436,11 +1310,11 @@ class Dictionary(object):
         if self.__is_native:
             return self.__api.getNotExists(onlySystemDic, *word)
         else:
-            zipped = [java_tuple(string(t[0]), t[1].reference) for t in word]
+            zipped = [java_tuple(t[0], t[1].reference) for t in word]
 
             try:
                 return py_list(self.__api.getNotExists(onlySystemDic, java_varargs(zipped, class_of('kotlin.Pair'))),
-                               item_converter=lambda t: (t.getFirst(), POS.valueOf(t.getSecond().name())))
+                               item_converter=_pos_pair, encoder=_pos_pair_encoder())
             except JavaError as e:
                 error_handler(e)
 
@@ -459,11 +1333,12 @@ class UTagger:
         :param conf_path: 설정 파일의 위치
         """
         try:
-            koala_class_of('utagger', 'UTagger').Companion.setPath(string(library_path), string(conf_path))
+            koala_class_of('utagger', 'UTagger').Companion.setPath(library_path, conf_path)
         except JavaError as e:
             error_handler(e)
 
 
 # ----- Define members exported -----
 
-__all__ = ['SentenceSplitter', 'Tagger', 'Parser', 'EntityRecognizer', 'RoleLabeler', 'Dictionary', 'UTagger']
+__all__ = ['SentenceSplitter', 'Tagger', 'Parser', 'EntityRecognizer', 'RoleLabeler', 'Dictionary', 'UTagger',
+           'Pipeline', 'AnalysisCache', 'ETRIExecutor']
@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Union
+
+from .data import Sentence, Word, Morpheme, SyntaxTree, DepEdge, RoleEdge, Entity, CoreferenceGroup
+
+# 파일 구조 (모든 정수는 little-endian)
+#   머리말: MAGIC(8) + 형식 버전(uint16) + 예약(uint16)
+#   문장마다: 정수 개수(uint32) + 문자열 bytes 길이(uint32) + 정수 배열(uint32 * 정수 개수) + UTF-8 문자열 bytes
+#   색인: 문장별 시작 위치(uint64 * 문장 수)
+#   꼬리말: 색인 위치(uint64) + 문장 수(uint64) + MAGIC(8)
+# 정수 배열은 [문자열 수, 문자열별 bytes 길이..., 어절, 형태소, 구문구조, 의존구조, 의미역, 개체명, 공지시어 묶음] 순서이며,
+# 문자열은 문장 안에서 중복 없이 한 번만 저장하고 정수 배열에서는 문자열의 번호로 가리킵니다.
+# 형태소의 의미 어깨번호는 정수 그대로 저장합니다. (버전 1에서는 문자열의 번호로 저장했습니다.)
+
+MAGIC = b'KOALANLP'  #: 파일의 처음과 끝에 기록하는 표지
+VERSION = 2  #: 현재 파일 형식 버전
+
+_HEADER = struct.Struct('<8sHH')
+_RECORD = struct.Struct('<II')
+_FOOTER = struct.Struct('<QQ8s')
+_NONE = 0xFFFFFFFF  #: 값이 없음(None)을 나타내는 정수
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+_BIG_ENDIAN = sys.byteorder != 'little'
+
+
+def _little_endian(values: array) -> array:
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+class _StringTable(object):
+    # 문장에 등장하는 문자열에 번호를 붙여, 같은 문자열은 한 번만 저장합니다.
+    def __init__(self):
+        self.ids = {}
+        self.lengths = array(_UINT32)
+        self.data = bytearray()
+
+    def __call__(self, value) -> int:
+        if value is None:
+            return _NONE
+
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = len(self.lengths)
+            encoded = value.encode('utf-8')
+            self.ids[value] = string_id
+            self.lengths.append(len(encoded))
+            self.data += encoded
+        return string_id
+
+
+def _word_id(word) -> int:
+    return _NONE if word is None else word.id
+
+
+def _encode_tree(tree, strings: _StringTable, body: array):
+    body.extend([strings(tree.label), strings(tree.originalLabel), _word_id(tree.terminal), len(tree)])
+    for child in tree:
+        _encode_tree(child, strings, body)
+
+
+def _encode_sentence(sentence: Sentence) -> bytes:
+    strings = _StringTable()
+    body = array(_UINT32)
+
+    body.append(len(sentence))
+    for word in sentence:
+        body.extend([strings(word.surface), len(word)])
+    for word in sentence:
+        for morph in word:
+            body.extend([strings(morph.surface), strings(morph.tag), strings(morph.originalTag),
+                         _NONE if morph.wordSense is None else int(morph.wordSense)])
+
+    tree = sentence.getSyntaxTree()
+    if tree is None:
+        body.append(0)
+    else:
+        body.append(1)
+        _encode_tree(tree, strings, body)
+
+    dependencies = sentence.getDependencies()
+    body.append(len(dependencies))
+    for edge in dependencies:
+        body.extend([_word_id(edge.governor), _word_id(edge.dependent), strings(edge.type), strings(edge.depType),
+                     strings(edge.originalLabel)])
+
+    roles = sentence.getRoles()
+    body.append(len(roles))
+    for edge in roles:
+        body.extend([_word_id(edge.predicate), _word_id(edge.argument), strings(edge.label),
+                     strings(edge.originalLabel), len(edge.modifiers)])
+        body.extend(_word_id(word) for word in edge.modifiers)
+
+    entities = sentence.getEntities()
+    body.append(len(entities))
+    for entity in entities:
+        body.extend([strings(entity.surface), strings(entity.label), strings(entity.fineLabel),
+                     strings(entity.originalLabel), len(entity)])
+        for morph in entity:
+            body.extend([morph.word.id, morph.id])
+
+    entity_ids = {id(entity): i for i, entity in enumerate(entities)}
+    groups = sentence.getCorefGroups()
+    body.append(len(groups))
+    for group in groups:
+        body.append(len(group))
+        body.extend(entity_ids[id(entity)] if id(entity) in entity_ids else entities.index(entity)
+                    for entity in group)
+
+    ints = array(_UINT32, [len(strings.lengths)])
+    ints.extend(strings.lengths)
+    ints.extend(body)
+    return _RECORD.pack(len(ints), len(strings.data)) + _little_endian(ints).tobytes() + bytes(strings.data)
+
+
+def _decode_sentence(buffer, offset: int, version: int = VERSION) -> Sentence:
+    n_ints, n_bytes = _RECORD.unpack_from(buffer, offset)
+    offset += _RECORD.size
+    ints = array(_UINT32)
+    ints.frombytes(buffer[offset:offset + n_ints * ints.itemsize])
+    _little_endian(ints)
+    offset += n_ints * ints.itemsize
+    data = buffer[offset:offset + n_bytes]
+
+    cursor = iter(ints)
+    take = cursor.__next__
+
+    strings = []
+    begin = 0
+    for _ in range(take()):
+        end = begin + take()
+        strings.append(bytes(data[begin:end]).decode('utf-8'))
+        begin = end
+
+    def string():
+        value = take()
+        return None if value == _NONE else strings[value]
+
+    sizes = [(strings[take()], take()) for _ in range(take())]
+    words = []
+    for surface, size in sizes:
+        morphemes = []
+        for _ in range(size):
+            morph = Morpheme(surface=strings[take()], tag=strings[take()], originalTag=string())
+            sense = take()
+            if sense == _NONE:
+                morph.wordSense = None
+            else:
+                morph.wordSense = sense if version >= 2 else int(strings[sense])
+            morphemes.append(morph)
+        words.append(Word(surface=surface, morphemes=morphemes))
+
+    sentence = Sentence(words)
+
+    def word():
+        value = take()
+        return None if value == _NONE else sentence[value]
+
+    def tree():
+        label, original, terminal = strings[take()], string(), word()
+        return SyntaxTree(label=label, terminal=terminal, children=[tree() for _ in range(take())],
+                          originalLabel=original)
+
+    if take() > 0:
+        sentence.syntaxTree = tree()
+
+    sentence.dependencies = [DepEdge(governor=word(), dependent=word(), type=strings[take()], depType=string(),
+                                     originalLabel=string())
+                             for _ in range(take())]
+
+    roles = []
+    for _ in range(take()):
+        predicate, argument, label, original = word(), word(), strings[take()], string()
+        roles.append(RoleEdge(predicate=predicate, argument=argument, label=label,
+                              modifiers=[word() for _ in range(take())], originalLabel=original))
+    sentence.roles = roles
+
+    entities = []
+    for _ in range(take()):
+        surface, label, fine_label, original = strings[take()], strings[take()], strings[take()], string()
+        morphemes = [sentence[take()][take()] for _ in range(take())]
+        entities.append(Entity(surface=surface, label=label, fineLabel=fine_label, morphemes=morphemes,
+                               originalLabel=original))
+    sentence.entities = entities
+
+    sentence.corefGroups = [CoreferenceGroup([entities[take()] for _ in range(take())]) for _ in range(take())]
+    return sentence
+
+
+class SentenceWriter(object):
+    """
+    분석된 문장을 이진 파일에 차례로 기록합니다. 문장을 모두 기록한 다음 :py:meth:`close` 를 호출해야 색인이 기록됩니다.
+    기록한 파일은 :py:class:`SentenceFile` 또는 :py:func:`load` 로 읽을 수 있습니다.
+
+    :param Union[str,BinaryIO] file: 기록할 파일의 경로 또는 binary 모드로 열린 파일 객체.
+    """
+
+    def __init__(self, file):
+        self.__own_file = type(file) is str
+        self.__file = open(file, 'wb') if self.__own_file else file
+        self.__offsets = array('Q')
+        self.__position = self.__file.write(_HEADER.pack(MAGIC, VERSION, 0))
+
+    def write(self, sentence: Sentence):
+        """
+        문장 하나를 기록합니다. 구문구조, 의존구조, 의미역, 개체명, 공지시어 묶음을 함께 기록하며, Java 참조는 기록하지 않습니다.
+
+        :param Sentence sentence: 기록할 문장
+        """
+        record = _encode_sentence(sentence)
+        self.__offsets.append(self.__position)
+        self.__position += self.__file.write(record)
+
+    def writeAll(self, sentences: List[Sentence]):
+        """
+        여러 문장을 차례로 기록합니다.
+
+        :param Iterable[Sentence] sentences: 기록할 문장들
+        """
+        for sentence in sentences:
+            self.write(sentence)
+
+    def close(self):
+        """
+        색인을 기록하고 파일을 닫습니다. 직접 넘겨준 파일 객체는 닫지 않습니다.
+        """
+        if self.__offsets is None:
+            return
+
+        index = self.__position
+        self.__file.write(_little_endian(self.__offsets).tobytes())
+        self.__file.write(_FOOTER.pack(index, len(self.__offsets), MAGIC))
+        self.__offsets = None
+
+        if self.__own_file:
+            self.__file.close()
+        else:
+            self.__file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SentenceFile(object):
+    """
+    이진 파일에 기록된 문장들을 읽습니다. 파일을 memory-map으로 열고, 문장은 요청할 때마다 해당 위치만 읽어서 만듭니다.
+    JVM이 필요하지 않으므로, :py:func:`koalanlp.Util.initialize` 없이 사용할 수 있습니다.
+
+    :param Union[str,bytes] file: 읽을 파일의 경로 또는 :py:func:`dumps` 로 만든 bytes.
+    """
+
+    def __init__(self, file: Union[str, bytes]):
+        if type(file) is str:
+            with open(file, 'rb') as fp:
+                self.__buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.__buffer = file
+
+        buffer = self.__buffer
+        if len(buffer) < _HEADER.size + _FOOTER.size:
+            raise ValueError('KoalaNLP 문장 파일이 아닙니다.')
+
+        magic, version, _ = _HEADER.unpack_from(buffer, 0)
+        index, count, tail = _FOOTER.unpack_from(buffer, len(buffer) - _FOOTER.size)
+        if magic != MAGIC or tail != MAGIC:
+            raise ValueError('KoalaNLP 문장 파일이 아니거나, 기록이 끝나지 않은 파일입니다.')
+        if version > VERSION:
+            raise ValueError('지원하지 않는 파일 형식 버전(%s)입니다. KoalaNLP를 업데이트해주세요.' % version)
+
+        self.__version = version
+        self.__offsets = array('Q')
+        self.__offsets.frombytes(buffer[index:index + count * self.__offsets.itemsize])
+        _little_endian(self.__offsets)
+
+    def __len__(self) -> int:
+        """
+        :rtype: int
+        :return: 파일에 기록된 문장의 수
+        """
+        return len(self.__offsets)
+
+    def __getitem__(self, item) -> Union[Sentence, List[Sentence]]:
+        """
+        기록된 문장을 읽습니다.
+
+        :param Union[int,slice] item: 읽을 문장의 위치 또는 slice
+        :rtype: Union[Sentence,List[Sentence]]
+        :return: 해당 위치의 문장(들)
+        """
+        if type(item) is slice:
+            return [_decode_sentence(self.__buffer, offset, self.__version) for offset in self.__offsets[item]]
+        return _decode_sentence(self.__buffer, self.__offsets[item], self.__version)
+
+    def __iter__(self) -> Iterator[Sentence]:
+        for offset in self.__offsets:
+            yield _decode_sentence(self.__buffer, offset, self.__version)
+
+    def close(self):
+        """
+        memory-map을 닫습니다.
+        """
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def dump(sentences: List[Sentence], file):
+    """
+    분석된 문장들을 이진 파일로 기록합니다.
+
+    :param List[Sentence] sentences: 기록할 문장들
+    :param Union[str,BinaryIO] file: 기록할 파일의 경로 또는 binary 모드로 열린 파일 객체.
+    """
+    with SentenceWriter(file) as writer:
+        writer.writeAll(sentences)
+
+
+def dumps(sentences: List[Sentence]) -> bytes:
+    """
+    분석된 문장들을 이진 형식의 bytes로 변환합니다.
+
+    :param List[Sentence] sentences: 변환할 문장들
+    :rtype: bytes
+    :return: :py:func:`loads` 로 읽을 수 있는 bytes
+    """
+    from io import BytesIO
+
+    buffer = BytesIO()
+    dump(sentences, buffer)
+    return buffer.getvalue()
+
+
+def load(file: str) -> List[Sentence]:
+    """
+    이진 파일에 기록된 문장을 모두 읽습니다. 큰 파일의 일부만 읽을 때에는 :py:class:`SentenceFile` 을 사용하세요.
+
+    :param str file: 읽을 파일의 경로
+    :rtype: List[Sentence]
+    :return: 기록된 문장들
+    """
+    with SentenceFile(file) as reader:
+        return list(reader)
+
+
+def loads(data: bytes) -> List[Sentence]:
+    """
+    :py:func:`dumps` 로 만든 bytes에서 문장을 모두 읽습니다.
+
+    :param bytes data: 읽을 bytes
+    :rtype: List[Sentence]
+    :return: 기록된 문장들
+    """
+    return list(SentenceFile(data))
+
+
+# ----- Declare members exported -----
+
+__all__ = ['SentenceWriter', 'SentenceFile', 'dump', 'dumps', 'load', 'loads']
@@ -4,9 +4,21 @@
 from .jvm import *
 
 
+def _enum_encoder():
+    # Enum 값의 참조, 명칭, 순서 번호, 클래스 이름을 한 번에 가져옵니다.
+    def build():
+        enum = java_class('java.lang.Enum')
+        return java_list_encoder(java_answer(), java_answer(enum, 'name'), java_answer(enum, 'ordinal'),
+                                 java_answer(enum, 'getClass', 'getName'))
+
+    return java_cached('types.Enum', build)
+
+
 def _enum_value_dict(cls, item_converter):
     try:
-        return {value.name: value for value in py_list(koala_class_of(cls).values(), item_converter)}
+        return {value.name: value
+                for value in py_list(koala_class_of(cls).values(), lambda t: item_converter(*t),
+                                     encoder=_enum_encoder())}
     except JavaError as e:
         error_handler(e)
 
@@ -15,8 +27,14 @@ class _JavaEnum(object):
     name = ''  #: Enum 명칭
     ordinal = -1  #: 순서 번호
 
-    def __init__(self, reference):
+    def __init__(self, reference, name: str = None, ordinal: int = None, classType: str = None):
         self.reference = reference
+        if name is not None:
+            self.name = name
+            self.ordinal = ordinal
+            self.classType = classType
+            return
+
         try:
             self.name = reference.name()
             self.ordinal = reference.ordinal()
@@ -31,16 +49,47 @@ class _JavaEnum(object):
         return isinstance(other, _JavaEnum) and other.classType == self.classType and other.ordinal == self.ordinal
 
 
+_POS_CATEGORIES = ['isNoun', 'isPredicate', 'isModifier', 'isPostPosition', 'isEnding', 'isAffix', 'isSuffix',
+                   'isSymbol', 'isUnknown']
+
+
+def _pos_category_dict(names) -> dict:
+    # 품사 분류마다, 해당하는 품사 이름의 집합을 Py4J 통신 1회로 가져옵니다.
+    # 품사 이름의 모든 앞부분(prefix)에 대한 startsWith 결과도 함께 가져와 (prefix, 품사 이름)의 집합으로 만듭니다.
+    prefixes = sorted({name[:i] for name in names for i in range(1, len(name) + 1)})
+
+    def build():
+        pos = java_class('kr.bydelta.koala.POS')
+        fields = [java_answer(pos, 'name')]
+        fields += [java_answer(pos, name) for name in _POS_CATEGORIES]
+        fields += [java_answer(pos, java_call(pos, 'startsWith', prefix)) for prefix in prefixes]
+        return java_list_encoder(*fields)
+
+    try:
+        rows = py_list(koala_class_of('POS').values(), lambda t: t, encoder=java_cached('types.POS.categories', build))
+    except JavaError as e:
+        error_handler(e)
+
+    categories = {category: frozenset(row[0] for row in rows if row[i + 1])
+                  for i, category in enumerate(_POS_CATEGORIES)}
+    categories['startsWith'] = frozenset((prefix, row[0]) for row in rows
+                                         for i, prefix in enumerate(prefixes) if row[i + 1 + len(_POS_CATEGORIES)])
+    categories['prefixes'] = frozenset(prefixes)
+    return categories
+
+
 class POS(_JavaEnum):
     """ 세종 품사표기 """
 
     __VALUES__ = {}
+    __CATEGORIES__ = {}
+    __STARTS_WITH__ = {}
 
-    def __init__(self, reference):
+    def __init__(self, reference, *args):
         """
         세종 품사표기 표준안을 Enum Class로 담았습니다.
         """
-        super().__init__(reference)
+        super().__init__(reference, *args)
 
     @staticmethod
     def values():
@@ -51,10 +100,12 @@ class POS(_JavaEnum):
         :return: 모든 품사 태그의 Set
         """
         if len(POS.__VALUES__) == 0:
-            POS.__VALUES__ = _enum_value_dict(__class__.__name__, lambda x: POS(x))
+            POS.__VALUES__ = _enum_value_dict(__class__.__name__, POS)
             for name, value in POS.__VALUES__.items():
                 setattr(POS, name, value)
 
+            POS.__CATEGORIES__ = _pos_category_dict(POS.__VALUES__.keys())
+
         return POS.__VALUES__.values()
 
     @staticmethod
@@ -76,10 +127,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 체언인 경우 True
         """
-        try:
-            return self.reference.isNoun()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isNoun')
 
     def isPredicate(self) -> bool:
         """
@@ -88,10 +136,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 용언인 경우 True
         """
-        try:
-            return self.reference.isPredicate()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isPredicate')
 
     def isModifier(self) -> bool:
         """
@@ -100,10 +145,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 수식언인 경우 True
         """
-        try:
-            return self.reference.isModifier()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isModifier')
 
     def isPostPosition(self) -> bool:
         """
@@ -112,10 +154,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 관계언인 경우 True
         """
-        try:
-            return self.reference.isPostPosition()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isPostPosition')
 
     def isEnding(self) -> bool:
         """
@@ -124,10 +163,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 어미인 경우 True
         """
-        try:
-            return self.reference.isEnding()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isEnding')
 
     def isAffix(self) -> bool:
         """
@@ -136,10 +172,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 접사인 경우 True
         """
-        try:
-            return self.reference.isAffix()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isAffix')
 
     def isSuffix(self) -> bool:
         """
@@ -148,10 +181,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 접미사인 경우 True
         """
-        try:
-            return self.reference.isSuffix()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isSuffix')
 
     def isSymbol(self) -> bool:
         """
@@ -160,10 +190,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 기호인 경우 True
         """
-        try:
-            return self.reference.isSymbol()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isSymbol')
 
     def isUnknown(self) -> bool:
         """
@@ -172,10 +199,7 @@ class POS(_JavaEnum):
         :rtype: bool
         :return: 미확인 단어인 경우 True
         """
-        try:
-            return self.reference.isUnknown()
-        except JavaError as e:
-            error_handler(e)
+        return self.__in_category('isUnknown')
 
     def startsWith(self, tag: str) -> bool:
         """
@@ -185,10 +209,29 @@ class POS(_JavaEnum):
 
         :return: 포함되는 경우(시작하는 경우) True
         """
-        try:
-            return self.reference.startsWith(string(tag))
-        except JavaError as e:
-            error_handler(e)
+        if tag in self.__category('prefixes'):
+            return (tag, self.name) in self.__category('startsWith')
+
+        # 품사 이름의 앞부분이 아닌 tag는, 같은 (품사, tag) 쌍에 대해 Java에 한 번만 물어봅니다.
+        key = (self.name, tag)
+        if key not in POS.__STARTS_WITH__:
+            try:
+                POS.__STARTS_WITH__[key] = self.reference.startsWith(tag)
+            except JavaError as e:
+                error_handler(e)
+
+        return POS.__STARTS_WITH__[key]
+
+    @staticmethod
+    def __category(category: str) -> frozenset:
+        # 품사 분류는 초기화할 때 미리 가져온 집합을 사용하므로, Java를 호출하지 않습니다.
+        if len(POS.__CATEGORIES__) == 0:
+            POS.values()
+
+        return POS.__CATEGORIES__[category]
+
+    def __in_category(self, category: str) -> bool:
+        return self.name in self.__category(category)
 
 
 class PhraseTag(_JavaEnum):
@@ -196,11 +239,11 @@ class PhraseTag(_JavaEnum):
 
     __VALUES__ = {}
     
-    def __init__(self, reference):
+    def __init__(self, reference, *args):
         """
         세종 구문구조 표지자를 Enum Class로 담았습니다.
         """
-        super().__init__(reference)
+        super().__init__(reference, *args)
 
     @staticmethod
     def values():
@@ -211,7 +254,7 @@ class PhraseTag(_JavaEnum):
         :return: 모든 구문구조 태그의 Set
         """
         if len(PhraseTag.__VALUES__) == 0:
-            PhraseTag.__VALUES__ = _enum_value_dict(__class__.__name__, lambda x: PhraseTag(x))
+            PhraseTag.__VALUES__ = _enum_value_dict(__class__.__name__, PhraseTag)
             for name, value in PhraseTag.__VALUES__.items():
                 setattr(PhraseTag, name, value)
 
@@ -235,11 +278,11 @@ class DependencyTag(_JavaEnum):
 
     __VALUES__ = {}
     
-    def __init__(self, reference):
+    def __init__(self, reference, *args):
         """
         ETRI 의존구문구조 기능표지자를 Enum Class로 담았습니다.
         """
-        super().__init__(reference)
+        super().__init__(reference, *args)
 
     @staticmethod
     def values():
@@ -250,7 +293,7 @@ class DependencyTag(_JavaEnum):
         :return: 모든 의존구조 기능 태그의 Set
         """
         if len(DependencyTag.__VALUES__) == 0:
-            DependencyTag.__VALUES__ = _enum_value_dict(__class__.__name__, lambda x: DependencyTag(x))
+            DependencyTag.__VALUES__ = _enum_value_dict(__class__.__name__, DependencyTag)
             for name, value in DependencyTag.__VALUES__.items():
                 setattr(DependencyTag, name, value)
 
@@ -274,11 +317,11 @@ class RoleType(_JavaEnum):
 
     __VALUES__ = {}
     
-    def __init__(self, reference):
+    def __init__(self, reference, *args):
         """
         ETRI 의미역 분석 표지를 Enum Class로 담았습니다.
         """
-        super().__init__(reference)
+        super().__init__(reference, *args)
 
     @staticmethod
     def values():
@@ -290,7 +333,7 @@ class RoleType(_JavaEnum):
         """
 
         if len(RoleType.__VALUES__) == 0:
-            RoleType.__VALUES__ = _enum_value_dict(__class__.__name__, lambda x: RoleType(x))
+            RoleType.__VALUES__ = _enum_value_dict(__class__.__name__, RoleType)
             for name, value in RoleType.__VALUES__.items():
                 setattr(RoleType, name, value)
 
@@ -313,11 +356,11 @@ class CoarseEntityType(_JavaEnum):
     """ ETRI 개체명 대분류 """
     __VALUES__ = {}
     
-    def __init__(self, reference):
+    def __init__(self, reference, *args):
         """
         ETRI 개체명 대분류를 Enum Class로 담았습니다.
         """
-        super().__init__(reference)
+        super().__init__(reference, *args)
 
     @staticmethod
     def values():
@@ -328,7 +371,7 @@ class CoarseEntityType(_JavaEnum):
         :return: 모든 개체명 태그의 Set
         """
         if len(CoarseEntityType.__VALUES__) == 0:
-            CoarseEntityType.__VALUES__ = _enum_value_dict(__class__.__name__, lambda x: CoarseEntityType(x))
+            CoarseEntityType.__VALUES__ = _enum_value_dict(__class__.__name__, CoarseEntityType)
             for name, value in CoarseEntityType.__VALUES__.items():
                 setattr(CoarseEntityType, name, value)
 
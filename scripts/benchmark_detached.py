@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+분석 결과를 보관할 때, Java 참조를 유지하는 경우와 놓는 경우(detached)의 JVM 메모리 사용량을 비교합니다.
+
+    python scripts/benchmark_detached.py --documents 2000
+"""
+
+import argparse
+
+from koalanlp import API, Util
+from koalanlp.jvm import jvm_memory
+from koalanlp.proc import Tagger
+
+SAMPLE = ['나는 밥을 먹었고, 영희는 짐을 쌌다.', '오늘 날씨가 좋아서 공원에 산책을 나갔습니다.',
+          '중국 관영매체 환구시보가 북핵문제에 대해 제시한 중국의 마지노선입니다.']
+
+
+def measure(detached: bool, documents: int) -> dict:
+    before = jvm_memory(collect=True)
+    tagger = Tagger(API.OKT, detached=detached)
+    kept = tagger.tagBatch([SAMPLE[i % len(SAMPLE)] for i in range(documents)], grouped=True)
+
+    # 분석 결과의 구조와 참조를 한 번씩 사용하여, 오래 보관된 결과처럼 만듭니다.
+    for group in kept:
+        for sentence in group:
+            sentence.getDependencies()
+            sentence[0].reference
+
+    after = jvm_memory(collect=True)
+    del kept
+    return {key: after[key] - before[key] for key in ['heapUsed', 'gatewayObjects']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분석 결과 보관 시 JVM 메모리 사용량 비교')
+    parser.add_argument('--documents', type=int, default=2000, help='분석하여 보관할 문단의 수 (기본값 2000)')
+    args = parser.parse_args()
+
+    Util.initialize(OKT='LATEST')
+    try:
+        print('%-10s %16s %16s' % ('mode', 'heap used (KB)', 'gateway objects'))
+        for detached in [False, True]:
+            diff = measure(detached, args.documents)
+            print('%-10s %16.1f %16d' % ('detached' if detached else 'attached', diff['heapUsed'] / 1024,
+                                         diff['gatewayObjects']))
+    finally:
+        Util.finalize()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ExtUtil의 한글 자모 함수들을 Python 구현과 Java(KoalaNLP core) 구현으로 각각 실행하여 결과가 같은지 확인하고, 속도를 비교합니다.
+
+    python scripts/benchmark_hangul.py --repeat 3
+"""
+
+import argparse
+import time
+
+from koalanlp import Util, ExtUtil
+from koalanlp import jvm
+
+# 한글 자모, 호환용 자모, 자모 확장, 완성형 한글 영역과 그 주변, 그리고 일반 문자들.
+SAMPLE = ''.join(chr(code) for start, end in [(0x20, 0x7E), (0x10F0, 0x1210), (0x3120, 0x31A0), (0xA950, 0xA990),
+                                              (0xABF0, 0xD810)]
+                 for code in range(start, end))
+
+
+def java_functions():
+    ext = jvm.koala_class_of('ExtUtil')
+
+    def triple(ch):
+        result = jvm.py_triple(ext.dissembleHangul(ch))
+        return ch if result is None else ''.join(c for c in result if c is not None)
+
+    return {
+        'isHangul': lambda text: [ext.isHangul(ch) for ch in text],
+        'isCompleteHangul': lambda text: [ext.isCompleteHangul(ch) for ch in text],
+        'isIncompleteHangul': lambda text: [ext.isIncompleteHangul(ch) for ch in text],
+        'isChosungJamo': lambda text: [ext.isChosungJamo(ch) for ch in text],
+        'isJungsungJamo': lambda text: [ext.isJungsungJamo(ch) for ch in text],
+        'isJongsungJamo': lambda text: [ext.isJongsungJamo(ch) for ch in text],
+        'isHangulEnding': lambda text: [ext.isHangulEnding(jvm.string(ch)) for ch in text],
+        'isJongsungEnding': lambda text: [ext.isJongsungEnding(jvm.string(ch)) for ch in text],
+        'getChosung': lambda text: [ext.getChosung(ch) for ch in text],
+        'getJungsung': lambda text: [ext.getJungsung(ch) for ch in text],
+        'getJongsung': lambda text: [ext.getJongsung(ch) for ch in text],
+        'dissembleHangul': lambda text: ''.join(triple(ch) for ch in text),
+        'assembleHangul': lambda text: str(ext.assembleHangulString(text)),
+    }
+
+
+def python_functions():
+    return {
+        'isHangulEnding': lambda text: [ExtUtil.isHangulEnding(ch) for ch in text],
+        'isJongsungEnding': lambda text: [ExtUtil.isJongsungEnding(ch) for ch in text],
+        'assembleHangul': lambda text: ExtUtil.assembleHangul(text),
+    }
+
+
+def timed(func, text, repeat):
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        result = func(text)
+    return result, (time.perf_counter() - begin) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ExtUtil 한글 함수 비교')
+    parser.add_argument('--repeat', type=int, default=3, help='Python 구현을 반복 실행할 횟수 (기본값 3)')
+    args = parser.parse_args()
+
+    # Java 구현과 비교하기 위한 문자열: 각 문자와, 분해 후 재조합할 문자열
+    assemble_sample = ExtUtil.dissembleHangul(SAMPLE) + 'ᄀᄀ ᆨᆨ 가ᅡ'
+
+    Util.initialize(CORE='LATEST')
+    try:
+        java = java_functions()
+        python = python_functions()
+        mismatches = 0
+
+        print('%-20s %12s %12s %10s' % ('function', 'java (ms)', 'python (ms)', 'speed-up'))
+        for name, java_func in java.items():
+            py_func = python.get(name, getattr(ExtUtil, name))
+            text = assemble_sample if name == 'assembleHangul' else SAMPLE
+
+            expected, java_time = timed(java_func, text, 1)
+            actual, py_time = timed(py_func, text, args.repeat)
+
+            if expected != actual:
+                mismatches += 1
+                diff = [(ch, e, a) for ch, e, a in zip(text, expected, actual) if e != a][:5]
+                print('%-20s MISMATCH %s' % (name, diff))
+            else:
+                print('%-20s %12.1f %12.3f %9.0fx' % (name, java_time * 1000, py_time * 1000,
+                                                      java_time / max(py_time, 1e-9)))
+
+        print('%d characters, %d mismatch(es)' % (len(SAMPLE), mismatches))
+    finally:
+        Util.finalize()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+가짜 Maven 저장소를 제공하는 로컬 HTTP 서버에서 POM 파일을 내려받을 때, 요청마다 새로 연결하는 경우와
+jip의 공유 Session(keep-alive 연결 재사용)을 사용하는 경우의 시간과 연결 수를 비교합니다.
+
+    python scripts/benchmark_http.py --files 300 --threads 8
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+
+from koalanlp.jip.util import JIP_USER_AGENT, download_string
+
+POM = '<project><groupId>org.example</groupId><artifactId>artifact%d</artifactId><version>1.0</version></project>'
+
+
+class MavenHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # 헤더와 본문을 따로 보내므로, 지연된 ACK를 기다리지 않게 합니다.
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        # /org/example/artifact<N>/1.0/artifact<N>-1.0.pom
+        number = int(self.path.split('/')[3][len('artifact'):])
+        body = (POM % number).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MavenServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def measure(server, fetch, files: int, threads: int) -> dict:
+    urls = ['http://127.0.0.1:%d/org/example/artifact%d/1.0/artifact%d-1.0.pom' % (server.server_port, i, i)
+            for i in range(files)]
+    server.connections = 0
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(fetch, urls))
+    elapsed = time.perf_counter() - start
+
+    return {'elapsed': elapsed, 'connections': server.connections}
+
+
+def fetch_without_pool(url):
+    response = requests.get(url, headers={'User-Agent': JIP_USER_AGENT})
+    response.raise_for_status()
+    return response.text
+
+
+def main():
+    parser = argparse.ArgumentParser(description='jip HTTP 연결 재사용 효과 비교')
+    parser.add_argument('--files', type=int, default=300, help='내려받을 POM 파일의 수 (기본값 300)')
+    parser.add_argument('--threads', type=int, default=8, help='동시에 내려받을 스레드 수 (기본값 8)')
+    args = parser.parse_args()
+
+    server = MavenServer(('127.0.0.1', 0), MavenHandler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        print('%-12s %10s %10s %12s' % ('transport', 'time (s)', 'files/s', 'connections'))
+        for name, fetch in [('per-request', fetch_without_pool), ('session', download_string)]:
+            result = measure(server, fetch, args.files, args.threads)
+            print('%-12s %10.3f %10.1f %12d' % (name, result['elapsed'], args.files / result['elapsed'],
+                                                 result['connections']))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+분석 결과 객체(Sentence, Word, Morpheme, DepEdge)를 만들 때의 메모리 사용량과 생성 시간을 측정합니다.
+JVM 없이 Python 객체만 만들어 측정하므로, 초기화 과정이 필요하지 않습니다.
+
+    python scripts/benchmark_memory.py --sentences 20000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from koalanlp.data import Sentence, Word, Morpheme, DepEdge
+
+# (어절 표면형, [(형태소 표면형, 품사)]) 목록. 7어절, 16형태소.
+SAMPLE = [('나는', [('나', 'NP'), ('는', 'JX')]),
+          ('오늘', [('오늘', 'NNG')]),
+          ('밥을', [('밥', 'NNG'), ('을', 'JKO')]),
+          ('먹었고,', [('먹', 'VV'), ('었', 'EP'), ('고', 'EC'), (',', 'SP')]),
+          ('영희는', [('영희', 'NNP'), ('는', 'JX')]),
+          ('짐을', [('짐', 'NNG'), ('을', 'JKO')]),
+          ('쌌다.', [('싸', 'VV'), ('았다', 'EF'), ('.', 'SF')])]
+N_MORPHEMES = sum(len(morphs) for _, morphs in SAMPLE)
+
+
+def build(count: int) -> list:
+    sentences = []
+    for _ in range(count):
+        words = [Word(surface, [Morpheme(m, tag) for m, tag in morphs]) for surface, morphs in SAMPLE]
+        sentence = Sentence(words)
+        for i, word in enumerate(words[:-1]):
+            DepEdge(words[-1], word, 'NP', 'SBJ')
+        sentences.append(sentence)
+    return sentences
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분석 결과 객체의 메모리 사용량과 생성 시간 측정')
+    parser.add_argument('--sentences', type=int, default=20000, help='만들 문장의 수 (기본값 20000)')
+    args = parser.parse_args()
+
+    gc.collect()
+    tracemalloc.start()
+    begin = time.perf_counter()
+    sentences = build(args.sentences)
+    elapsed = time.perf_counter() - begin
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc.collect()
+    begin = time.perf_counter()
+    build(args.sentences)
+    untraced = time.perf_counter() - begin
+
+    morphemes = len(sentences) * N_MORPHEMES
+    print('%d sentences, %d morphemes' % (len(sentences), morphemes))
+    print('%-28s %10.1f' % ('bytes/morpheme (all objects)', size / morphemes))
+    print('%-28s %10.2f' % ('construction us/morpheme', untraced * 1e6 / morphemes))
+    print('%-28s %10.2f' % ('(traced) us/morpheme', elapsed * 1e6 / morphemes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python str을 Java로 넘기는 방식에 따른 Py4J 통신 횟수와 소요 시간을 비교합니다.
+
+    python scripts/benchmark_string_passing.py --docs 1000
+
+- string(): java.lang.String 생성자를 호출하여 Java 객체를 만든 다음 넘기는 방식 (이전 방식)
+- str: Python str을 그대로 넘겨 Py4J가 변환하도록 하는 방식 (현재 방식)
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+
+from koalanlp import Util, API
+from koalanlp import jvm
+from koalanlp.proc import Tagger
+
+SAMPLE = '1+1은 2이고, 3*3은 9이다. 오늘의 날씨입니다. 기온 23도는 낮부터임.'
+
+
+@contextmanager
+def count_calls(counter: dict):
+    client = jvm.GATEWAY._gateway_client
+    send_command = client.send_command
+
+    def counting(*args, **kwargs):
+        counter['calls'] += 1
+        return send_command(*args, **kwargs)
+
+    client.send_command = counting
+    try:
+        yield counter
+    finally:
+        client.send_command = send_command
+
+
+def measure(name: str, n_docs: int, func):
+    counter = {'calls': 0}
+    begin = time.perf_counter()
+    with count_calls(counter):
+        for i in range(n_docs):
+            func('%s %d' % (SAMPLE, i))
+    elapsed = time.perf_counter() - begin
+
+    print('%-28s %8.2f calls/doc %10.3f ms/doc' % (name, counter['calls'] / n_docs, elapsed * 1000 / n_docs))
+    return counter['calls']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Python str 전달 방식 비교')
+    parser.add_argument('--docs', type=int, default=1000, help='측정에 사용할 문서 수 (기본값 1000)')
+    parser.add_argument('--api', default=API.OKT, help='품사분석에 사용할 API (기본값 OKT)')
+    args = parser.parse_args()
+
+    Util.initialize(**{args.api: 'LATEST'})
+    try:
+        ext_util = jvm.koala_class_of('ExtUtil')
+        java_string = jvm.class_of('java.lang.String')
+        java_string('warm-up')
+
+        old = measure('ExtUtil via string()', args.docs, lambda text: ext_util.hangulToAlpha(java_string(text)))
+        new = measure('ExtUtil via str', args.docs, lambda text: ext_util.hangulToAlpha(text))
+        print('%-28s %8.2f calls/doc' % ('saved', (old - new) / args.docs))
+
+        api = API.query(args.api, 'Tagger')()
+        old = measure('Tagger via string()', args.docs, lambda text: api.tag(java_string(text)))
+        new = measure('Tagger via str', args.docs, lambda text: api.tag(text))
+        print('%-28s %8.2f calls/doc' % ('saved', (old - new) / args.docs))
+
+        tagger = Tagger(args.api)
+        measure('Tagger.tag (python)', args.docs, lambda text: tagger.tag(text))
+    finally:
+        Util.finalize()
+
+
+if __name__ == '__main__':
+    main()
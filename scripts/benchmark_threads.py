@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+하나의 Tagger를 여러 스레드가 함께 사용할 때, 스레드 수에 따른 처리량을 비교합니다.
+
+    python scripts/benchmark_threads.py --docs 2000 --threads 1 2 4 8 --pool-size 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from koalanlp import Util, API
+from koalanlp.proc import Tagger
+
+SAMPLE = '1+1은 2이고, 3*3은 9이다. 오늘의 날씨입니다. 기온 23도는 낮부터임.'
+
+
+def measure(tagger, texts, threads):
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(tagger.tag, texts))
+    return len(texts) / (time.perf_counter() - begin)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스레드 수에 따른 품사분석 처리량 비교')
+    parser.add_argument('--docs', type=int, default=2000, help='측정에 사용할 문서 수 (기본값 2000)')
+    parser.add_argument('--api', default=API.EUNJEON, help='품사분석에 사용할 API (기본값 EUNJEON)')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help='비교할 스레드 수 (기본값 1 2 4 8)')
+    parser.add_argument('--pool-size', type=int, default=None, help='Java 연결 pool의 크기 (기본값: 가장 큰 스레드 수)')
+    args = parser.parse_args()
+
+    Util.initialize(pool_size=args.pool_size or max(args.threads), **{args.api: 'LATEST'})
+    try:
+        tagger = Tagger(args.api)
+        texts = ['%s %d' % (SAMPLE, i) for i in range(args.docs)]
+        measure(tagger, texts[:100], max(args.threads))
+
+        base = None
+        print('%8s %12s %8s' % ('threads', 'docs/s', 'scale'))
+        for threads in args.threads:
+            throughput = measure(tagger, texts, threads)
+            base = base or throughput
+            print('%8d %12.1f %7.2fx' % (threads, throughput, throughput / base))
+    finally:
+        Util.finalize()
+
+
+if __name__ == '__main__':
+    main()
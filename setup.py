@@ -15,7 +15,11 @@ setup(
     author='koalanlp',
     url='https://koalanlp.github.io/python-support',
     install_requires=["py4j~=0.10", "requests~=2.22", "kss~=2.5.1"],
+    extras_require={"numpy": ["numpy"]},
     packages=find_packages(exclude=["docs", "tests", "doc_source", "scripts"]),
+    entry_points={
+        "console_scripts": ["koalanlp-batch=koalanlp.batch:main", "koalanlp-bundle=koalanlp.bundle:main"],
+    },
     keywords=['korean', 'natural language processing', 'koalanlp', '한국어 처리', '한국어 분석',
               '형태소', '의존구문', '구문구조', '개체명', '의미역'],
     python_requires='>=3.5',
@@ -0,0 +1,68 @@
+from koalanlp import *
+from koalanlp.aio import *
+import asyncio
+import pytest
+
+TEXTS = ["%d번째 예시 문장입니다. 이벤트 루프에서 분석합니다." % i for i in range(40)]
+
+
+@pytest.fixture(scope="module")
+def loop():
+    Util.initialize(EUNJEON="LATEST", pool_size=4)
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+    Util.finalize()
+
+
+def test_async_tagger(loop):
+    tagger = AsyncTagger(API.EUNJEON, max_concurrency=4)
+
+    async def run():
+        results = await asyncio.gather(*[tagger.tag(text) for text in TEXTS])
+        batch = await tagger.tagBatch(TEXTS, grouped=True)
+        return results, batch
+
+    results, batch = loop.run_until_complete(run())
+    tagger.close()
+
+    assert len(results) == len(TEXTS)
+    assert [[str(s) for s in group] for group in results] == [[str(s) for s in group] for group in batch]
+    assert all(' '.join(str(s) for s in group) == text for group, text in zip(results, TEXTS))
+
+
+def test_async_cancellation(loop):
+    tagger = AsyncTagger(API.EUNJEON, max_concurrency=1)
+
+    async def run():
+        # max_concurrency=1이므로 두 번째 요청은 기다리는 중에 취소됩니다.
+        first = asyncio.ensure_future(tagger.tag(TEXTS[0]))
+        second = asyncio.ensure_future(tagger.tag(TEXTS[1]))
+        await asyncio.sleep(0)
+        second.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+        return await first
+
+    assert ' '.join(str(s) for s in loop.run_until_complete(run())) == TEXTS[0]
+    tagger.close()
+
+
+def test_semaphores_of_closed_loops():
+    from koalanlp.aio import _AsyncAnalyzer
+    import time
+
+    analyzer = _AsyncAnalyzer(None, max_concurrency=1)
+
+    async def run():
+        await asyncio.gather(*[analyzer._run(time.sleep, 0.01) for _ in range(3)])
+
+    # asyncio.run처럼 loop를 만들고 닫기를 반복해도, 닫힌 loop의 semaphore를 계속 들고 있지 않습니다.
+    for _ in range(5):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(run())
+        loop.close()
+    assert len(analyzer._AsyncAnalyzer__semaphores) == 1
+    analyzer.close()
@@ -0,0 +1,29 @@
+from koalanlp.batch import parse_args, run, read_checkpoint, write_checkpoint
+import json
+
+
+def test_batch_resume(tmp_path):
+    corpus = tmp_path / 'corpus.txt'
+    corpus.write_text('\n'.join('%d번째 문서입니다. 두 번째 문장도 있습니다.' % i for i in range(30)) + '\n', encoding='utf-8')
+    output = str(tmp_path / 'tagged.jsonl')
+
+    args = parse_args([str(corpus), output, '--api', 'eunjeon', '--processes', '2', '--chunksize', '4',
+                       '--checkpoint-every', '5'])
+    report = run(args)
+    assert report['documents'] == report['processed'] == 30
+    expected = open(output, encoding='utf-8').read()
+
+    lines = expected.splitlines()
+    assert len(lines) == 30
+    assert [json.loads(line)['id'] for line in lines] == list(range(30))
+
+    # 12번째 문서까지 처리하고 중간 결과 일부를 쓰던 중에 종료된 상황을 만듭니다.
+    offset = len(''.join(line + '\n' for line in lines[:12]).encode('utf-8'))
+    with open(output, 'w', encoding='utf-8') as file:
+        file.write(''.join(line + '\n' for line in lines[:13]) + lines[13][:10])
+    write_checkpoint(output, 12, offset, 1.0)
+
+    report = run(args)
+    assert report['processed'] == 18
+    assert read_checkpoint(output)['documents'] == 30
+    assert open(output, encoding='utf-8').read() == expected
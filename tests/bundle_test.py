@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from koalanlp import Util
+from koalanlp.bundle import create_bundle, read_manifest, load_bundle, main
+from koalanlp.jip.repository import MavenFileSystemRepos
+
+POM = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <modelVersion>4.0.0</modelVersion>
+    <groupId>%s</groupId>
+    <artifactId>%s</artifactId>
+    <version>%s</version>
+    <dependencies>%s</dependencies>
+</project>
+"""
+
+DEPENDENCY = "<dependency><groupId>%s</groupId><artifactId>%s</artifactId><version>%s</version></dependency>"
+
+
+def publish(repo, group, artifact, version, *dependencies):
+    directory = Path(repo, group.replace('.', '/'), artifact, version)
+    directory.mkdir(parents=True, exist_ok=True)
+    deps = ''.join(DEPENDENCY % dep for dep in dependencies)
+    Path(directory, '%s-%s.pom' % (artifact, version)).write_text(POM % (group, artifact, version, deps))
+    Path(directory, '%s-%s.jar' % (artifact, version)).write_bytes(('%s:%s' % (artifact, version)).encode('utf-8'))
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repo = str(Path(str(tmp_path), 'm2'))
+    publish(repo, 'kr.bydelta', 'koalanlp-core', '2.1.4', ('org.example', 'common', '1.0'))
+    publish(repo, 'kr.bydelta', 'koalanlp-kmr', '2.1.4', ('kr.bydelta', 'koalanlp-core', '2.1.4'))
+    publish(repo, 'org.example', 'common', '1.0')
+    publish(repo, 'net.sf.py4j', 'py4j', '0.10.8.1')
+    return repo
+
+
+def test_bundle_directory(tmp_path, repository):
+    target = str(Path(str(tmp_path), 'bundle'))
+    create_bundle(target, {'KMR': '2.1.4'}, repositories=[MavenFileSystemRepos('test', repository)])
+
+    manifest = read_manifest(target)
+    assert manifest['packages'] == {'kmr': '2.1.4'}
+    assert sorted(entry['id'] for entry in manifest['artifacts']) == \
+        ['kr.bydelta:koalanlp-core:2.1.4', 'kr.bydelta:koalanlp-kmr:2.1.4', 'net.sf.py4j:py4j:0.10.8.1',
+         'org.example:common:1.0']
+
+    classpaths = load_bundle(target, {'kmr': 'LATEST'})
+    assert len(classpaths) == 4
+    assert all(os.path.isfile(jar) for jar in classpaths)
+    assert load_bundle(target, {'KMR': '2.1.4'}) == classpaths
+
+    # 묶음 디렉터리는 Maven 저장소로 사용할 수 있습니다.
+    assert Path(target, 'kr/bydelta/koalanlp-kmr/2.1.4/koalanlp-kmr-2.1.4.pom').exists()
+
+    with pytest.raises(ValueError):
+        load_bundle(target, {'hnn': 'LATEST'})
+    with pytest.raises(ValueError):
+        load_bundle(target, {'kmr': '2.0.0'})
+
+    with pytest.raises(FileExistsError):
+        create_bundle(target, {'KMR': '2.1.4'}, repositories=[MavenFileSystemRepos('test', repository)])
+
+    Path(classpaths[0]).write_bytes(b'corrupted')
+    with pytest.raises(ValueError):
+        load_bundle(target)
+    load_bundle(target, verify=False)
+
+    os.remove(classpaths[0])
+    with pytest.raises(FileNotFoundError):
+        load_bundle(target, verify=False)
+
+
+def test_bundle_archive(tmp_path, repository, capsys):
+    target = str(Path(str(tmp_path), 'offline'))
+    main([target, '--package', 'KMR=2.1.4', '--repository', repository, '--archive'])
+    assert capsys.readouterr().out.strip() == target + '.tar.gz'
+
+    lib_path = str(Path(str(tmp_path), 'lib'))
+    classpaths = load_bundle(target + '.tar.gz', {'KMR': 'LATEST'}, lib_path=lib_path)
+    assert len(classpaths) == 4
+    assert all(jar.startswith(str(Path(lib_path, '.java', 'bundle'))) for jar in classpaths)
+    assert load_bundle(target + '.tar.gz', lib_path=lib_path) == classpaths
+
+
+def test_missing_artifact(tmp_path, repository):
+    os.remove(str(Path(repository, 'net/sf/py4j/py4j/0.10.8.1/py4j-0.10.8.1.pom')))
+    with pytest.raises(FileNotFoundError):
+        create_bundle(str(Path(str(tmp_path), 'bundle')), {'KMR': '2.1.4'},
+                      repositories=[MavenFileSystemRepos('test', repository)])
+
+
+def test_offline_initialize(tmp_path, repository):
+    target = str(Path(str(tmp_path), 'bundle'))
+    create_bundle(target, {'KMR': '2.1.4'}, repositories=[MavenFileSystemRepos('test', repository)])
+
+    # JVM을 시작하기 전에 오류를 냅니다.
+    with pytest.raises(ValueError):
+        Util.initialize(lib_path=str(tmp_path), bundle=target, HNN='LATEST')
+    with pytest.raises(FileNotFoundError):
+        Util.initialize(lib_path=str(tmp_path), offline=True, KMR='LATEST')
@@ -0,0 +1,104 @@
+import os
+
+from koalanlp.data import *
+from koalanlp.proc import AnalysisCache, _cache_config, _cached_groups, _update_dictionary_version
+from koalanlp.serialize import dumps
+
+
+def make_group(text):
+    return [Sentence([Word(surface, [Morpheme(surface, "NNG", "NNG")]) for surface in text.split()])]
+
+
+class CountingAnalyzer(object):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [make_group(text) for text in texts]
+
+
+CONFIG = _cache_config('cachetest', 'Tagger', {'kmr_light': True, 'etri_key': 'secret', 'detached': True})
+
+
+def test_config():
+    assert CONFIG == ('cachetest', 'Tagger', (('kmr_light', 'True'),), None)
+
+
+def test_memory_hits_and_normalization():
+    cache = AnalysisCache()
+    analyzer = CountingAnalyzer()
+
+    first = _cached_groups(cache, CONFIG, 'tag', ['나는 밥을', '먹었다'], analyzer)
+    second = _cached_groups(cache, CONFIG, 'tag', ['나는   밥을 ', '먹었다', '새 문단'], analyzer)
+
+    assert analyzer.calls == [['나는 밥을', '먹었다'], ['새 문단']]
+    assert second[:2] == first
+    assert second[0][0] is not first[0][0]
+
+    stats = cache.getStats()
+    assert stats['memoryHits'] == 2
+    assert stats['misses'] == 3
+    assert stats['hitRate'] == 2 / 5
+
+    # 분석 방법이나 분석기 설정이 다르면 다른 결과입니다.
+    _cached_groups(cache, CONFIG, 'tagSentence', ['먹었다'], analyzer)
+    _cached_groups(cache, CONFIG[:2] + ((), None), 'tag', ['먹었다'], analyzer)
+    assert analyzer.calls[-2:] == [['먹었다'], ['먹었다']]
+
+
+def test_memory_eviction():
+    cache = AnalysisCache(max_memory=1)
+    analyzer = CountingAnalyzer()
+
+    _cached_groups(cache, CONFIG, 'tag', ['나는 밥을'], analyzer)
+    _cached_groups(cache, CONFIG, 'tag', ['나는 밥을'], analyzer)
+    assert len(analyzer.calls) == 2
+    assert cache.getStats()['memoryBytes'] == 0
+
+    # 두 문단만 보관할 수 있으면, 가장 오래 사용하지 않은 문단부터 지웁니다.
+    cache = AnalysisCache(max_memory=2 * len(dumps(make_group('가 나'))))
+    for text in ['가 나', '다 라', '가 나', '마 바', '가 나', '다 라']:
+        _cached_groups(cache, CONFIG, 'tag', [text], analyzer)
+    assert cache.getStats()['memoryHits'] == 2
+    assert cache.getStats()['misses'] == 4
+
+
+def test_disk(tmp_path):
+    path = os.path.join(str(tmp_path), 'cache.sqlite')
+    analyzer = CountingAnalyzer()
+
+    with AnalysisCache(path=path) as cache:
+        expected = _cached_groups(cache, CONFIG, 'tag', ['나는 밥을', '먹었다'], analyzer)
+        size = cache.getStats()['diskBytes']
+        assert size > 0
+
+    with AnalysisCache(path=path) as cache:
+        assert cache.getStats()['diskBytes'] == size
+        assert _cached_groups(cache, CONFIG, 'tag', ['나는 밥을', '먹었다'], analyzer) == expected
+        assert cache.getStats()['diskHits'] == 2
+        assert _cached_groups(cache, CONFIG, 'tag', ['먹었다'], analyzer) == expected[1:]
+        assert cache.getStats()['memoryHits'] == 1
+        assert len(analyzer.calls) == 1
+
+        cache.clear()
+        assert cache.getStats()['diskBytes'] == 0
+        _cached_groups(cache, CONFIG, 'tag', ['먹었다'], analyzer)
+        assert len(analyzer.calls) == 2
+
+    with AnalysisCache(max_memory=0, path=path, max_disk=size // 2) as cache:
+        for text in ['가 나', '다 라', '마 바', '사 아']:
+            _cached_groups(cache, CONFIG, 'tag', [text], analyzer)
+        assert 0 < cache.getStats()['diskBytes'] <= size // 2
+
+
+def test_dictionary_invalidation():
+    cache = AnalysisCache()
+    analyzer = CountingAnalyzer()
+
+    _cached_groups(cache, CONFIG, 'tag', ['나는 밥을'], analyzer)
+    _update_dictionary_version('CACHETEST', [('밥을', 'NNG')])
+    _cached_groups(cache, CONFIG, 'tag', ['나는 밥을'], analyzer)
+    _cached_groups(cache, CONFIG, 'tag', ['나는 밥을'], analyzer)
+
+    assert len(analyzer.calls) == 2
@@ -0,0 +1,61 @@
+import socketserver
+import threading
+from contextlib import contextmanager
+from http.server import HTTPServer
+
+import pytest
+
+from koalanlp.jip import util
+
+
+class StubServer(socketserver.ThreadingMixIn, HTTPServer):
+    # 요청마다 스레드를 만들어 처리하는 로컬 HTTP 서버
+    daemon_threads = True
+
+    def __init__(self, handler):
+        super().__init__(('127.0.0.1', 0), handler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def url(self, path='/'):
+        return 'http://127.0.0.1:%d%s' % (self.server_port, path)
+
+    @contextmanager
+    def serving(self):
+        # 동시에 처리 중인 요청의 수(active)와 그 최댓값(max_active)을 셉니다.
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def stub_server():
+    """
+    주어진 handler class로 로컬 HTTP 서버를 띄우는 함수를 돌려줍니다. 테스트가 끝나면 서버를 닫습니다.
+    keyword 인자는 서버의 속성으로 저장되어 handler에서 self.server로 사용할 수 있습니다.
+    테스트하는 동안 jip의 HTTP 재시도는 기다리지 않고 바로 다시 요청합니다.
+    """
+    servers = []
+    backoff = util.BACKOFF_FACTOR
+    util.configure_session(backoff_factor=0)
+
+    def start(handler, **attributes):
+        server = StubServer(handler)
+        for name, value in attributes.items():
+            setattr(server, name, value)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+    util.configure_session(backoff_factor=backoff)
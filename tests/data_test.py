@@ -1,6 +1,7 @@
 from koalanlp import Util
 from koalanlp.data import *
 from koalanlp.types import *
+from koalanlp.jvm import java_list, jvm_memory
 import pytest
 
 sent = None
@@ -546,6 +547,107 @@ def test_Sentence(jvm):
                 assert reconmorph.id == morph.id
                 assert refmorph.getId() == morph.id
 
+    def check_reference_lazy():
+        global sent, sent2, sent3, sent4
+
+        reference = sent4.getReference()
+        by_reference = Sentence.fromJava(reference)
+
+        assert by_reference.singleLineString() == sent4.singleLineString()
+
+        for reconword in by_reference:
+            assert reconword.reference.equals(reference.get(reconword.id))
+
+            for reconmorph, morph in zip(reconword, sent4[reconword.id]):
+                assert reconmorph.getOriginalTag() == morph.getOriginalTag()
+                assert reconmorph.reference.equals(reference.get(reconword.id).get(reconmorph.id))
+
+    def check_reference_separator():
+        sentence = Sentence([Word("a\x1fb", [Morpheme("a\x1fb", POS.SL, "SL")])])
+        by_reference = Sentence.fromJava(sentence.getReference())
+
+        assert by_reference == sentence
+        assert by_reference[0][0].reference is not None
+
+    def check_structures_lazy():
+        global sent, sent2, sent3, sent4
+
+        sent.dependencies = [
+            DepEdge(dependent=sent[1], type=PhraseTag.S, depType=DependencyTag.ROOT),
+            DepEdge(governor=sent[1], dependent=sent[0], type=PhraseTag.NP, depType=DependencyTag.SBJ)
+        ]
+        by_reference = Sentence.fromJava(sent.getReference())
+
+        # 의존구조는 처음 사용할 때 만들어지며, 어절에서 먼저 접근해도 같은 결과를 얻습니다.
+        assert '_structure_loader' in by_reference.__dict__
+        assert by_reference[0].governorEdge.getGovernor() is by_reference[1]
+        assert '_structure_loader' not in by_reference.__dict__
+        assert by_reference[0].getGovernorEdge() is by_reference[0].governorEdge
+        assert by_reference.getDependencies() == sent.getDependencies()
+        assert by_reference[1].getDependentEdges()[0].getDependent() is by_reference[0]
+        assert by_reference.getSyntaxTree() is None and by_reference.getRoles() == []
+
+        # 속성을 직접 읽어도, 구조를 먼저 만듭니다.
+        by_reference = Sentence.fromJava(sent.getReference())
+        assert by_reference[1].dependentEdges[0].getDependent() is by_reference[0]
+        assert by_reference[0].phrase is None and by_reference[0][0].entities == []
+
+        # 품사 분석 결과만 있는 문장은 구조를 만들 필요가 없습니다.
+        tagged = Sentence.fromJava(sent4.getReference())
+        assert '_structure_loader' not in tagged.__dict__
+        assert tagged.getDependencies() == [] and tagged[0].getPhrase() is None
+
+    def check_detach():
+        global sent, sent2, sent3, sent4
+
+        sent.dependencies = [
+            DepEdge(dependent=sent[1], type=PhraseTag.S, depType=DependencyTag.ROOT),
+            DepEdge(governor=sent[1], dependent=sent[0], type=PhraseTag.NP, depType=DependencyTag.SBJ)
+        ]
+        reference = sent.getReference()
+        detached = Sentence.fromJava(reference, detached=True)
+
+        assert detached.reference is None
+        assert all(word.reference is None and all(morph.reference is None for morph in word) for word in detached)
+        assert all(edge.reference is None for edge in detached.getDependencies())
+        assert detached.getDependencies() == sent.getDependencies()
+
+        # Java 참조가 필요하면 새로 만듭니다.
+        rebuilt = detached.getReference()
+        assert rebuilt is not None
+        assert Sentence.fromJava(rebuilt) == detached
+        assert len(Sentence.fromJava(rebuilt).getDependencies()) == 2
+
+        assert all(s.reference is None for s in Sentence.fromJavaList(java_list([reference]), detached=True))
+
+        memory = jvm_memory(collect=True)
+        assert memory['gatewayObjects'] > 0
+        assert 0 < memory['heapUsed'] <= memory['heapTotal'] <= memory['heapMax']
+
+    def check_slots_and_pickle():
+        global sent, sent2, sent3, sent4
+        import pickle
+
+        # Morpheme, Word, Edge는 __dict__ 없이 __slots__에 값을 저장합니다.
+        assert not hasattr(sent4[0], '__dict__')
+        assert not hasattr(sent4[0][0], '__dict__')
+
+        with pytest.raises(AttributeError):
+            sent4[0].surface = "바꿈"
+        with pytest.raises(AttributeError):
+            sent4[0][0].tag = "NNG"
+        with pytest.raises(AttributeError):
+            sent4[0].customField = 1
+
+        reference = sent4.getReference()
+        by_reference = Sentence.fromJava(reference)
+        unpickled = pickle.loads(pickle.dumps(by_reference))
+
+        assert unpickled == by_reference
+        assert unpickled[0][0].word is unpickled[0]
+        assert unpickled[0].reference is None
+        assert unpickled.getReference().size() == reference.size()
+
     for name, method in locals().items():
         if name.startswith('check_'):
             reset()
@@ -1054,3 +1156,41 @@ def test_CorefGroup(jvm):
         if name.startswith('check_'):
             reset()
             method()
+
+
+def test_payload_word_sense():
+    from koalanlp.data import _parse_sentence_payload
+    from koalanlp.jvm import NULL_MARK
+
+    # 일괄 변환한 문장도, 객체마다 변환한 문장처럼 의미 어깨번호를 int로 저장합니다.
+    payload = '\x1d'.join(['밥을\x1f2', '밥\x1fNNG\x1fNNG\x1f1\x1e을\x1fJKO\x1fJKO\x1f' + NULL_MARK,
+                           NULL_MARK, '', '', '', ''])
+    morphemes = _parse_sentence_payload(payload)['morphemes']
+    assert [sense for _, _, _, sense in morphemes] == [1, None]
+
+
+def test_structure_loader_failure():
+    words = [Word('밥을', [Morpheme('밥', 'NNG'), Morpheme('을', 'JKO')]), Word('먹었다', [Morpheme('먹', 'VV')])]
+    sentence = Sentence(words)
+    attempts = []
+
+    def loader():
+        # 첫 시도는 의존구조를 만든 다음, Java 오류처럼 실패합니다.
+        attempts.append(len(attempts))
+        sentence.dependencies = [DepEdge(governor=words[1], dependent=words[0], type='NP', depType='OBJ')]
+        if len(attempts) == 1:
+            raise RuntimeError('Java error')
+
+    # Java 분석 결과로 만든 문장처럼, 구조를 처음 사용할 때 만들도록 합니다.
+    for name in ('syntaxTree', 'dependencies', 'roles', 'entities', 'corefGroups'):
+        del sentence.__dict__[name]
+    sentence._Sentence__defer_structures(loader)
+
+    with pytest.raises(RuntimeError):
+        sentence.getDependencies()
+
+    # 실패한 다음에 빈 결과를 돌려주지 않고, 구조를 다시 만듭니다.
+    assert len(sentence.getDependencies()) == 1
+    assert words[0].governorEdge is sentence.dependencies[0]
+    assert words[1].dependentEdges == sentence.dependencies
+    assert len(attempts) == 2
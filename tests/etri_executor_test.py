@@ -0,0 +1,99 @@
+import json
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import quote, unquote
+from urllib.request import urlopen
+
+import pytest
+
+from koalanlp.data import *
+from koalanlp.proc import ETRIExecutor
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # ETRI Open API 대신, 요청받은 문단을 어절 단위로 나누어 돌려주는 서버
+    def do_GET(self):
+        text = unquote(self.path[1:])
+        server = self.server
+        with server.lock:
+            server.counts[text] = server.counts.get(text, 0) + 1
+            count = server.counts[text]
+
+        with server.serving():
+            time.sleep(0.05)
+
+        if text.startswith('fail') and count <= server.failures:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        body = json.dumps(text.split()).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(stub_server):
+    server = stub_server(StubHandler, counts={}, failures=1)
+
+    def request(text):
+        with urlopen(server.url('/' + quote(text))) as response:
+            words = json.loads(response.read().decode('utf-8'))
+        return [Sentence([Word(word, [Morpheme(word, "NNG", "NNG")]) for word in words])]
+
+    server.request = request
+    return server
+
+
+def test_concurrency_and_dedup(server):
+    texts = ['문단 %d' % (i % 8) for i in range(16)]
+
+    with ETRIExecutor(server.request, max_concurrency=4) as executor:
+        result = executor.analyze(texts, grouped=True)
+        stats = executor.getStats()
+
+    assert [group[0].surfaceString() for group in result] == texts
+    assert result[0] is result[8]
+    assert all(count == 1 for count in server.counts.values())
+    assert len(server.counts) == 8
+    assert 1 < server.max_active <= 4
+    assert stats['requests'] == 8
+    assert stats['deduplicated'] == 8
+
+
+def test_retry(server):
+    with ETRIExecutor(server.request, backoff=0.01) as executor:
+        assert executor.analyze(['fail 문단', '정상 문단'])[0].surfaceString() == 'fail 문단'
+        assert executor.getStats()['retries'] == 1
+        assert server.counts['fail 문단'] == 2
+
+    server.failures = 10
+    with ETRIExecutor(server.request, max_retries=2, backoff=0.01) as executor:
+        with pytest.raises(OSError):
+            executor.analyze(['fail 다시'])
+        assert executor.getStats()['failures'] == 1
+        assert server.counts['fail 다시'] == 3
+
+
+def test_rate_limit(server):
+    texts = ['문단 %d' % i for i in range(6)]
+
+    with ETRIExecutor(server.request, max_concurrency=6, rate=20, burst=1) as executor:
+        start = time.monotonic()
+        assert len(list(executor.iterAnalyze(texts, batch_size=4))) == 6
+        elapsed = time.monotonic() - start
+
+    # 첫 요청은 바로, 이후의 5개 요청은 0.05초 간격으로 보냅니다.
+    assert elapsed >= 0.2
+
+
+@pytest.mark.parametrize('options', [{'max_concurrency': 0}, {'rate': 0}, {'max_retries': -1}, {'backoff': -1},
+                                     {'max_backoff': -0.5}])
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        ETRIExecutor(lambda text: [], **options)
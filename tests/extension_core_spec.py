@@ -479,6 +479,24 @@ def test_assemble_hangul(environ):
     assert ExtUtil.assembleHangul(ExtUtil.dissembleHangul(sampleString)) == sampleString
 
 
+def test_hangul_array(environ):
+    texts = ["SNS '인플루엔서' 쇼핑 피해 심각... 법적 안전장치 미비: ㄱ씨는 요즘 ㄴ SNS에서 갤럭시S", "",
+             "\u1100\u1100 \u11A8\u11A8", "한국어 분석"]
+
+    codes, offsets = ExtUtil.dissembleHangulArray(texts)
+    assert len(offsets) == len(texts) + 1
+    for i, text in enumerate(texts):
+        assert ''.join(chr(c) for c in codes[offsets[i]:offsets[i + 1]]) == ExtUtil.dissembleHangul(text)
+
+    chosung, offsets = ExtUtil.getChosungArray(texts)
+    for i, text in enumerate(texts):
+        assert [chr(c) if c != 0 else None for c in chosung[offsets[i]:offsets[i + 1]]] == ExtUtil.getChosung(text)
+
+    assert ExtUtil.getChosungKeys(["한국어 분석"]) == ["\u1112\u1100\u110B\u1107\u1109"]
+    assert ExtUtil.getChosungKeys(["한국어 분석"], keepOthers=True) == ["\u1112\u1100\u110B \u1107\u1109"]
+    assert ExtUtil.getChosungKeys([]) == []
+
+
 def test_verb_correction(environ):
     map = """
 V 벗 아/어/ㅏ/ㅓ 벗어 자 벗자
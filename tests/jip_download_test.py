@@ -0,0 +1,126 @@
+import hashlib
+import os
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from koalanlp.jip import util
+from koalanlp.jip.maven import Artifact
+from koalanlp.jip.repository import MavenHttpRemoteRepos
+from koalanlp.jip.util import DownloadException, configure_downloads, download_file, file_checksum, \
+    wait_until_download_finished
+
+JAR = bytes(range(256)) * 400
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.ranges.append(self.headers.get('Range'))
+
+        body = server.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        status = 200
+        range_header = self.headers.get('Range')
+        if range_header is not None and server.accept_ranges:
+            start = int(range_header[len('bytes='):].rstrip('-'))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            status = 206
+            body = body[start:]
+
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def publish(server, path, body, checksum=None):
+    server.files[path] = body
+    server.files[path + '.sha1'] = (checksum or hashlib.sha1(body).hexdigest()).encode('ascii') + b'  file.jar'
+
+
+@pytest.fixture
+def server(stub_server):
+    return stub_server(RangeHandler, files={}, ranges=[], accept_ranges=True)
+
+
+def test_resume(server, tmp_path):
+    publish(server, '/file.jar', JAR)
+    path = str(tmp_path / 'file.jar')
+
+    with open(path + '.part', 'wb') as partial:
+        partial.write(JAR[:1000])
+    download_file(server.url('/file.jar'), path)
+
+    assert server.ranges[0] == 'bytes=1000-'
+    assert open(path, 'rb').read() == JAR
+    assert not os.path.exists(path + '.part')
+
+    # 서버가 Range를 무시하면 처음부터 다시 씁니다.
+    server.accept_ranges = False
+    with open(path + '.part', 'wb') as partial:
+        partial.write(b'stale')
+    download_file(server.url('/file.jar'), path)
+    assert open(path, 'rb').read() == JAR
+
+
+def test_checksum_mismatch(server, tmp_path):
+    publish(server, '/broken.jar', JAR, checksum='0' * 40)
+    path = str(tmp_path / 'broken.jar')
+
+    with pytest.raises(DownloadException):
+        download_file(server.url('/broken.jar'), path)
+    # 처음부터 한 번 더 받아본 다음 포기합니다.
+    assert server.ranges.count(None) == 4
+    assert not os.path.exists(path)
+
+    # md5만 있는 경우와 checksum이 없는 경우
+    server.files['/md5.jar'] = JAR
+    server.files['/md5.jar.md5'] = hashlib.md5(JAR).hexdigest().encode('ascii')
+    download_file(server.url('/md5.jar'), str(tmp_path / 'md5.jar'))
+    server.files['/plain.jar'] = JAR
+    download_file(server.url('/plain.jar'), str(tmp_path / 'plain.jar'))
+    assert file_checksum(str(tmp_path / 'plain.jar'), 'sha1') == hashlib.sha1(JAR).hexdigest()
+
+
+def test_pool(server, tmp_path):
+    repos = MavenHttpRemoteRepos('test', server.url('/'))
+    artifacts = [Artifact('org.example', 'artifact%d' % i, '1.0') for i in range(6)]
+    for artifact in artifacts:
+        publish(server, '/' + repos.get_artifact_uri(artifact, 'jar').split('/', 3)[3], JAR)
+
+    configure_downloads(workers=4)
+    try:
+        for artifact in artifacts:
+            repos.download_jar(artifact, str(tmp_path))
+        stats = wait_until_download_finished()
+        assert stats['files'] == stats['finished'] == 6
+        assert stats['bytes'] == stats['total_bytes'] == 6 * len(JAR)
+        assert sorted(os.listdir(str(tmp_path))) == sorted(a.to_jip_name() for a in artifacts)
+
+        # 실패한 다운로드가 있어도 기다리는 쪽이 멈추지 않고, 오류를 돌려받습니다.
+        repos.download_jar(Artifact('org.example', 'missing', '1.0'), str(tmp_path))
+        repos.download_jar(artifacts[0], str(tmp_path))
+        with pytest.raises(DownloadException) as error:
+            wait_until_download_finished()
+        assert error.value.is_not_found()
+        assert not os.path.exists(str(tmp_path / Artifact('org.example', 'missing', '1.0').to_jip_name()))
+    finally:
+        configure_downloads(workers=3)
+    assert util.pool.workers == 3
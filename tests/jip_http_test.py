@@ -0,0 +1,61 @@
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from koalanlp.jip.util import DownloadException, download, download_string, session
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+            failing = self.path == '/flaky' and self.server.requests % 2 == 1
+
+        if self.path == '/missing' or failing:
+            self.send_response(404 if not failing else 503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = ('content of %s' % self.path).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(stub_server):
+    return stub_server(KeepAliveHandler, connections=0, requests=0)
+
+
+def test_keep_alive(server, tmp_path):
+    for i in range(20):
+        assert download_string(server.url('/file%d.pom' % i)) == 'content of /file%d.pom' % i
+
+    with open(str(tmp_path / 'file.jar'), 'wb') as target:
+        download(server.url('/file.jar'), target)
+    assert (tmp_path / 'file.jar').read_text() == 'content of /file.jar'
+
+    assert server.connections == 1
+    assert session() is session()
+
+
+def test_retry_and_errors(server):
+    assert download_string(server.url('/flaky')) == 'content of /flaky'
+    assert server.requests == 2
+
+    with pytest.raises(DownloadException) as error:
+        download_string(server.url('/missing'))
+    assert error.value.is_not_found()
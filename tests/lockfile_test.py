@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+from koalanlp import Util
+from koalanlp.Util import _prepare_classpath, _read_lock, _write_lock
+from koalanlp.jip.repository import MavenFileSystemRepos
+from tests.bundle_test import publish
+
+
+def make_jars(base, *names):
+    paths = []
+    for name in names:
+        path = Path(base, '.java', 'cache', 'kr.bydelta', name, '%s-1.0.jar' % name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'')
+        paths.append(str(path))
+    return paths
+
+
+def test_lockfile(tmp_path):
+    base = str(tmp_path)
+    assert _read_lock(base, {'kmr': 'LATEST'}) is None
+
+    kmr = make_jars(base, 'koalanlp-kmr', 'koalanlp-core')
+    hnn = make_jars(base, 'koalanlp-hnn')
+    _write_lock(base, {'kmr': 'LATEST'}, kmr)
+    _write_lock(base, {'hnn': '2.1.0', 'kmr': 'LATEST'}, kmr + hnn)
+
+    assert _read_lock(base, {'kmr': 'LATEST'}) == kmr
+    assert _read_lock(base, {'kmr': 'LATEST', 'hnn': '2.1.0'}) == kmr + hnn
+    assert _read_lock(base, {'kmr': '2.1.0'}) is None
+
+    # 기록은 lib_path 기준 상대경로이므로, 폴더를 옮겨도 사용할 수 있습니다.
+    moved = str(Path(base, 'moved'))
+    os.makedirs(moved)
+    os.rename(str(Path(base, '.java')), str(Path(moved, '.java')))
+    assert _read_lock(moved, {'kmr': 'LATEST'}) == [jar.replace(base, moved) for jar in kmr]
+
+    # 기록된 JAR 파일이 없어졌다면 사용하지 않습니다.
+    os.remove(kmr[0].replace(base, moved))
+    assert _read_lock(moved, {'kmr': 'LATEST'}) is None
+
+    Path(moved, '.java', 'classpath.lock').write_text('{broken')
+    assert _read_lock(moved, {'hnn': '2.1.0', 'kmr': 'LATEST'}) is None
+
+
+def test_prepare_classpath(tmp_path, monkeypatch):
+    repo = str(Path(str(tmp_path), 'm2'))
+    publish(repo, 'kr.bydelta', 'koalanlp-kmr', '2.1.4', ('kr.bydelta', 'koalanlp-core', '2.1.4'))
+    publish(repo, 'kr.bydelta', 'koalanlp-core', '2.1.4')
+    publish(repo, 'net.sf.py4j', 'py4j', '0.10.8.1')
+    monkeypatch.setattr(Util.repos_manager, 'repos', [MavenFileSystemRepos('test', repo)])
+
+    # 작업 프로세스들은 여기서 기록한 classpath로 오프라인 초기화합니다.
+    base = str(Path(str(tmp_path), 'lib'))
+    classpaths = _prepare_classpath(base, {'kmr': '2.1.4'})
+    assert sorted(Path(jar).name for jar in classpaths) == \
+        ['koalanlp-core-2.1.4.jar', 'koalanlp-kmr-2.1.4.jar', 'py4j-0.10.8.1.jar']
+    assert _read_lock(base, {'kmr': '2.1.4'}) == classpaths
+
+    monkeypatch.setattr(Util.repos_manager, 'repos', [])
+    assert _prepare_classpath(base, {'kmr': '2.1.4'}) == classpaths
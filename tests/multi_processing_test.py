@@ -28,3 +28,28 @@ def test_init_finalize_tagger():
 
     results = pool.imap_unordered(init_and_finalize, [51111, 51112, 51113, 51114, 51115, 51116])
     assert all(res > 0 for res in results)
+
+
+def test_process_pool_tagger():
+    from koalanlp.pool import ProcessPoolTagger
+
+    texts = ["%d번째 예시 문장입니다. 순서대로 돌려받아야 합니다." % i for i in range(50)]
+
+    with ProcessPoolTagger(API.EUNJEON, processes=3, chunksize=4) as tagger:
+        assert tagger.processes == 3
+
+        grouped = tagger.tagBatch(texts, grouped=True)
+        assert len(grouped) == len(texts)
+        for text, sentences in zip(texts, grouped):
+            assert ' '.join(str(sentence) for sentence in sentences) == text
+
+        assert [str(s) for s in tagger(texts[:5])] == [str(s) for group in grouped[:5] for s in group]
+
+        with pytest.raises(TypeError):
+            tagger.tagBatch([texts[0], 1])
+
+        # 중간에 멈춘 다음에도 계속 사용할 수 있어야 합니다.
+        stream = tagger.iterTag(iter(texts))
+        next(stream)
+        stream.close()
+        assert len(tagger.tag(texts[0])) == 2
@@ -0,0 +1,28 @@
+from koalanlp import *
+from koalanlp.jvm import gateway_pool_size
+from koalanlp.proc import *
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+POOL_SIZE = 4
+TEXTS = ["%d번째 예시 문장입니다. 여러 스레드에서 동시에 분석합니다." % i for i in range(200)]
+
+
+@pytest.fixture(scope="module")
+def tagger():
+    Util.initialize(EUNJEON="LATEST", pool_size=POOL_SIZE)
+    yield Tagger(API.EUNJEON)
+    Util.finalize()
+
+
+def test_pool_size(tagger):
+    assert gateway_pool_size() == POOL_SIZE
+
+
+def test_shared_tagger_is_thread_safe(tagger):
+    expected = [[s.singleLineString() for s in tagger(text)] for text in TEXTS]
+
+    with ThreadPoolExecutor(max_workers=POOL_SIZE * 2) as executor:
+        actual = list(executor.map(lambda text: [s.singleLineString() for s in tagger(text)], TEXTS))
+
+    assert actual == expected
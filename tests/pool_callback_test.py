@@ -0,0 +1,37 @@
+from koalanlp import *
+from koalanlp.jvm import gateway_pool_size
+from koalanlp.proc import *
+import threading
+import pytest
+
+
+@pytest.fixture(scope="module")
+def dicts():
+    Util.initialize(KKMA="LATEST", OKT="LATEST", pool_size=1)
+    yield Dictionary(API.KKMA), Dictionary(API.OKT)
+    Util.finalize()
+
+
+def run_with_timeout(function, timeout=60):
+    # Callback에서 보낸 명령이 연결을 기다리며 멈추면, 테스트도 끝나지 않으므로 시간 제한을 둡니다.
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'callback이 연결을 기다리며 멈추었습니다.'
+    return result[0]
+
+
+def test_import_from_with_single_connection(dicts):
+    dict1, dict2 = dicts
+    assert gateway_pool_size() == 1
+
+    dict1.addUserDictionary(("설빙", POS.NNP), ("하동균", POS.NNP))
+    item_sz_prev = len(dict2.getItems())
+
+    # 품사 판단 함수는 Java에서 Python으로 호출되고, 그 안에서 다시 Java의 품사 이름을 묻습니다.
+    run_with_timeout(lambda: dict2.importFrom(dict1, True, lambda t: t.isNoun()))
+    assert len(dict2.getItems()) > item_sz_prev
+
+    entries = run_with_timeout(lambda: list(dict1.getBaseEntries(lambda t: t.isAffix())))
+    assert len(entries) > 0
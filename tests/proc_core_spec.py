@@ -359,6 +359,140 @@ def test_Tagger_Sentence_typecheck(environ):
             assert len(para) == len(singles)
 
 
+def test_Tagger_Batch_typecheck(environ):
+    splitter, tagger, parser, entityRecog, roleLabeler = environ
+
+    lines = [line for _, line in EXAMPLES] + [""]
+    grouped = tagger.tagBatch(lines, grouped=True)
+    assert type(grouped) is list
+    assert len(grouped) == len(lines)
+    assert len(grouped[-1]) == 0
+
+    for line, para in zip(lines, grouped):
+        assert [sent.singleLineString() for sent in para] == [sent.singleLineString() for sent in tagger(line)]
+        for sent in para:
+            compare_sentence(sent)
+
+    flattened = tagger.tagBatch(lines)
+    assert len(flattened) == sum(len(para) for para in grouped)
+    assert tagger(*lines) == flattened
+
+    singles = tagger.tagSentenceBatch(lines[:-1])
+    assert len(singles) == len(lines) - 1
+    for sent in singles:
+        compare_sentence(sent)
+
+    assert tagger.tagBatch([]) == []
+    assert tagger.tagBatch(["a\x1cb"], grouped=True)[0] == tagger("a\x1cb")
+
+    with pytest.raises(TypeError):
+        tagger.tagBatch([1])
+
+
+def test_iterators(environ):
+    splitter, tagger, parser, entityRecog, roleLabeler = environ
+
+    lines = [line for _, line in EXAMPLES]
+    stream = tagger.iterTag(iter(lines), batch_size=3)
+    assert not isinstance(stream, list)
+    assert [s.singleLineString() for s in stream] == [s.singleLineString() for s in tagger.tagBatch(lines)]
+    assert list(tagger.iterTag(lines, batch_size=5, grouped=True)) == tagger.tagBatch(lines, grouped=True)
+
+    assert list(splitter.iterSentences(iter(lines))) == splitter(*lines)
+
+    mixed = lines[:4] + tagger(lines[4]) + lines[5:7]
+    assert [s.singleLineString() for s in parser.iterAnalyze(iter(mixed), batch_size=3)] == \
+           [s.singleLineString() for s in parser(*mixed)]
+    assert [len(group) for group in parser.iterAnalyze(lines[:6], batch_size=4, grouped=True)] == \
+           [len(parser(line)) for line in lines[:6]]
+
+    with pytest.raises(ValueError):
+        next(tagger.iterTag(lines, batch_size=0))
+
+
+def test_columnar(environ):
+    splitter, tagger, parser, entityRecog, roleLabeler = environ
+
+    lines = [line for _, line in EXAMPLES]
+    grouped = tagger.tagBatch(lines, grouped=True)
+    batch = tagger.tagColumnar(lines)
+
+    assert batch.getDocumentCount() == len(lines)
+    assert len(batch) == sum(len(group) for group in grouped)
+    assert [[s.singleLineString() for s in batch.getDocument(i)] for i in range(len(lines))] == \
+           [[s.singleLineString() for s in group] for group in grouped]
+    assert batch == TaggedBatch.fromSentences(grouped, grouped=True)
+    assert batch.getSurface(0) == grouped[0][0][0][0].surface
+    assert batch.tags[0] == POS.valueOf(grouped[0][0][0][0].tag).ordinal
+    assert all(head == -2 for head in batch.heads)
+
+    parsed = parser(lines[0])
+    batch = parser.analyzeColumnar([lines[0]])
+    for sentence, view in zip(parsed, batch):
+        assert view.singleLineString() == sentence.singleLineString()
+        assert sorted((e.governor.id if e.governor is not None else -1, e.dependent.id, e.type, e.depType)
+                      for e in view.dependencies) == \
+               sorted((e.governor.id if e.governor is not None else -1, e.dependent.id, e.type, e.depType)
+                      for e in sentence.dependencies)
+
+    assert parser.analyzeColumnar(parsed[:1] + [lines[1]]).getDocumentCount() == 2
+    assert len(tagger.tagColumnar([])) == 0
+
+
+def test_pipeline(environ):
+    splitter, tagger, parser, entityRecog, roleLabeler = environ
+
+    lines = [line for _, line in EXAMPLES[:5]]
+    pipeline = Pipeline(tagger, parser)
+    grouped = pipeline.analyzeBatch(lines, grouped=True)
+
+    assert len(grouped) == len(lines)
+    for line, group in zip(lines, grouped):
+        expected = parser.analyze(tagger.tag(line))
+        assert [s.singleLineString() for s in group] == [s.singleLineString() for s in expected]
+        assert [len(s.getDependencies()) for s in group] == [len(s.getDependencies()) for s in expected]
+        assert all(s.getSyntaxTree() is not None for s in group)
+
+    assert pipeline(*lines) == [sentence for group in grouped for sentence in group]
+    assert list(pipeline.iterAnalyze(lines, batch_size=2, grouped=True)) == grouped
+    assert pipeline.analyzeBatch([]) == []
+
+    timings = pipeline.getTimings()
+    assert list(timings.keys()) == ['Tagger', 'Parser', 'convert']
+    assert all(seconds > 0 for seconds in timings.values())
+    pipeline.resetTimings()
+    assert all(seconds == 0 for seconds in pipeline.getTimings().values())
+
+    split = Pipeline(tagger, parser, parser, splitter=splitter, detached=True)
+    assert list(split.getTimings().keys()) == ['SentenceSplitter', 'Tagger', 'Parser', 'Parser#2', 'convert']
+    assert [s.surfaceString() for s in split(lines[0])] == splitter(lines[0])
+
+    with pytest.raises(TypeError):
+        Pipeline(parser, tagger)
+
+
+def test_cache(environ):
+    splitter, tagger, parser, entityRecog, roleLabeler = environ
+
+    lines = [line for _, line in EXAMPLES[:5]]
+    cache = AnalysisCache()
+    cached_tagger = Tagger(API.OKT, cache=cache)
+    cached_parser = Parser(API.HNN, cache=cache)
+
+    expected = tagger.tagBatch(lines, grouped=True)
+    assert cached_tagger.tagBatch(lines, grouped=True) == expected
+    assert cached_tagger.tagBatch(lines, grouped=True) == expected
+    assert cached_tagger.tag(*[' %s ' % line for line in lines]) == tagger.tag(*lines)
+    assert cache.getStats()['hits'] == 2 * len(lines)
+
+    parsed = parser(lines[0])
+    assert cached_parser(lines[0]) == parsed
+    cached = cached_parser(lines[0])
+    assert [s.singleLineString() for s in cached] == [s.singleLineString() for s in parsed]
+    assert [len(s.getDependencies()) for s in cached] == [len(s.getDependencies()) for s in parsed]
+    assert cache.getStats()['misses'] == len(lines) + 1
+
+
 def test_Parser_Syntax_Dep_typecheck(environ):
     splitter, tagger, parser, entityRecog, roleLabeler = environ
 
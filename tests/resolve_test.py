@@ -0,0 +1,141 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from koalanlp import Util
+from koalanlp.jip.cache import CacheManager, PomNotFoundCache
+from koalanlp.jip.index import IndexManager
+from koalanlp.jip.maven import Artifact
+from koalanlp.jip.repository import RepositoryManager, MavenHttpRemoteRepos
+from tests.bundle_test import publish
+
+
+class RepositoryHandler(BaseHTTPRequestHandler):
+    # /good/ 아래는 Maven 저장소의 파일을, /empty/ 아래는 release가 설정된 다음에 404를 돌려주는 서버
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+
+        prefix, _, name = self.path[1:].partition('/')
+        with server.serving():
+            if prefix == 'good':
+                time.sleep(0.05)
+            else:
+                server.release.wait(10)
+                with server.lock:
+                    server.empty_answers += 1
+
+        path = Path(server.root, name)
+        if prefix != 'good' or not path.is_file():
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = path.read_bytes()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, stub_server):
+    root = str(Path(str(tmp_path), 'm2'))
+    publish(root, 'kr.bydelta', 'koalanlp-core', '2.1.4', ('org.example', 'common', '1.0'))
+    publish(root, 'kr.bydelta', 'koalanlp-kmr', '2.1.4', ('kr.bydelta', 'koalanlp-core', '2.1.4'))
+    publish(root, 'org.example', 'common', '1.0')
+    publish(root, 'net.sf.py4j', 'py4j', '0.10.8.1')
+
+    release = threading.Event()
+    release.set()
+    return stub_server(RepositoryHandler, root=root, requests=[], release=release, empty_answers=0)
+
+
+def make_manager(server, cache=None):
+    manager = RepositoryManager()
+    manager.repos = [MavenHttpRemoteRepos('empty', server.url('/empty/')),
+                     MavenHttpRemoteRepos('good', server.url('/good/'))]
+    if cache is not None:
+        manager.set_not_found_cache(cache)
+    return manager
+
+
+def test_first_hit_wins(server):
+    manager = make_manager(server)
+
+    # /empty/ 저장소는 답하지 않은 채로 두어도, 먼저 찾은 저장소의 결과를 돌려받습니다.
+    server.release.clear()
+    try:
+        pom, repos = manager.find_pom(Artifact('kr.bydelta', 'koalanlp-kmr', '2.1.4'))
+        assert repos.name == 'good'
+        assert '<artifactId>koalanlp-kmr</artifactId>' in pom
+        assert server.empty_answers == 0
+    finally:
+        server.release.set()
+
+
+def test_not_found_persists(server, tmp_path):
+    path = str(Path(str(tmp_path), 'pom_not_found.json'))
+    missing = Artifact('org.example', 'missing', '1.0')
+
+    cache = PomNotFoundCache(path)
+    assert make_manager(server, cache).find_pom(missing) is None
+    cache.save()
+    count = len(server.requests)
+    assert count == 2
+
+    # 다음 실행에서는 없다고 기록된 POM을 다시 요청하지 않습니다.
+    assert make_manager(server, PomNotFoundCache(path)).find_pom(missing) is None
+    assert len(server.requests) == count
+
+    # 네트워크 오류는 기록하지 않습니다.
+    cache = PomNotFoundCache(str(Path(str(tmp_path), 'other.json')))
+    manager = RepositoryManager()
+    manager.repos = [MavenHttpRemoteRepos('closed', 'http://127.0.0.1:1/'),
+                     MavenHttpRemoteRepos('good', server.url('/good/'))]
+    manager.set_not_found_cache(cache)
+    assert manager.find_pom(missing) is None
+    assert list(cache.entries.keys()) == ['%s %s' % (server.url('/good/'), missing.id)]
+
+
+def test_breadth_first_resolution(server, tmp_path, monkeypatch):
+    lib_path = str(Path(str(tmp_path), 'lib'))
+    monkeypatch.setattr(Util, 'repos_manager', make_manager(server))
+    monkeypatch.setattr(Util, 'cache_manager', CacheManager(lib_path))
+    monkeypatch.setattr(Util, 'index_manager', IndexManager(lib_path))
+
+    roots = [Artifact('kr.bydelta', 'koalanlp-kmr', '2.1.4'), Artifact('net.sf.py4j', 'py4j', '0.10.8.1')]
+    resolved = [artifact.id for artifact in Util._resolve_artifacts_modified(roots)]
+
+    # 한 단계의 의존성을 모두 찾은 다음에 그 다음 단계로 넘어갑니다.
+    assert resolved == ['kr.bydelta:koalanlp-kmr:2.1.4', 'net.sf.py4j:py4j:0.10.8.1',
+                        'kr.bydelta:koalanlp-core:2.1.4', 'org.example:common:1.0']
+
+    def first_request(artifact):
+        return min(i for i, path in enumerate(server.requests) if path.endswith('/%s.pom' % artifact))
+
+    assert max(first_request('koalanlp-kmr-2.1.4'), first_request('py4j-0.10.8.1')) < \
+        first_request('koalanlp-core-2.1.4') < first_request('common-1.0')
+    # 같은 단계에 있는 koalanlp-kmr와 py4j의 POM을, 두 저장소에 동시에 요청합니다.
+    assert server.max_active > 1
+
+
+def test_concurrent_cache_write(tmp_path):
+    artifact = Artifact('org.example', 'common', '1.0')
+
+    # 같은 부모 POM을 가진 artifact들을 동시에 해석하면, 같은 디렉터리를 동시에 만들게 됩니다.
+    for trial in range(20):
+        lib_path = str(Path(str(tmp_path), str(trial)))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            caches = list(executor.map(lambda _: CacheManager(lib_path), range(8)))
+            list(executor.map(lambda cache: cache.put_artifact_pom(artifact, '<project/>'), caches))
+
+        assert caches[0].get_artifact_pom(artifact) == '<project/>'
@@ -0,0 +1,125 @@
+import os
+import pickle
+
+import pytest
+
+from koalanlp.data import *
+from koalanlp.serialize import *
+
+
+def make_sentence():
+    sentence = Sentence([
+        Word("나는", [Morpheme("나", "NP", "NP"), Morpheme("는", "JX", "JX")]),
+        Word("밥을", [Morpheme("밥", "NNG", "NNG"), Morpheme("을", "JKO", "JKO")]),
+        Word("먹었다.", [Morpheme("먹", "VV", "VV"), Morpheme("었", "EP", "EP"), Morpheme("다", "EF", "EF"),
+                      Morpheme(".", "SF", "SF")])
+    ])
+    sentence[1][0].wordSense = 1
+
+    sentence.syntaxTree = SyntaxTree("S", children=[
+        SyntaxTree("NP", terminal=sentence[0], originalLabel="NP_SBJ"),
+        SyntaxTree("VP", children=[
+            SyntaxTree("NP", terminal=sentence[1]),
+            SyntaxTree("VP", terminal=sentence[2])
+        ])
+    ])
+    sentence.dependencies = [
+        DepEdge(governor=sentence[2], dependent=sentence[0], type="NP", depType="SBJ", originalLabel="NP_SBJ"),
+        DepEdge(governor=sentence[2], dependent=sentence[1], type="NP", depType="OBJ"),
+        DepEdge(dependent=sentence[2], type="VP")
+    ]
+    sentence.roles = [
+        RoleEdge(predicate=sentence[2], argument=sentence[0], label="ARG0", modifiers=[sentence[1]]),
+        RoleEdge(predicate=sentence[2], argument=sentence[1], label="ARG1", originalLabel="A1")
+    ]
+    sentence.entities = [
+        Entity(surface="나", label="PS", fineLabel="PS_NAME", morphemes=[sentence[0][0]]),
+        Entity(surface="밥", label="AF", fineLabel="AF_OTHER", morphemes=[sentence[1][0]], originalLabel="AF")
+    ]
+    sentence.corefGroups = [CoreferenceGroup([sentence.entities[0]])]
+    return sentence
+
+
+def assert_same(loaded, original):
+    assert loaded == original
+    assert loaded.singleLineString() == original.singleLineString()
+    assert [m.getWordSense() for w in loaded for m in w] == [m.getWordSense() for w in original for m in w]
+    assert loaded.getSyntaxTree().getTreeString() == original.getSyntaxTree().getTreeString()
+    assert loaded.getSyntaxTree()[0].getOriginalLabel() == "NP_SBJ"
+    assert loaded[0].getPhrase().getTerminal() is loaded[0]
+
+    assert loaded.getDependencies() == original.getDependencies()
+    assert loaded[0].getGovernorEdge().getGovernor() is loaded[2]
+    assert loaded.getDependencies()[2].getGovernor() is None
+
+    assert loaded.getRoles() == original.getRoles()
+    assert loaded.getRoles()[0].getModifiers() == [loaded[1]]
+    assert loaded.getRoles()[1].getOriginalLabel() == "A1"
+
+    assert loaded.getEntities() == original.getEntities()
+    assert loaded[0][0].getEntities() == [loaded.getEntities()[0]]
+    assert loaded.getCorefGroups()[0][0] is loaded.getEntities()[0]
+    assert loaded.getEntities()[0].getCorefGroup() is loaded.getCorefGroups()[0]
+    assert loaded.reference is None
+
+
+def test_dumps_loads():
+    original = [make_sentence(), Sentence([Word("a\x1fb", [Morpheme("a\x1fb", "SL")])])]
+    loaded = loads(dumps(original))
+
+    assert len(loaded) == 2
+    assert_same(loaded[0], original[0])
+    assert loaded[0][1][0].getWordSense() == 1 and loaded[0][0][0].getWordSense() is None
+    assert loaded[1] == original[1]
+    assert loaded[1].getSyntaxTree() is None and loaded[1].getDependencies() == []
+
+    assert loads(dumps([])) == []
+    assert len(dumps(original)) < len(pickle.dumps(original))
+
+
+def test_file(tmpdir):
+    path = os.path.join(str(tmpdir), 'sentences.bin')
+    original = [make_sentence() for _ in range(10)]
+
+    with SentenceWriter(path) as writer:
+        writer.write(original[0])
+        writer.writeAll(original[1:])
+
+    with SentenceFile(path) as reader:
+        assert len(reader) == 10
+        assert_same(reader[3], original[3])
+        assert_same(reader[-1], original[-1])
+        assert len(reader[2:5]) == 3
+        assert [s.singleLineString() for s in reader] == [s.singleLineString() for s in original]
+
+    assert [s.singleLineString() for s in load(path)] == [s.singleLineString() for s in original]
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        loads(b'not a sentence file')
+
+    data = dumps([make_sentence()])
+    with pytest.raises(ValueError):
+        loads(data[:-4])
+
+
+def test_version1_word_sense():
+    import struct
+    from array import array
+
+    # 버전 1 파일은 의미 어깨번호를 문자열('3')의 번호로 기록했습니다.
+    none = 0xFFFFFFFF
+    data = b'aSL3'
+    ints = array('I', [3, 1, 2, 1,  # 문자열 3개와 각 길이
+                       1, 0, 1,  # 어절 1개: 'a', 형태소 1개
+                       0, 1, none, 2,  # 형태소: 'a', 'SL', 원본 품사 없음, 어깨번호 '3'
+                       0, 0, 0, 0, 0])
+    record = struct.pack('<II', len(ints), len(data)) + struct.pack('<%dI' % len(ints), *ints) + data
+    header = struct.pack('<8sHH', b'KOALANLP', 1, 0)
+    blob = header + record + struct.pack('<Q', len(header)) + \
+        struct.pack('<QQ8s', len(header) + len(record), 1, b'KOALANLP')
+
+    sentence = loads(blob)[0]
+    assert sentence.singleLineString() == 'a/SL'
+    assert sentence[0][0].getWordSense() == 3
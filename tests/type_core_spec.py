@@ -169,3 +169,43 @@ def test_CET_ExtUtil(jvm):
 
     for code in codes:
         assert CoarseEntityType.valueOf(code) == getattr(CoarseEntityType, code)
+
+
+def test_Enum_bulk_conversion(jvm):
+    for cls in [POS, PhraseTag, DependencyTag, RoleType, CoarseEntityType]:
+        for value in cls.values():
+            assert value.name == value.reference.name()
+            assert value.ordinal == value.reference.ordinal()
+            assert value.classType == value.reference.getClass().getName()
+
+
+def test_py_collections(jvm):
+    from koalanlp.jvm import py_list, py_dict, java_list, class_of
+
+    items = ['가', 'a\nb', '', None, 'x\\y']
+    assert py_list(java_list(items), lambda x: x) == items
+    assert py_list(java_list([]), lambda x: x) == []
+
+    array = class_of('java.util.Arrays').copyOf(java_list([1, 2, 3]).toArray(), 3)
+    assert py_list(array, lambda x: x) == [1, 2, 3]
+
+    mapping = class_of('java.util.HashMap')()
+    mapping.put('a', 1)
+    mapping.put('b', POS.NNG.reference)
+    converted = py_dict(mapping)
+    assert converted['a'] == 1
+    assert converted['b'].equals(POS.NNG.reference)
+
+
+def test_POS_predicates_match_java(jvm):
+    # 품사 분류 판단은 초기화할 때 한 번에 가져온 표로 Python에서 답합니다. Java의 답과 같은지 확인합니다.
+    categories = ['isNoun', 'isPredicate', 'isModifier', 'isPostPosition', 'isEnding', 'isAffix', 'isSuffix',
+                  'isSymbol', 'isUnknown']
+    prefixes = {tag.name[:i] for tag in POS.values() for i in range(1, len(tag.name) + 1)} | {'n', 'Z', 'XSNN'}
+
+    for tag in POS.values():
+        for category in categories:
+            assert getattr(tag, category)() == getattr(tag.reference, category)()
+
+        for prefix in prefixes:
+            assert tag.startsWith(prefix) == tag.reference.startsWith(prefix)